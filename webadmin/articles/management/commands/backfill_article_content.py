@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    help = "Recompute the excerpt, word count, sanitized HTML and search text of existing articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help="Rows read and written per transaction")
+        parser.add_argument('--missing-only', action='store_true', help="Only process articles that have no excerpt yet")
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        queryset = Article.objects.order_by('pk').only('pk', 'content')  # type: ignore
+        if options['missing_only']:
+            queryset = queryset.filter(excerpt='')
+
+        # Walk the table by primary key instead of OFFSET so every chunk is a
+        # short index range scan, and commit per chunk so no lock is held for
+        # longer than one batch.
+        last_pk = 0
+        total = 0
+        while True:
+            chunk = list(queryset.filter(pk__gt=last_pk)[:chunk_size])
+            if not chunk:
+                break
+            for article in chunk:
+                article.refresh_derived_content()
+            with transaction.atomic():
+                Article.objects.bulk_update(chunk, Article.DERIVED_CONTENT_FIELDS)  # type: ignore
+            last_pk = chunk[-1].pk
+            total += len(chunk)
+            self.stdout.write(f"Processed {total} articles (up to id {last_pk})")
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {total} articles"))
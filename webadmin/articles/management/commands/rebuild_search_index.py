@@ -0,0 +1,18 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from mysite.search import SEARCH_INDEXES, create_search_index, drop_search_index
+
+
+class Command(BaseCommand):
+    help = "Drop and recreate the full-text search indexes of articles and programs"
+
+    def handle(self, *args, **options):
+        with connection.schema_editor() as schema_editor:
+            for index in SEARCH_INDEXES:
+                table = apps.get_model(index.model)._meta.db_table
+                drop_search_index(schema_editor, index.name, table)
+                create_search_index(schema_editor, index.name, table, index.columns)
+                self.stdout.write(f"Rebuilt {index.name} on {table}")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(SEARCH_INDEXES)} search indexes"))
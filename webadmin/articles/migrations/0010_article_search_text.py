@@ -0,0 +1,44 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:10
+
+from django.db import migrations, models
+
+from articles.utils import html_to_text
+from mysite.search import create_search_index, drop_search_index
+
+
+def fill_search_text(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    last_pk = 0
+    while True:
+        chunk = list(Article.objects.filter(pk__gt=last_pk).order_by('pk').only('pk', 'content')[:500])
+        if not chunk:
+            return
+        for article in chunk:
+            article.search_text = html_to_text(article.content)
+        Article.objects.bulk_update(chunk, ['search_text'])
+        last_pk = chunk[-1].pk
+
+
+def create_index(apps, schema_editor):
+    create_search_index(schema_editor, 'article_search', 'articles_article', ['title', 'search_text'])
+
+
+def drop_index(apps, schema_editor):
+    drop_search_index(schema_editor, 'article_search', 'articles_article')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0009_article_article_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Plain text of the content, for the full-text index'),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_index, drop_index),
+    ]
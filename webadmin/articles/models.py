@@ -4,6 +4,7 @@ from django.contrib.auth.models import User
 from django.utils.text import slugify
 from django.urls import reverse
 from ckeditor.fields import RichTextField
+from .utils import count_words, html_to_text, make_excerpt, reading_time, sanitize_html
 
 class Article(models.Model):
     title = models.CharField(max_length=200)
@@ -12,21 +13,105 @@ class Article(models.Model):
     author_name = models.CharField(max_length=100, blank=True, null=True)
     date = models.CharField(max_length=100, blank=True, null=True)  # User-selected date (e.g., 'May 20, 2025')
     image_url = models.URLField(max_length=500, blank=True, null=True, help_text="ImgBB image URL")
+    # Resized copies of image_url, filled in by the images app.
+    image_variants = models.JSONField(blank=True, null=True, editable=False)
     url = models.URLField(max_length=500, blank=True, null=True, help_text="URL for the article detail page")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published = models.BooleanField(default=False)
     slug = models.SlugField(max_length=200, unique=True, blank=True)
-    
+    # Derived from ``content`` on save so read paths never process HTML.
+    excerpt = models.CharField(max_length=255, blank=True, default='', editable=False, help_text="Plain-text excerpt of the content")
+    word_count = models.PositiveIntegerField(default=0, editable=False)  # type: ignore
+    content_html = models.TextField(blank=True, default='', editable=False, help_text="Sanitized render of the content")
+    search_text = models.TextField(blank=True, default='', editable=False, help_text="Plain text of the content, for the full-text index")
+
+    DERIVED_CONTENT_FIELDS = ('excerpt', 'word_count', 'content_html', 'search_text')
+    # Large columns list pages never show.
+    LIST_DEFERRED_FIELDS = ('content', 'content_html', 'search_text')
+
+    def refresh_derived_content(self):
+        self.excerpt = make_excerpt(self.content)
+        self.word_count = count_words(self.content)
+        self.content_html = sanitize_html(self.content)
+        self.search_text = html_to_text(self.content)
+
+    @property
+    def reading_time(self):
+        return reading_time(self.word_count)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        article = super().from_db(db, field_names, values)
+        # Whether the stored row is published, so receivers can tell a save
+        # that unpublishes an article from an edit of a draft.
+        article.was_published = article.__dict__.get('published', False)
+        return article
+
+    @classmethod
+    def assign_unique_slugs(cls, articles):
+        """
+        Give every article without a slug one derived from its title, adding
+        a ``-2``, ``-3``... suffix where the title slug is taken. Existing
+        slugs for the whole batch are read in one query.
+        """
+        pending = [article for article in articles if not article.slug]
+        if not pending:
+            return
+        max_length = cls._meta.get_field('slug').max_length
+        bases = [slugify(article.title)[:max_length] or 'article' for article in pending]
+
+        prefixes = models.Q()
+        for base in set(bases):
+            prefixes |= models.Q(slug__startswith=base)
+        existing = cls.objects.filter(prefixes)
+        own_pks = [article.pk for article in pending if article.pk]
+        if own_pks:
+            existing = existing.exclude(pk__in=own_pks)
+        taken = set(existing.values_list('slug', flat=True))
+        taken.update(article.slug for article in articles if article.slug)
+
+        for article, base in zip(pending, bases):
+            slug = base
+            suffix = 1
+            while slug in taken:
+                suffix += 1
+                tail = f'-{suffix}'
+                slug = base[:max_length - len(tail)] + tail
+            article.slug = slug
+            taken.add(slug)
+
+    @classmethod
+    def prepare_bulk_create(cls, articles):
+        """Fill in what save() would derive, for use before bulk_create()."""
+        cls.assign_unique_slugs(articles)
+        for article in articles:
+            article.url = article.build_url()
+            article.refresh_derived_content()
+
+    def build_url(self):
+        return f"/articles/{self.slug}/"
+
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
+        # Everything derived is filled in before the single INSERT/UPDATE.
         if not self.slug:
-            self.slug = slugify(self.title)
+            self.assign_unique_slugs([self])
+            if update_fields is not None:
+                update_fields.add('slug')
+        self.url = self.build_url()
+        if update_fields is None or 'content' in update_fields:
+            self.refresh_derived_content()
+        if update_fields is not None:
+            if 'slug' in update_fields:
+                update_fields.add('url')
+            if 'content' in update_fields:
+                update_fields.update(self.DERIVED_CONTENT_FIELDS)
+            kwargs['update_fields'] = update_fields
         super().save(*args, **kwargs)
-        # Set the URL after saving (assuming detail URL is /articles/<slug>/)
-        expected_url = f"/articles/{self.slug}/"
-        if self.url != expected_url:
-            self.url = expected_url
-            super().save(update_fields=["url"])
     
     def __str__(self):
         return self.title
@@ -38,3 +123,11 @@ class Article(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # ArticleViewSet list and its keyset cursor.
+            models.Index(fields=['-created_at', '-id'], name='article_created_idx'),
+            # PublicArticleViewSet: published=True ORDER BY created_at DESC.
+            models.Index(fields=['published', '-created_at', '-id'], name='article_pub_created_idx'),
+            # /api/changes/ reads rows stamped after a watermark.
+            models.Index(fields=['updated_at', 'id'], name='article_updated_idx'),
+        ]
@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from .models import Article
+from .utils import reading_time
 from django.contrib.auth.models import User
+from django.urls import reverse
+from images.serializers import ImageVariantsField
+from mysite.rows import RowReader
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -10,12 +14,47 @@ class UserSerializer(serializers.ModelSerializer):
 class ArticleSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     url = serializers.SerializerMethodField()
+    reading_time = serializers.IntegerField(read_only=True)
+    image_variants = ImageVariantsField('image_url', 'image_variants')
     
     class Meta:
         model = Article
-        fields = ['id', 'title', 'content', 'author', 'author_name','date', 'image_url', 'created_at', 'updated_at', 'published', 'slug', 'url']
-        read_only_fields = ['created_at', 'updated_at', 'author', 'slug', 'url'] 
+        fields = ['id', 'title', 'content', 'content_html', 'excerpt', 'word_count', 'reading_time', 'author', 'author_name','date', 'image_url', 'image_variants', 'created_at', 'updated_at', 'published', 'slug', 'url']
+        read_only_fields = ['created_at', 'updated_at', 'author', 'slug', 'url', 'content_html', 'excerpt', 'word_count'] 
 
     def get_url(self, obj):
         request = self.context.get('request')
-        return request.build_absolute_uri(obj.get_absolute_url()) if request else obj.get_absolute_url() 
\ No newline at end of file
+        return request.build_absolute_uri(obj.get_absolute_url()) if request else obj.get_absolute_url()
+
+class ArticleCardSerializer(serializers.ModelSerializer):
+    """
+    Lightweight article representation for list pages. The rich-text
+    ``content`` is left out in favour of the excerpt precomputed on save.
+    """
+    url = serializers.SerializerMethodField()
+    reading_time = serializers.IntegerField(read_only=True)
+    image_variants = ImageVariantsField('image_url', 'image_variants')
+
+    class Meta:
+        model = Article
+        fields = ['id', 'title', 'excerpt', 'word_count', 'reading_time', 'author_name', 'date', 'image_url', 'image_variants', 'created_at', 'updated_at', 'published', 'slug', 'url']
+        read_only_fields = fields
+
+    def get_url(self, obj):
+        request = self.context.get('request')
+        return request.build_absolute_uri(obj.get_absolute_url()) if request else obj.get_absolute_url()
+
+
+def card_url_row(context):
+    """``get_url`` for values() rows: one reverse() per page instead of one per card."""
+    prefix, _, suffix = reverse('article-detail', kwargs={'slug': 'slug'}).rpartition('slug')
+    request = context.get('request')
+    if request:
+        prefix = request.build_absolute_uri(prefix)
+    return lambda slug: f'{prefix}{slug}{suffix}'
+
+
+ARTICLE_CARD_ROWS = RowReader(ArticleCardSerializer, extra={
+    'reading_time': (['word_count'], lambda context: reading_time),
+    'url': (['slug'], card_url_row),
+})
@@ -1,3 +1,309 @@
-from django.test import TestCase
+import gzip
+import time
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.renderers import JSONRenderer
+
+from mysite import compression
+from mysite.renderers import FastJSONRenderer
+from mysite.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin, RowParityAssertionsMixin, list_queryset
+from users.authentication import issue_tokens
+from .models import Article
+from .serializers import ArticleCardSerializer
+from .views import ArticleViewSet, PublicArticleViewSet
+
+
+class ArticleQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_article_list_uses_index(self):
+        self.assertIndexedPlan(list_queryset(ArticleViewSet)[:10])
+
+    def test_public_article_list_uses_index(self):
+        self.assertIndexedPlan(list_queryset(PublicArticleViewSet)[:10])
+
+    def test_public_article_cursor_page_uses_index(self):
+        queryset = list_queryset(PublicArticleViewSet).order_by('-created_at', '-id')
+        self.assertIndexedPlan(queryset.filter(created_at__lt='2025-01-01T00:00:00Z')[:10])
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class ArticleQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(20):
+            author = User.objects.create(username=f'author{index}')
+            Article.objects.create(title=f'Article {index}', content='<p>Body</p>', author=author, published=True)
+
+    def test_article_list_query_count(self):
+        # Conditional GET aggregate, pagination count, page rows.
+        self.assertListQueryCount('/api/articles/', 3)
+
+    def test_public_article_list_query_count(self):
+        self.assertListQueryCount('/api/public-articles/', 3)
+
+
+class ArticlePaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        articles = [Article(title=f'Article {index}', content='<p>Body</p>', published=True) for index in range(105)]
+        Article.prepare_bulk_create(articles)
+        Article.objects.bulk_create(articles)
+        cls.ids = list(Article.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+
+    def page(self, url, query=None):
+        response = self.client.get(url, query)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_cursor_pages_round_trip(self):
+        pages, page = [], self.page('/api/articles/', {'cursor': '', 'page_size': 25})
+        self.assertNotIn('count', page)
+        self.assertIsNone(page['previous'])
+        while True:
+            pages.append([article['id'] for article in page['results']])
+            if not page['next']:
+                break
+            page = self.page(page['next'])
+        self.assertEqual([pk for ids in pages for pk in ids], self.ids)
+
+        # Walking back from the last page yields the same pages.
+        for expected in reversed(pages[:-1]):
+            page = self.page(page['previous'])
+            self.assertEqual([article['id'] for article in page['results']], expected)
+        self.assertIsNone(page['previous'])
+
+    def test_invalid_cursor_is_not_found(self):
+        self.assertEqual(self.client.get('/api/articles/', {'cursor': 'not-a-cursor'}).status_code, 404)
+
+    def test_page_size_is_clamped(self):
+        self.assertEqual(len(self.page('/api/articles/', {'page_size': 1000})['results']), 100)
+        self.assertEqual(len(self.page('/api/articles/', {'cursor': '', 'page_size': 1000})['results']), 100)
+        self.assertEqual(len(self.page('/api/articles/', {'page_size': 3})['results']), 3)
+
+
+class ArticleCacheTests(TestCase):
+    def test_public_detail_follows_author_edits(self):
+        author = User.objects.create(username='coach')
+        article = Article.objects.create(title='Article', content='<p>Body</p>', author=author, published=True)
+        url = f'/api/public-articles/{article.pk}/'
+        self.assertEqual(self.client.get(url).json()['author']['username'], 'coach')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author.username = 'head-coach'
+            author.save()
+        self.assertEqual(self.client.get(url).json()['author']['username'], 'head-coach')
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class ArticleConditionalGetTests(TestCase):
+    def test_list_revalidates_deletions(self):
+        older = Article.objects.create(title='Older', content='x', published=True)
+        newest = Article.objects.create(title='Newest', content='x', published=True)
+        response = self.client.get('/api/public-articles/')
+        self.assertFalse(response.has_header('Last-Modified'))
+        etag = response['ETag']
+
+        # Deleting the newest row lowers Max(updated_at).
+        newest.delete()
+        since = http_date(time.time())
+        response = self.client.get('/api/public-articles/', HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get('/api/public-articles/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([card['id'] for card in response.json()['results']], [older.pk])
+
+    def test_detail_revalidates_author_changes(self):
+        author = User.objects.create_user(username='coach', email='coach@example.org')
+        article = Article.objects.create(title='Report', content='x', published=True, author=author)
+        for url in (f'/api/public-articles/{article.pk}/', f'/api/articles/{article.pk}/', f'/api/{article.slug}/'):
+            with self.subTest(url=url):
+                User.objects.filter(pk=author.pk).update(username='coach')
+                response = self.client.get(url)
+                self.assertFalse(response.has_header('Last-Modified'))
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+                User.objects.filter(pk=author.pk).update(username='head-coach')
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()['author']['username'], 'head-coach')
+
+    def test_malformed_pk_is_not_found(self):
+        for url in ('/api/articles/abc/', '/api/public-articles/abc/'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 404)
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class AsyncArticleDetailTests(TestCase):
+    def test_drafts_are_not_found(self):
+        published = Article.objects.create(title='Live', content='<p>Live</p>', published=True)
+        draft = Article.objects.create(title='Draft', content='<p>Draft</p>')
+        response = self.client.get(f'/api/async/articles/{published.slug}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['content_html'], '<p>Live</p>')
+        self.assertEqual(self.client.get(f'/api/async/articles/{draft.slug}/').status_code, 404)
+
+
+class ArticleSaveTests(TestCase):
+    def test_create_is_a_single_write(self):
+        # One slug lookup plus the INSERT; the URL goes into the same row.
+        with self.assertNumQueries(2):
+            article = Article.objects.create(title='Hello World', content='<p>Body</p>')
+        self.assertEqual(article.url, '/articles/hello-world/')
+
+    def test_duplicate_titles_get_unique_slugs(self):
+        slugs = [Article.objects.create(title='Same Title', content='x').slug for _ in range(3)]
+        self.assertEqual(slugs, ['same-title', 'same-title-2', 'same-title-3'])
+
+    def test_content_after_an_unclosed_embed_is_kept(self):
+        for embed in ('<embed src=x>', '<embed src=x/>', '<embed src=x></embed>'):
+            with self.subTest(embed=embed):
+                article = Article.objects.create(title='Embed', content=f'<p>a</p>{embed}<p>visible text</p><script>x</script>')
+                self.assertEqual(article.content_html, '<p>a</p><p>visible text</p>')
+
+    def test_batch_slugs_are_unique(self):
+        Article.objects.create(title='Batch', content='x')
+        articles = [Article(title='Batch', content='x') for _ in range(2)]
+        Article.assign_unique_slugs(articles)
+        self.assertEqual([article.slug for article in articles], ['batch-2', 'batch-3'])
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class ArticleSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Article.objects.create(title='Clean water', content='<p>Water for the village, water for the school.</p>', published=True)
+        Article.objects.create(title='New school', content='<p>Classrooms <em>near</em> the river water.</p>', published=True)
+        Article.objects.create(title='Water draft', content='<p>Unpublished.</p>')
+
+    def search(self, query):
+        response = self.client.get('/api/search/', {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [article['title'] for article in response.json()['results']]
+
+    def test_results_are_ranked_and_published_only(self):
+        self.assertEqual(self.search('water'), ['Clean water', 'New school'])
+
+    def test_matches_plain_text_not_markup(self):
+        self.assertEqual(self.search('em'), [])
+        self.assertEqual(self.search('classrooms'), ['New school'])
+
+    def test_operators_in_the_query_are_ignored(self):
+        self.assertEqual(self.search('"river* OR ('), ['New school'])
+
+    def test_index_follows_updates_and_deletes(self):
+        article = Article.objects.get(title='New school')
+        article.content = '<p>Library books.</p>'
+        article.save()
+        self.assertEqual(self.search('classrooms'), [])
+        self.assertEqual(self.search('library'), ['New school'])
+        article.delete()
+        self.assertEqual(self.search('library'), [])
+
+
+@override_settings(API_CACHE_ENABLED=False)
+class ArticleResponseEncodingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        body = '<p>Long enough to be worth compressing. Café, 東京, line separator.</p>' * 20
+        for index in range(5):
+            Article.objects.create(title=f'Article {index}\u2028', content=body, published=True)
+
+    def test_fast_renderer_matches_drf_renderer(self):
+        response = self.client.get('/api/public-articles/')
+        data = [response.data, {'when': timezone.now(), 'price': Decimal('1.50'), 1: 'int key', 'big': 2 ** 70}]
+        for value in data:
+            with self.subTest(value=type(value)):
+                self.assertEqual(FastJSONRenderer().render(value), JSONRenderer().render(value))
+        with override_settings(API_JSON_ENCODER='stdlib'):
+            self.assertEqual(FastJSONRenderer().render(data[0]), JSONRenderer().render(data[0]))
+
+    def test_large_responses_are_compressed(self):
+        plain = self.client.get('/api/articles/')
+        self.assertFalse(plain.has_header('Content-Encoding'))
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+        compressed = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip, deflate')
+        self.assertEqual(compressed['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertLess(len(compressed.content), len(plain.content) // 4)
+        self.assertTrue(compressed['ETag'].startswith('W/"'))
+        # The weakened ETag still revalidates.
+        revalidated = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+
+        refused = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertFalse(refused.has_header('Content-Encoding'))
+
+    def test_wildcard_does_not_override_a_refusal(self):
+        self.assertEqual(compression.choose_encoding('br;q=0, *'), 'gzip')
+        self.assertIsNone(compression.choose_encoding('br;q=0, gzip;q=0, *'))
+        self.assertEqual(compression.choose_encoding('gzip;q=0, br'), 'br' if compression.brotli else None)
+        self.assertEqual(compression.choose_encoding('*;q=0, gzip'), 'gzip')
+
+    def test_responses_with_secrets_are_not_compressed(self):
+        user = User.objects.create_user(username='editor', password='long enough password 1')
+        token = issue_tokens(user).access_token
+        response = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip', HTTP_AUTHORIZATION=f'Bearer {token}')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+        self.client.force_login(user)
+        response = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.client.logout()
+
+        with override_settings(COMPRESSION_MIN_BYTES=1):
+            response = self.client.post(
+                '/api/auth/login/', {'username': 'editor', 'password': 'long enough password 1'},
+                content_type='application/json', HTTP_ACCEPT_ENCODING='gzip',
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_small_responses_are_not_compressed(self):
+        response = self.client.get('/api/header-settings/active/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    def test_brotli_preferred_when_available(self):
+        if compression.brotli is None:
+            self.skipTest("brotli is not installed")
+        response = self.client.get('/api/articles/', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(compression.brotli.decompress(response.content), self.client.get('/api/articles/').content)
+
+
+class ArticleRowParityTests(RowParityAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        variant = {'width': 320, 'height': 180, 'webp': 'images/ab/abc/thumbnail.webp', 'jpeg': 'images/ab/abc/thumbnail.jpg'}
+        for index in range(7):
+            article = Article.objects.create(
+                title=f'Café report {index} \u2028', content='<p>word </p>' * (index * 150), published=True,
+                author_name='Coach' if index % 2 else None, date=None if index % 3 else 'May 20, 2025',
+                image_url=f'https://i.ibb.co/{index}/photo.png' if index % 2 else '',
+            )
+            if index % 2:
+                # Alternately current and stale copies.
+                source = article.image_url if index % 4 == 1 else 'https://i.ibb.co/old/photo.png'
+                Article.objects.filter(pk=article.pk).update(image_variants={'source': source, 'thumbnail': variant})
+        Article.objects.create(title='Draft', content='<p>Draft</p>')
+
+    def test_public_list_matches_serializer(self):
+        response = self.assertRowParity('/api/public-articles/')
+        self.assertEqual(response.data['count'], 7)
+        self.assertRowParity('/api/public-articles/', {'page': 2, 'page_size': 3})
+
+    def test_cursor_pages_match_serializer(self):
+        response = self.assertRowParity('/api/public-articles/', {'cursor': '', 'page_size': 3})
+        cursor = response.data['next'].split('cursor=')[1].split('&')[0]
+        self.assertRowParity('/api/public-articles/', {'cursor': cursor, 'page_size': 3})
+
+    def test_list_skips_the_serializer(self):
+        with override_settings(API_CACHE_ENABLED=False), \
+                mock.patch.object(ArticleCardSerializer, 'to_representation') as to_representation:
+            self.assertEqual(self.client.get('/api/public-articles/').status_code, 200)
+        to_representation.assert_not_called()
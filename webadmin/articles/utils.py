@@ -0,0 +1,152 @@
+import html
+import math
+import re
+from html.parser import HTMLParser
+
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 100
+WORDS_PER_MINUTE = 200
+
+_whitespace_re = re.compile(r'\s+')
+_word_re = re.compile(r'\w+(?:[\'’-]\w+)*')
+_non_text_re = re.compile(r'<(script|style|template|noscript)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_block_end_re = re.compile(r'</(p|div|li|h[1-6]|blockquote|pre|tr|td|th|figcaption)\s*>|<br\s*/?>', re.IGNORECASE)
+
+
+def html_to_text(value):
+    """Strip tags and entities from CKEditor HTML and collapse whitespace."""
+    if not value:
+        return ''
+    value = _block_end_re.sub(' ', _non_text_re.sub('', value))
+    text = html.unescape(strip_tags(value))
+    return _whitespace_re.sub(' ', text).strip()
+
+
+def make_excerpt(value, length=EXCERPT_LENGTH):
+    """Plain-text excerpt of an HTML body, truncated to ``length`` characters."""
+    return Truncator(html_to_text(value)).chars(length)
+
+
+def count_words(value):
+    """Number of words in the plain-text render of an HTML body."""
+    return len(_word_re.findall(html_to_text(value)))
+
+
+def reading_time(word_count):
+    """Estimated reading time in whole minutes (at least one for any text)."""
+    if not word_count:
+        return 0
+    return max(1, math.ceil(word_count / WORDS_PER_MINUTE))
+
+
+# Tags and attributes CKEditor produces that are safe to render as-is.
+ALLOWED_TAGS = {
+    'a', 'b', 'blockquote', 'br', 'caption', 'code', 'div', 'em', 'figcaption',
+    'figure', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'img', 'li', 'ol',
+    'p', 'pre', 's', 'span', 'strike', 'strong', 'sub', 'sup', 'table', 'tbody',
+    'td', 'tfoot', 'th', 'thead', 'tr', 'u', 'ul',
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title', 'target', 'rel'},
+    'img': {'src', 'alt', 'title', 'width', 'height'},
+    'td': {'colspan', 'rowspan'},
+    'th': {'colspan', 'rowspan', 'scope'},
+}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto'}
+URL_ATTRIBUTES = {'href', 'src'}
+VOID_TAGS = {'br', 'hr', 'img'}
+# Every HTML void element: none of them ever has an end tag to wait for.
+HTML_VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr',
+}
+# Elements whose whole content is dropped, not just the tags.
+DROP_CONTENT_TAGS = {'script', 'style', 'iframe', 'object', 'embed', 'noscript', 'template'}
+
+
+def _is_safe_url(value):
+    value = _whitespace_re.sub('', html.unescape(value or '')).lower()
+    if ':' not in value.split('/', 1)[0]:
+        return True  # relative URL or fragment
+    return value.split(':', 1)[0] in ALLOWED_URL_SCHEMES
+
+
+class _Sanitizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts = []
+        self.open_tags = []
+        self.dropping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in DROP_CONTENT_TAGS:
+            if tag not in HTML_VOID_TAGS:
+                self.dropping += 1
+            return
+        if self.dropping or tag not in ALLOWED_TAGS:
+            return
+        allowed = ALLOWED_ATTRIBUTES.get(tag, set())
+        rendered = []
+        for name, value in attrs:
+            if name not in allowed or value is None:
+                continue
+            if name in URL_ATTRIBUTES and not _is_safe_url(value):
+                continue
+            rendered.append(f' {name}="{html.escape(html.unescape(value), quote=True)}"')
+        if tag == 'a' and any(name == 'target' for name, _ in attrs):
+            rendered = [attr for attr in rendered if not attr.startswith(' rel=')]
+            rendered.append(' rel="noopener noreferrer"')
+        self.parts.append(f'<{tag}{"".join(rendered)}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS and not self.dropping and tag in ALLOWED_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in DROP_CONTENT_TAGS:
+            if tag not in HTML_VOID_TAGS:
+                self.dropping = max(0, self.dropping - 1)
+            return
+        if self.dropping or tag not in self.open_tags:
+            return
+        # Close anything left open inside this element so the output nests.
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.parts.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self.dropping:
+            self.parts.append(html.escape(data, quote=False))
+
+    def handle_entityref(self, name):
+        if not self.dropping:
+            self.parts.append(f'&{name};')
+
+    def handle_charref(self, name):
+        if not self.dropping:
+            self.parts.append(f'&#{name};')
+
+    def render(self):
+        self.close()
+        while self.open_tags:
+            self.parts.append(f'</{self.open_tags.pop()}>')
+        return ''.join(self.parts)
+
+
+def sanitize_html(value):
+    """
+    Reduce CKEditor HTML to an allow-list of tags and attributes so it can
+    be injected into pages without further processing.
+    """
+    if not value:
+        return ''
+    parser = _Sanitizer()
+    parser.feed(value)
+    return parser.render()
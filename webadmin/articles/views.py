@@ -2,13 +2,22 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from django.contrib.auth.models import User
 from .models import Article
-from .serializers import ArticleSerializer, UserSerializer
+from .serializers import ARTICLE_CARD_ROWS, ArticleSerializer, ArticleCardSerializer, UserSerializer
 from rest_framework import generics
+from mysite.bulk import BulkModelMixin
+from mysite.cache import CachedReadMixin
+from mysite.conditional import ConditionalGetMixin
+from mysite.pagination import KeysetPagination
+from mysite.rows import RowListMixin
 
-class ArticleViewSet(viewsets.ModelViewSet):
-    queryset = Article.objects.all()  # type: ignore
+class ArticleViewSet(BulkModelMixin, ConditionalGetMixin, viewsets.ModelViewSet):
+    queryset = Article.objects.select_related('author')  # type: ignore
     serializer_class = ArticleSerializer
     permission_classes = [AllowAny]  # Temporarily allow all access for testing
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-id')
+    # retrieve() embeds the author (UserSerializer).
+    etag_fields = ('author__username', 'author__email')
     
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -20,12 +29,48 @@ class ArticleViewSet(viewsets.ModelViewSet):
         # The model's save() will set the URL
         return article
 
-class PublicArticleViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = Article.objects.filter(published=True)  # type: ignore
+    def perform_bulk_create(self, instances):
+        Article.prepare_bulk_create(instances)
+        super().perform_bulk_create(instances)
+
+    def perform_bulk_update(self, instances, fields):
+        if 'content' in fields:
+            for article in instances:
+                article.refresh_derived_content()
+            fields = set(fields) | set(Article.DERIVED_CONTENT_FIELDS)
+        super().perform_bulk_update(instances, fields)
+
+class PublicArticleViewSet(ConditionalGetMixin, CachedReadMixin, RowListMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = Article.objects.filter(published=True).select_related('author')  # type: ignore
     serializer_class = ArticleSerializer
     permission_classes = [AllowAny]
+    # Anonymous reads: skip running the JWT/session/basic authenticators.
+    authentication_classes = []
+    pagination_class = KeysetPagination
+    cursor_ordering = ('-created_at', '-id')
+    # retrieve() embeds the author.
+    cache_namespaces = ('articles', 'users')
+    etag_fields = ('author__username', 'author__email')
+    # Cards are built from values() rows, see mysite/rows.py.
+    row_reader = ARTICLE_CARD_ROWS
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # List pages only need a card: never load the rich-text body,
+            # the excerpt is precomputed on save, and cards have no author.
+            queryset = queryset.defer(*Article.LIST_DEFERRED_FIELDS).select_related(None)
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ArticleCardSerializer
+        return super().get_serializer_class()
 
-class ArticleDetailView(generics.RetrieveAPIView):
-    queryset = Article.objects.all()
+class ArticleDetailView(ConditionalGetMixin, CachedReadMixin, generics.RetrieveAPIView):
+    queryset = Article.objects.select_related('author')  # type: ignore
     serializer_class = ArticleSerializer
     lookup_field = 'slug'
+    authentication_classes = []
+    cache_namespaces = ('articles', 'users')
+    etag_fields = ('author__username', 'author__email')
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Burst traffic against the public API, through nginx and straight to the
+backend, to show how many requests the nginx micro-cache keeps away from
+Django (see site/nginx/default.conf).
+
+Start the stack (``docker-compose up -d``), then run e.g.:
+
+    python3 benchmarks/api_burst.py \
+        --target nginx=http://127.0.0.1:8080/api/site/bootstrap/ \
+        --target direct=http://127.0.0.1:8000/api/site/bootstrap/ \
+        --bursts 5 --burst-size 200 --concurrency 50
+
+Each burst fires ``--burst-size`` GETs from ``--concurrency`` threads at
+once, with ``--pause`` seconds between bursts (set it above the cache TTL to
+see every burst start cold). Reported per target: requests per second,
+latency percentiles, the ``X-Cache-Status`` nginx sent back and how many
+requests reached the backend. Every request without a HIT, STALE or
+UPDATING status counts as one that reached the backend. Uses only the
+standard library.
+"""
+import argparse
+import http.client
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+SERVED_BY_CACHE = {'HIT', 'STALE', 'UPDATING'}
+
+_local = threading.local()
+
+
+def get(url):
+    """One GET over this thread's keep-alive connection: ``(status, cache status, seconds)``."""
+    parts = urlsplit(url)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+    started = time.perf_counter()
+    for attempt in range(2):
+        connection = connections.get(parts.netloc)
+        if connection is None:
+            connection = connections[parts.netloc] = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        try:
+            connection.request('GET', path, headers={'Accept': 'application/json', 'Accept-Encoding': 'gzip'})
+            response = connection.getresponse()
+            response.read()
+            return response.status, response.getheader('X-Cache-Status'), time.perf_counter() - started
+        except (http.client.HTTPException, OSError):
+            # The server closed an idle keep-alive connection; retry once.
+            connection.close()
+            del connections[parts.netloc]
+            if attempt:
+                raise
+
+
+def run_target(url, bursts, burst_size, concurrency, pause):
+    timings, statuses, cache_statuses = [], Counter(), Counter()
+    elapsed = 0.0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for burst in range(bursts):
+            if burst:
+                time.sleep(pause)
+            started = time.perf_counter()
+            for status, cache_status, seconds in pool.map(get, [url] * burst_size):
+                statuses[status] += 1
+                cache_statuses[cache_status or '-'] += 1
+                timings.append(seconds)
+            elapsed += time.perf_counter() - started
+    return timings, statuses, cache_statuses, elapsed
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', action='append', required=True, metavar='NAME=URL')
+    parser.add_argument('--bursts', type=int, default=5)
+    parser.add_argument('--burst-size', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--pause', type=float, default=2.0, help="Seconds between bursts")
+    args = parser.parse_args()
+
+    for target in args.target:
+        name, _, url = target.partition('=')
+        timings, statuses, cache_statuses, elapsed = run_target(
+            url, args.bursts, args.burst_size, args.concurrency, args.pause,
+        )
+        total = len(timings)
+        from_cache = sum(count for status, count in cache_statuses.items() if status in SERVED_BY_CACHE)
+        reached_backend = total - from_cache
+        print(f"{name}: {url}")
+        print(f"  {total} requests in {elapsed:.2f}s of bursts, {total / elapsed:.0f} req/s; statuses {dict(statuses)}")
+        print(
+            f"  latency p50 {statistics.median(timings) * 1000:.1f} ms, "
+            f"p95 {percentile(timings, 0.95) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms"
+        )
+        print(f"  X-Cache-Status {dict(cache_statuses)}")
+        print(f"  reached the backend: {reached_backend} ({100 * (1 - reached_backend / total):.1f}% fewer than requests)")
+
+
+if __name__ == '__main__':
+    main()
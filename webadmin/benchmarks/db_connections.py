@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Per-request latency with and without persistent database connections.
+
+Drives the WSGI application in-process (so Django's request_started /
+request_finished connection handling runs exactly as under gunicorn) against
+``/healthz/db`` with ``CONN_MAX_AGE=0`` (connect + disconnect per request)
+and with the configured persistent connection, and prints the latencies.
+
+Run from the webadmin directory with the usual database environment, e.g.:
+
+    MYSQL_HOST=127.0.0.1 MYSQL_PORT=3307 ... python3 benchmarks/db_connections.py
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.wsgi import get_wsgi_application  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+
+def measure(application, environ, requests):
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        result = application(dict(environ), lambda status, headers: None)
+        b''.join(result)
+        result.close()  # fires request_finished, like a real server
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--path', default='/healthz/db')
+    args = parser.parse_args()
+
+    application = get_wsgi_application()
+    host = (settings.ALLOWED_HOSTS or ['127.0.0.1'])[0]
+    environ = RequestFactory().get(args.path, HTTP_HOST=host).environ
+    persistent_age = connection.settings_dict['CONN_MAX_AGE'] or 60
+
+    print(f"{connection.vendor} via {connection.settings_dict.get('HOST') or connection.settings_dict['NAME']}")
+    print(f"{'mode':<28} {'p50':>8} {'p95':>8} {'mean':>8}")
+    for label, max_age in (('per-request (CONN_MAX_AGE=0)', 0), (f'persistent (CONN_MAX_AGE={persistent_age})', persistent_age)):
+        connection.close()
+        connection.settings_dict['CONN_MAX_AGE'] = max_age
+        measure(application, environ, 10)  # warm up
+        timings = sorted(measure(application, environ, args.requests))
+        p50 = timings[len(timings) // 2]
+        p95 = timings[int(len(timings) * 0.95)]
+        print(f"{label:<28} {p50 * 1000:>6.2f}ms {p95 * 1000:>6.2f}ms {statistics.mean(timings) * 1000:>6.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
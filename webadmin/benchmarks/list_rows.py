@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Rows per second for the public list endpoints, serializer vs values() rows.
+
+For ``ArticleCardSerializer``, ``TeamMemberSerializer`` and
+``OnGoingProgramsSerializer``, times fetching and serializing a page of
+rows through the serializer (model instances, ``many=True``) and through
+its ``RowReader`` (mysite/rows.py), and checks that both render to the same
+JSON. Rows are inserted inside a transaction that is rolled back, so any
+migrated database will do:
+
+    DB_ENGINE=sqlite SQLITE_PATH=/tmp/bench.sqlite3 python3 manage.py migrate
+    DB_ENGINE=sqlite SQLITE_PATH=/tmp/bench.sqlite3 python3 benchmarks/list_rows.py --rows 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import transaction  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from articles.models import Article  # noqa: E402
+from articles.serializers import ARTICLE_CARD_ROWS  # noqa: E402
+from mysite.renderers import FastJSONRenderer  # noqa: E402
+from programs.models import Programs  # noqa: E402
+from programs.serializers import PROGRAM_ROWS  # noqa: E402
+from teams.models import TeamMember  # noqa: E402
+from teams.serializers import TEAM_MEMBER_ROWS  # noqa: E402
+
+PARAGRAPH = '<p>The under-14 squad trained twice a week through the rainy season.</p>'
+
+
+def seed(count):
+    articles = [
+        Article(title=f'Training camp report {index}', content=PARAGRAPH * 30, author_name='Coach',
+                date='May 20, 2025', image_url=f'https://i.ibb.co/{index}/photo.png', published=True)
+        for index in range(count)
+    ]
+    for start in range(0, count, 100):
+        # Slug lookups are one OR per title: keep them under SQLite's expression depth.
+        Article.prepare_bulk_create(articles[start:start + 100])
+        Article.objects.bulk_create(articles[start:start + 100])
+    TeamMember.objects.bulk_create(
+        TeamMember(name=f'Member {index}', role='Coach', photo=f'https://i.ibb.co/{index}/face.png',
+                   email='coach@example.org', order=index)
+        for index in range(count)
+    )
+    Programs.objects.bulk_create(
+        Programs(title=f'Program {index}', description='After-school clubs', category='Health', order=index)
+        for index in range(count)
+    )
+
+
+def best_of(repeat, function):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=10, help="Runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    context = {'request': Request(APIRequestFactory().get('/api/public-articles/', SERVER_NAME='127.0.0.1'))}
+    renderer = FastJSONRenderer()
+    print(f"{'serializer':<28}{'rows':>6}{'serializer rows/s':>19}{'values() rows/s':>17}{'speed-up':>10}")
+    with transaction.atomic():
+        seed(args.rows)
+        readers = [
+            (ARTICLE_CARD_ROWS, Article.objects.filter(published=True).defer(*Article.LIST_DEFERRED_FIELDS).order_by('-created_at', '-id')),
+            (TEAM_MEMBER_ROWS, TeamMember.objects.order_by('created_at', 'id')),
+            (PROGRAM_ROWS, Programs.objects.order_by('order', 'id')),
+        ]
+        for reader, queryset in readers:
+            serialized, data = best_of(args.repeat, lambda: reader.serializer_class(queryset.all(), many=True, context=context).data)
+            rows, row_data = best_of(args.repeat, lambda: reader.rows(reader.values(queryset.all()), context))
+            assert renderer.render(row_data) == renderer.render(data)
+            print(
+                f'{reader.serializer_class.__name__:<28}{len(data):>6}{len(data) / serialized:>19.0f}'
+                f'{len(data) / rows:>17.0f}{serialized / rows:>9.1f}x'
+            )
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
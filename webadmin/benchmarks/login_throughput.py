@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Logins per second of one worker, per password hasher.
+
+Drives ``/api/auth/login/`` through the WSGI application in-process (one
+worker, one thread) with a throwaway user whose password is hashed with each
+hasher in turn, and prints the sustained logins per second and latencies.
+Hashing dominates a login, so this is the number to watch when tuning
+``PBKDF2_ITERATIONS`` / ``ARGON2_*`` (see mysite/passwords.py). The user is
+deleted again at the end.
+
+Run from the webadmin directory with the usual database environment, e.g.:
+
+    PBKDF2_ITERATIONS=300000 python3 benchmarks/login_throughput.py --seconds 10
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.models import User  # noqa: E402
+from django.core.wsgi import get_wsgi_application  # noqa: E402
+from django.test import RequestFactory, override_settings  # noqa: E402
+
+from mysite.passwords import HASHERS  # noqa: E402
+from users.models import UserProfile  # noqa: E402
+
+USERNAME = 'login-throughput-bench'
+PASSWORD = 'bench-password-1234'
+
+
+def login_once(application, factory, host):
+    body = json.dumps({'username': USERNAME, 'password': PASSWORD})
+    environ = factory.post('/api/auth/login/', data=body, content_type='application/json', HTTP_HOST=host).environ
+    statuses = []
+    result = application(environ, lambda status, headers: statuses.append(status))
+    b''.join(result)
+    result.close()
+    if not statuses[0].startswith('200'):
+        raise RuntimeError(f"login failed: {statuses[0]}")
+
+
+def measure(application, factory, host, seconds):
+    timings = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        login_once(application, factory, host)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=5.0, help="Seconds per hasher")
+    args = parser.parse_args()
+
+    application = get_wsgi_application()
+    host = (settings.ALLOWED_HOSTS or ['127.0.0.1'])[0]
+    factory = RequestFactory()
+
+    hashers = [name for name in HASHERS if name != 'argon2' or importlib.util.find_spec('argon2')]
+    print(f"options: {settings.PASSWORD_HASHER_OPTIONS or 'Django defaults'}")
+    print(f"{'hasher':<8} {'logins/s':>9} {'p50':>9} {'p95':>9}")
+    User.objects.filter(username=USERNAME).delete()
+    user = User.objects.create_user(username=USERNAME, password=PASSWORD)
+    UserProfile.objects.create(user=user)
+    try:
+        for name in hashers:
+            others = [path for key, path in HASHERS.items() if key != name]
+            with override_settings(PASSWORD_HASHERS=[HASHERS[name], *others]):
+                user.set_password(PASSWORD)
+                user.save(update_fields=['password'])
+                login_once(application, factory, host)  # warm up
+                timings = sorted(measure(application, factory, host, args.seconds))
+            print(
+                f"{name:<8} {len(timings) / sum(timings):>9.1f} "
+                f"{timings[len(timings) // 2] * 1000:>7.1f}ms "
+                f"{timings[int(len(timings) * 0.95)] * 1000:>7.1f}ms"
+            )
+            if len(timings) > 1:
+                print(f"{'':<8} stdev {statistics.stdev(timings) * 1000:.1f}ms over {len(timings)} logins")
+    finally:
+        user.delete()
+
+if __name__ == '__main__':
+    main()
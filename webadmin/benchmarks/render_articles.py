@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Serialize + render time and response size of article pages.
+
+Builds pages of 10, 100 and 1000 in-memory articles with realistic HTML
+bodies (no database needed), runs them through ``ArticleSerializer`` (the
+dashboard list) and ``ArticleCardSerializer`` (public list), and renders the
+result with DRF's stock ``JSONRenderer`` and with ``FastJSONRenderer``
+(mysite/renderers.py). Also reports the body size raw, gzipped and, when
+the brotli package is installed, brotli-compressed as CompressionMiddleware
+would send it.
+
+Run from the webadmin directory:
+
+    python3 benchmarks/render_articles.py --repeat 20
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from articles.models import Article  # noqa: E402
+from articles.serializers import ArticleCardSerializer, ArticleSerializer  # noqa: E402
+from mysite import compression  # noqa: E402
+from mysite.renderers import FastJSONRenderer, orjson_enabled  # noqa: E402
+
+PARAGRAPH = (
+    '<p>The under-14 squad trained twice a week through the rainy season, '
+    'with <strong>coaches</strong> from the academy running drills on '
+    '<a href="https://example.org/courts">three courts</a>.</p>'
+)
+
+
+def make_articles(count):
+    now = timezone.now()
+    articles = []
+    for index in range(count):
+        article = Article(
+            pk=index + 1, title=f'Training camp report {index}', content=PARAGRAPH * 30,
+            author_name='Coach', date='May 20, 2025', image_url='https://i.ibb.co/abc/photo.png',
+            created_at=now, updated_at=now, published=True, slug=f'training-camp-report-{index}',
+        )
+        article.url = article.build_url()
+        article.refresh_derived_content()
+        articles.append(article)
+    return articles
+
+
+def best_of(repeat, function):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10,100,1000')
+    parser.add_argument('--repeat', type=int, default=10, help="Runs per measurement; the best is reported")
+    args = parser.parse_args()
+
+    print(f"FastJSONRenderer encoder: {'orjson' if orjson_enabled() else 'stdlib'}")
+    print(f"{'serializer':<22}{'rows':>6}{'serialize ms':>14}{'stdlib ms':>11}{'fast ms':>9}{'raw KB':>9}{'gzip KB':>9}{'br KB':>8}")
+    for size in (int(size) for size in args.sizes.split(',')):
+        articles = make_articles(size)
+        for serializer_class in (ArticleSerializer, ArticleCardSerializer):
+            serialize, data = best_of(args.repeat, lambda: serializer_class(articles, many=True).data)
+            stdlib, body = best_of(args.repeat, lambda: JSONRenderer().render(data))
+            fast, fast_body = best_of(args.repeat, lambda: FastJSONRenderer().render(data))
+            assert fast_body == body
+            gzipped = len(compression.compress('gzip', body))
+            brotli = f'{len(compression.compress("br", body)) / 1024:>8.1f}' if compression.brotli else f'{"-":>8}'
+            print(
+                f'{serializer_class.__name__:<22}{size:>6}{serialize * 1000:>14.2f}{stdlib * 1000:>11.2f}'
+                f'{fast * 1000:>9.2f}{len(body) / 1024:>9.1f}{gzipped / 1024:>9.1f}{brotli}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Compare how a WSGI and an ASGI deployment cope with slow clients.
+
+Start the backend twice, once per profile (see serve.sh), then run e.g.:
+
+    SERVER_MODE=wsgi BIND=127.0.0.1:8000 sh serve.sh
+    SERVER_MODE=asgi BIND=127.0.0.1:8001 sh serve.sh
+    python3 benchmarks/slow_clients.py \
+        --target wsgi=http://127.0.0.1:8000/api/public-articles/ \
+        --target asgi=http://127.0.0.1:8001/api/async/public-articles/
+
+For each target, ``--slow-clients`` connections trickle their request
+headers and read the response in small, delayed reads (a phone on a bad
+link), while ``--fast-clients`` normal clients keep issuing requests.
+Reported per target: completed slow and fast requests per second and the
+fast clients' latency percentiles. Uses only the standard library.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+def build_request(url):
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    return (
+        f'GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\n'
+        'Accept: application/json\r\nUser-Agent: slow-client-bench\r\nConnection: close\r\n\r\n'
+    ).encode(), parts.hostname, parts.port or 80
+
+
+async def one_request(host, port, request, trickle_bytes=None, delay=0.0, read_size=65536):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        if trickle_bytes:
+            for start in range(0, len(request), trickle_bytes):
+                writer.write(request[start:start + trickle_bytes])
+                await writer.drain()
+                await asyncio.sleep(delay)
+        else:
+            writer.write(request)
+            await writer.drain()
+        status_line = await reader.readline()
+        if not status_line.startswith(b'HTTP/1.1 2') and not status_line.startswith(b'HTTP/1.0 2'):
+            raise RuntimeError(status_line.decode(errors='replace').strip() or 'empty response')
+        while await reader.read(read_size):
+            if trickle_bytes:
+                await asyncio.sleep(delay)
+    finally:
+        writer.close()
+
+
+async def client_loop(deadline, host, port, request, results, **kwargs):
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        try:
+            await one_request(host, port, request, **kwargs)
+        except (OSError, RuntimeError, asyncio.IncompleteReadError):
+            results['errors'] += 1
+            await asyncio.sleep(0.05)
+            continue
+        results['latencies'].append(time.monotonic() - started)
+
+
+async def run_target(url, args):
+    request, host, port = build_request(url)
+    deadline = time.monotonic() + args.duration
+    slow = {'latencies': [], 'errors': 0}
+    fast = {'latencies': [], 'errors': 0}
+    tasks = [
+        client_loop(deadline, host, port, request, slow,
+                    trickle_bytes=args.trickle_bytes, delay=args.trickle_delay, read_size=args.read_size)
+        for _ in range(args.slow_clients)
+    ]
+    tasks += [client_loop(deadline, host, port, request, fast) for _ in range(args.fast_clients)]
+    await asyncio.gather(*tasks)
+    return slow, fast
+
+
+def percentile(values, fraction):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--target', action='append', required=True, metavar='NAME=URL')
+    parser.add_argument('--duration', type=float, default=20.0, help="Seconds per target")
+    parser.add_argument('--slow-clients', type=int, default=50)
+    parser.add_argument('--fast-clients', type=int, default=5)
+    parser.add_argument('--trickle-bytes', type=int, default=16, help="Bytes per slow write")
+    parser.add_argument('--trickle-delay', type=float, default=0.1, help="Seconds between slow writes/reads")
+    parser.add_argument('--read-size', type=int, default=1024, help="Bytes per slow read")
+    args = parser.parse_args()
+
+    print(f"{'target':<10} {'slow req/s':>10} {'fast req/s':>10} {'fast p50':>9} {'fast p95':>9} {'errors':>7}")
+    for target in args.target:
+        name, _, url = target.partition('=')
+        slow, fast = asyncio.run(run_target(url, args))
+        print(
+            f"{name:<10} {len(slow['latencies']) / args.duration:>10.1f} "
+            f"{len(fast['latencies']) / args.duration:>10.1f} "
+            f"{percentile(fast['latencies'], 0.5) * 1000:>7.0f}ms "
+            f"{percentile(fast['latencies'], 0.95) * 1000:>7.0f}ms "
+            f"{slow['errors'] + fast['errors']:>7}"
+        )
+        if fast['latencies']:
+            print(f"{'':<10} fast mean {statistics.mean(fast['latencies']) * 1000:.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
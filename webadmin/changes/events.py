@@ -0,0 +1,139 @@
+"""
+Change notifications for the server-sent events stream (changes/sse.py).
+
+Model signals call ``publish`` once the write commits. The event goes to the
+configured backend (``EVENTS_BACKEND``), which hands it to ``broker``, the
+in-process fan-out to every open stream of this worker:
+
+* ``LocalBackend`` (default) delivers straight to this process's broker.
+  Enough when one process both writes and streams.
+* ``RedisBackend`` publishes on a Redis channel and, in processes that have
+  streams open, a listener thread delivers the channel's messages to the
+  local broker, so every worker's streams see every worker's writes.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+QUEUE_SIZE = 100
+
+
+class Subscription:
+    """One open stream: a bounded queue fed from any thread."""
+
+    def __init__(self, loop, types=None):
+        self.loop = loop
+        self.types = set(types) if types else None
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        # Set when events were dropped; the client should resynchronise.
+        self.overflowed = False
+
+    def offer(self, event):
+        if self.types is not None and event['type'] not in self.types:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class Broker:
+    def __init__(self):
+        self._subscriptions = set()
+        self._lock = threading.Lock()
+
+    def subscribe(self, types=None):
+        """Register a stream on the running event loop."""
+        subscription = Subscription(asyncio.get_running_loop(), types)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        get_backend().listen()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def deliver(self, event):
+        """Fan ``event`` out to every subscription; safe from any thread."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # Its event loop has shut down.
+                self.unsubscribe(subscription)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+
+broker = Broker()
+
+
+class LocalBackend:
+    def publish(self, event):
+        broker.deliver(event)
+
+    def listen(self):
+        pass
+
+
+class RedisBackend:
+    channel = 'content-events'
+
+    def __init__(self):
+        import redis  # Only needed when this backend is configured.
+
+        url = getattr(settings, 'EVENTS_REDIS_URL', None) or os.environ['REDIS_URL']
+        self.client = redis.Redis.from_url(url)
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def publish(self, event):
+        try:
+            self.client.publish(self.channel, json.dumps(event))
+        except Exception:
+            logger.exception("Could not publish content event")
+
+    def listen(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._run, name='content-events', daemon=True)
+                self._listener.start()
+
+    def _run(self):
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                for message in pubsub.listen():
+                    broker.deliver(json.loads(message['data']))
+            except Exception:
+                logger.exception("Content event listener failed; reconnecting")
+                threading.Event().wait(1)
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = import_string(settings.EVENTS_BACKEND)()
+    return _backend
+
+
+def publish(type, action, object_id):
+    """Send ``{'type', 'action', 'id'}`` to every stream after the commit."""
+    event = {'type': type, 'action': action, 'id': object_id}
+    transaction.on_commit(lambda: get_backend().publish(event))
@@ -0,0 +1,125 @@
+"""
+The "changes since" feed behind ``/api/changes/``.
+
+Every feed pairs a model with the column stamped on each write (its
+``updated_at``; for ``User``, the ``UserStamp`` kept by this app's signals)
+and with the serializer its dashboard page already reads. Deletions are
+recorded as ``Tombstone`` rows by ``post_delete`` receivers.
+
+A token is an opaque encoding of the time up to which a client is in sync.
+Only rows stamped at least ``CHANGES_SETTLE_SECONDS`` ago are returned, so a
+transaction that commits shortly after stamping its rows is not skipped.
+"""
+import base64
+import json
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from articles.models import Article
+from articles.serializers import ArticleSerializer
+from programs.models import Programs
+from programs.serializers import OnGoingProgramsSerializer
+from site_settings.models import HeaderSettings
+from site_settings.serializers import HeaderSettingsSerializer
+from teams.models import TeamMember
+from teams.serializers import TeamMemberSerializer
+from users.serializers import UserSerializer
+from .models import Tombstone
+
+Feed = namedtuple('Feed', 'queryset stamp serializer_class')
+
+FEEDS = {
+    'articles': Feed(Article.objects.select_related('author'), 'updated_at', ArticleSerializer),  # type: ignore
+    'team-members': Feed(TeamMember.objects.all(), 'updated_at', TeamMemberSerializer),  # type: ignore
+    'programs': Feed(Programs.objects.all(), 'updated_at', OnGoingProgramsSerializer),  # type: ignore
+    'header-settings': Feed(HeaderSettings.objects.all(), 'updated_at', HeaderSettingsSerializer),  # type: ignore
+    'users': Feed(User.objects.select_related('profile__role'), 'change_stamp__updated_at', UserSerializer),
+}
+FEED_MODELS = {
+    Article: 'articles',
+    TeamMember: 'team-members',
+    Programs: 'programs',
+    HeaderSettings: 'header-settings',
+    User: 'users',
+}
+PAGE_SIZE = 500
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def encode_token(moment):
+    return base64.urlsafe_b64encode(json.dumps({'t': moment.isoformat()}).encode()).decode()
+
+
+def decode_token(token):
+    try:
+        moment = parse_datetime(json.loads(base64.urlsafe_b64decode(token.encode()))['t'])
+    except (ValueError, TypeError, KeyError):
+        raise InvalidToken("Invalid token")
+    if moment is None or timezone.is_naive(moment):
+        raise InvalidToken("Invalid token")
+    return moment
+
+
+def oldest_valid_since():
+    """Tokens older than this may have missed purged tombstones."""
+    return timezone.now() - timedelta(days=settings.CHANGES_RETENTION_DAYS)
+
+
+def _changed(queryset, stamp, since, until, limit):
+    """
+    Rows of ``queryset`` stamped in ``(since, until]``, oldest first, at
+    most ``limit`` of them plus any that share the last row's stamp. Returns
+    ``(rows, boundary)``; ``boundary`` is that last stamp if rows were left
+    out, else None.
+    """
+    queryset = queryset.annotate(changed_at=F(stamp)).filter(changed_at__lte=until)
+    if since is not None:
+        queryset = queryset.filter(changed_at__gt=since)
+    rows = list(queryset.order_by('changed_at', 'pk')[:limit])
+    if len(rows) < limit:
+        return rows, None
+    boundary = rows[-1].changed_at
+    # Rows written together (bulk saves) share a stamp; never split them.
+    rows += queryset.filter(changed_at=boundary, pk__gt=rows[-1].pk).order_by('pk')
+    return rows, boundary
+
+
+def changes_since(since, feeds, context, limit=PAGE_SIZE):
+    """
+    ``{'token', 'has_more', 'changes'}`` for the named ``feeds`` since the
+    time ``since`` (None for everything). Clients apply each feed's
+    ``deleted`` ids before its ``updated`` rows, and call again with the
+    returned token while ``has_more`` is true.
+    """
+    until = timezone.now() - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+    if since is not None and since > until:
+        until = since
+    boundaries = []
+    changes = {}
+    for name in feeds:
+        feed = FEEDS[name]
+        rows, boundary = _changed(feed.queryset.all(), feed.stamp, since, until, limit)
+        tombstones, tombstone_boundary = _changed(
+            Tombstone.objects.filter(feed=name), 'deleted_at', since, until, limit,  # type: ignore
+        )
+        boundaries += [moment for moment in (boundary, tombstone_boundary) if moment is not None]
+        changes[name] = {
+            'updated': feed.serializer_class(rows, many=True, context=context).data,
+            'deleted': [tombstone.object_id for tombstone in tombstones],
+        }
+    # With a feed cut short, resume from its boundary; other feeds may then
+    # repeat a few rows, which clients apply idempotently.
+    return {
+        'token': encode_token(min(boundaries, default=until)),
+        'has_more': bool(boundaries),
+        'changes': changes,
+    }
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from changes.feed import oldest_valid_since
+from changes.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones older than CHANGES_RETENTION_DAYS (run periodically, e.g. daily from cron)"
+
+    def handle(self, *args, **options):
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=oldest_valid_since()).delete()  # type: ignore
+        self.stdout.write(f"Purged {deleted} tombstone(s)")
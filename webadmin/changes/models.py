@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.db import models
+from django.utils import timezone
+
+# Create your models here.
+
+class Tombstone(models.Model):
+    """A deleted row, kept so /api/changes/ can report the deletion."""
+    feed = models.CharField(max_length=50)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.feed} #{self.object_id}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['feed', 'deleted_at', 'id'], name='tombstone_feed_deleted_idx'),
+            # purge_tombstones deletes by age alone.
+            models.Index(fields=['deleted_at'], name='tombstone_deleted_idx'),
+        ]
+
+class UserStamp(models.Model):
+    """Last change of a user or their profile; User has no updated_at."""
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='change_stamp')
+    updated_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"{self.user_id} @ {self.updated_at}"  # type: ignore
@@ -0,0 +1,57 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from articles.models import Article
+from users.models import UserProfile
+from .events import publish
+from .feed import FEED_MODELS
+from .sse import EVENT_TYPES
+from .models import Tombstone, UserStamp
+
+
+def record_deletion(sender, instance, **kwargs):
+    Tombstone.objects.create(feed=FEED_MODELS[sender], object_id=instance.pk)  # type: ignore
+
+
+for model in FEED_MODELS:
+    post_delete.connect(record_deletion, sender=model, dispatch_uid=f'changes_tombstone_{model._meta.label}')
+
+
+@receiver(post_save, sender=User)
+def stamp_user(sender, instance, created, update_fields=None, **kwargs):
+    # last_login is not part of the users feed.
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    if created:
+        UserStamp.objects.create(user=instance)  # type: ignore
+    else:
+        touch_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=UserProfile)
+def stamp_profile_user(sender, instance, **kwargs):
+    touch_user(instance.user_id)
+
+
+def touch_user(user_id):
+    # Only ever updates: a profile deleted along with its user must not
+    # create a stamp for a row that is being deleted.
+    UserStamp.objects.filter(user_id=user_id).update(updated_at=timezone.now())  # type: ignore
+
+
+def publish_change(sender, instance, signal, **kwargs):
+    if sender is Article:
+        # The stream is public: drafts stay invisible until published.
+        visible = instance.published or getattr(instance, 'was_published', False)
+        instance.was_published = instance.published
+        if not visible:
+            return
+    publish(FEED_MODELS[sender], 'deleted' if signal is post_delete else 'saved', instance.pk)
+
+
+for model, feed in FEED_MODELS.items():
+    if feed in EVENT_TYPES:
+        post_save.connect(publish_change, sender=model, dispatch_uid=f'changes_event_save_{model._meta.label}')
+        post_delete.connect(publish_change, sender=model, dispatch_uid=f'changes_event_delete_{model._meta.label}')
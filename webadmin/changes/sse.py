@@ -0,0 +1,89 @@
+"""
+``GET /api/events/[?types=articles,programs]``: a server-sent events stream
+of content changes, one ``event: <type>`` message with ``{"type", "action",
+"id"}`` data per saved or deleted row. Clients refetch what changed (or call
+/api/changes/). An ``event: resync`` message means notifications were
+dropped because the client fell behind and everything should be reloaded.
+
+This is a plain ASGI app mounted in mysite/asgi.py rather than a Django
+view: Django 4.2 does not notice a client going away during a streaming
+response, so the stream and its subscription would outlive the client.
+Here the app watches ``receive()`` for ``http.disconnect`` itself.
+"""
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+from django.conf import settings
+
+from .events import broker
+
+EVENTS_PATH = '/api/events/'
+EVENT_TYPES = ('articles', 'team-members', 'programs', 'header-settings')
+KEEPALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 5000
+
+
+def format_event(name, data):
+    return f'event: {name}\ndata: {json.dumps(data)}\n\n'.encode()
+
+
+def cors_headers(scope):
+    origin = dict(scope['headers']).get(b'origin', b'').decode('latin-1')
+    allowed = getattr(settings, 'CORS_ALLOW_ALL_ORIGINS', False) or origin in settings.CORS_ALLOWED_ORIGINS
+    if not origin or not allowed:
+        return []
+    headers = [(b'access-control-allow-origin', origin.encode('latin-1')), (b'vary', b'origin')]
+    if getattr(settings, 'CORS_ALLOW_CREDENTIALS', False):
+        headers.append((b'access-control-allow-credentials', b'true'))
+    return headers
+
+
+async def _error(send, status, message):
+    await send({'type': 'http.response.start', 'status': status, 'headers': [(b'content-type', b'application/json')]})
+    await send({'type': 'http.response.body', 'body': json.dumps({'error': message}).encode()})
+
+
+async def _disconnected(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+async def events_app(scope, receive, send):
+    if scope['method'] != 'GET':
+        return await _error(send, 405, 'Method not allowed')
+    query = parse_qs(scope['query_string'].decode('latin-1'))
+    types = [name for value in query.get('types', []) for name in value.split(',') if name]
+    unknown = [name for name in types if name not in EVENT_TYPES]
+    if unknown:
+        return await _error(send, 400, f"Unknown type(s) {', '.join(unknown)}. Choose from: {', '.join(EVENT_TYPES)}")
+
+    await send({'type': 'http.response.start', 'status': 200, 'headers': [
+        (b'content-type', b'text/event-stream'),
+        (b'cache-control', b'no-cache'),
+        # Stop nginx from buffering the stream.
+        (b'x-accel-buffering', b'no'),
+        *cors_headers(scope),
+    ]})
+    subscription = broker.subscribe(types)
+    disconnected = asyncio.ensure_future(_disconnected(receive))
+    try:
+        await send({'type': 'http.response.body', 'body': f'retry: {RETRY_MILLISECONDS}\n\n'.encode(), 'more_body': True})
+        while True:
+            next_event = asyncio.ensure_future(subscription.queue.get())
+            await asyncio.wait({next_event, disconnected}, timeout=KEEPALIVE_SECONDS, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected.done():
+                next_event.cancel()
+                break
+            if next_event.done():
+                body = format_event(next_event.result()['type'], next_event.result())
+            else:
+                next_event.cancel()
+                body = b': keepalive\n\n'
+            if subscription.overflowed and subscription.queue.empty():
+                subscription.overflowed = False
+                body += format_event('resync', {})
+            await send({'type': 'http.response.body', 'body': body, 'more_body': True})
+    finally:
+        broker.unsubscribe(subscription)
+        disconnected.cancel()
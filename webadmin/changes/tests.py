@@ -0,0 +1,165 @@
+import asyncio
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from articles.models import Article
+from programs.models import Programs
+from users.models import Role, UserProfile
+from .events import broker
+from .feed import changes_since, decode_token, encode_token
+from .models import Tombstone
+from .sse import EVENTS_PATH, events_app
+
+
+@override_settings(CHANGES_SETTLE_SECONDS=0)
+class ChangesFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(username='admin')
+        cls.article = Article.objects.create(title='First', content='<p>One</p>')
+        cls.program = Programs.objects.create(title='Program', description='d', category='c')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def changes(self, token=None, **params):
+        if token:
+            params['since'] = token
+        response = self.client.get('/api/changes/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def ids(self, body, feed, kind='updated'):
+        return [row if kind == 'deleted' else row['id'] for row in body['changes'][feed][kind]]
+
+    def test_first_call_returns_everything(self):
+        body = self.changes()
+        self.assertEqual(self.ids(body, 'articles'), [self.article.pk])
+        self.assertEqual(self.ids(body, 'programs'), [self.program.pk])
+        self.assertEqual(self.ids(body, 'users'), [self.admin.pk])
+        self.assertFalse(body['has_more'])
+
+    def test_only_changes_since_the_token(self):
+        token = self.changes()['token']
+        self.article.title = 'Renamed'
+        self.article.save()
+        second = Article.objects.create(title='Second', content='<p>Two</p>')
+        program_pk = self.program.pk
+        self.program.delete()
+
+        body = self.changes(token)
+        self.assertEqual(self.ids(body, 'articles'), [self.article.pk, second.pk])
+        self.assertEqual(self.ids(body, 'programs'), [])
+        self.assertEqual(self.ids(body, 'programs', 'deleted'), [program_pk])
+        self.assertEqual(self.ids(body, 'users'), [])
+
+        self.assertEqual(self.changes(body['token'])['changes']['articles'], {'updated': [], 'deleted': []})
+
+    def test_profile_change_marks_the_user_changed(self):
+        token = self.changes(feeds='users')['token']
+        UserProfile.objects.create(user=self.admin, role=Role.objects.create(name='Editor'))
+        body = self.changes(token, feeds='users')
+        self.assertEqual(list(body['changes']), ['users'])
+        self.assertEqual(body['changes']['users']['updated'][0]['profile']['role']['name'], 'Editor')
+
+    def test_pages_never_split_a_bulk_write(self):
+        articles = [Article(title=f'Bulk {index}', content='') for index in range(4)]
+        Article.prepare_bulk_create(articles)
+        Article.objects.bulk_create(articles)
+        # Give the four new rows one shared stamp, as a bulk update would.
+        Article.objects.filter(title__startswith='Bulk').update(updated_at=timezone.now())
+
+        first = changes_since(None, ['articles'], {}, limit=2)
+        second = changes_since(decode_token(first['token']), ['articles'], {}, limit=2)
+        self.assertTrue(first['has_more'])
+        self.assertEqual(len(first['changes']['articles']['updated']) + len(second['changes']['articles']['updated']), 5)
+
+    def test_expired_and_invalid_tokens(self):
+        expired = encode_token(timezone.now() - timedelta(days=365))
+        self.assertEqual(self.client.get('/api/changes/', {'since': expired}).status_code, 410)
+        self.assertEqual(self.client.get('/api/changes/', {'since': 'nope'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/changes/', {'feeds': 'nope'}).status_code, 400)
+
+    def test_requires_authentication(self):
+        self.client.logout()
+        self.assertEqual(self.client.get('/api/changes/').status_code, 401)
+
+    def test_purge_keeps_recent_tombstones(self):
+        Tombstone.objects.create(feed='articles', object_id=1, deleted_at=timezone.now() - timedelta(days=400))
+        Tombstone.objects.create(feed='articles', object_id=2)
+        call_command('purge_tombstones', stdout=StringIO())
+        self.assertEqual(list(Tombstone.objects.values_list('object_id', flat=True)), [2])
+
+
+class EventStreamTests(TestCase):
+    def test_saves_and_deletes_are_published_after_commit(self):
+        with mock.patch.object(broker, 'deliver') as deliver:
+            with self.captureOnCommitCallbacks(execute=True):
+                program = Programs.objects.create(title='Program', description='d', category='c')
+                program_pk = program.pk
+                program.delete()
+                User.objects.create_user(username='not-streamed')
+        self.assertEqual([call.args[0] for call in deliver.call_args_list], [
+            {'type': 'programs', 'action': 'saved', 'id': program_pk},
+            {'type': 'programs', 'action': 'deleted', 'id': program_pk},
+        ])
+
+    def test_drafts_are_not_published(self):
+        with mock.patch.object(broker, 'deliver') as deliver:
+            with self.captureOnCommitCallbacks(execute=True):
+                draft = Article.objects.create(title='Draft', content='')
+                draft.title = 'Still a draft'
+                draft.save()
+                Article.objects.get(pk=draft.pk).delete()
+            self.assertFalse(deliver.called)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                article = Article.objects.create(title='Live', content='', published=True)
+                article = Article.objects.get(pk=article.pk)
+                article.published = False
+                article.save()
+        # Published, then the unpublishing save.
+        self.assertEqual([call.args[0]['id'] for call in deliver.call_args_list], [article.pk, article.pk])
+
+    async def test_stream_delivers_requested_types_until_disconnect(self):
+        sent = []
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': 'GET', 'path': EVENTS_PATH, 'query_string': b'types=programs', 'headers': []}
+        stream = asyncio.ensure_future(events_app(scope, receive, send))
+        while not len(broker):
+            await asyncio.sleep(0)
+        broker.deliver({'type': 'articles', 'action': 'saved', 'id': 1})
+        broker.deliver({'type': 'programs', 'action': 'deleted', 'id': 2})
+        for _ in range(10):
+            await asyncio.sleep(0)
+        disconnect.set()
+        await asyncio.wait_for(stream, 1)
+
+        self.assertEqual(sent[0]['status'], 200)
+        body = b''.join(message.get('body', b'') for message in sent[1:]).decode()
+        self.assertEqual(body, 'retry: 5000\n\nevent: programs\ndata: {"type": "programs", "action": "deleted", "id": 2}\n\n')
+        self.assertEqual(len(broker), 0)
+
+    async def test_unknown_type(self):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {'type': 'http', 'method': 'GET', 'path': EVENTS_PATH, 'query_string': b'types=users', 'headers': []}
+        await events_app(scope, None, send)
+        self.assertEqual(sent[0]['status'], 400)
@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import ChangesView, events_unavailable
+
+urlpatterns = [
+    path('changes/', ChangesView.as_view(), name='changes'),
+    path('events/', events_unavailable, name='events'),
+]
@@ -0,0 +1,49 @@
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .feed import FEEDS, InvalidToken, changes_since, decode_token, oldest_valid_since
+
+# Create your views here.
+
+class ChangesView(APIView):
+    """
+    ``GET /api/changes/?since=<token>[&feeds=articles,users]``: rows created,
+    updated or deleted since ``token`` (everything when it is omitted) in
+    each feed, plus the token to pass next time. See changes/feed.py.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        feeds = [name for name in request.query_params.get('feeds', '').split(',') if name] or list(FEEDS)
+        unknown = [name for name in feeds if name not in FEEDS]
+        if unknown:
+            return Response({
+                'error': f"Unknown feed(s) {', '.join(unknown)}. Choose from: {', '.join(FEEDS)}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        since = None
+        if request.query_params.get('since'):
+            try:
+                since = decode_token(request.query_params['since'])
+            except InvalidToken as exc:
+                return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+            if since < oldest_valid_since():
+                # Tombstones this old may be purged; the client must reload.
+                return Response({
+                    'error': 'Token expired, reload without since'
+                }, status=status.HTTP_410_GONE)
+
+        return Response(changes_since(since, feeds, {'request': request}))
+
+
+def events_unavailable(request):
+    """
+    /api/events/ under WSGI. The stream itself is served by the ASGI app
+    (mysite/asgi.py), which intercepts the path before Django sees it.
+    """
+    return JsonResponse({
+        'error': 'The event stream is only available from the ASGI server (SERVER_MODE=asgi)'
+    }, status=503)
@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import Image
+
+
+@admin.register(Image)
+class ImageAdmin(admin.ModelAdmin):
+    list_display = ('id', 'source_url', 'width', 'height', 'created_at')
+    search_fields = ('source_url', 'checksum')
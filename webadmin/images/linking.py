@@ -0,0 +1,68 @@
+"""
+Content rows keep a copy of their image's variant map next to the image URL
+(``image_url``/``image_variants`` and so on, see ``IMAGE_FIELDS``), so read
+paths serialize it without a join. The copy records the URL it was made for
+under ``'source'``; a copy whose source no longer matches the URL is stale
+and ignored by ``ImageVariantsField``.
+
+A save picks up the variants of an already ingested URL (``attach_variants``,
+from a pre_save receiver). Ingesting a URL later fills in every row that
+uses it (``link``), through save() so caches and change feeds follow.
+"""
+from django.apps import apps
+
+from .pipeline import find_image
+
+# Model label -> (URL field, variants field).
+IMAGE_FIELDS = {
+    'articles.Article': ('image_url', 'image_variants'),
+    'teams.TeamMember': ('photo', 'photo_variants'),
+    'site_settings.HeaderSettings': ('header_logo_url', 'header_logo_variants'),
+}
+
+
+def image_models():
+    for label, (url_field, variants_field) in IMAGE_FIELDS.items():
+        yield apps.get_model(label), url_field, variants_field
+
+
+def variants_copy(image, url):
+    return {'source': url, **image.variants}
+
+
+def is_current(variants, url):
+    return bool(url) and bool(variants) and variants.get('source') == url
+
+
+def attach_variants(instance, url_field, variants_field):
+    url = getattr(instance, url_field)
+    if not url:
+        setattr(instance, variants_field, None)
+        return
+    if is_current(getattr(instance, variants_field), url):
+        return
+    image = find_image(url)
+    setattr(instance, variants_field, variants_copy(image, url) if image else None)
+
+
+def link(image, url):
+    """Store ``image``'s variants on every content row whose image is ``url``."""
+    linked = 0
+    for model, url_field, variants_field in image_models():
+        for instance in model.objects.filter(**{url_field: url}):
+            if not is_current(getattr(instance, variants_field), url):
+                setattr(instance, variants_field, variants_copy(image, url))
+                instance.save(update_fields=[variants_field, 'updated_at'])
+                linked += 1
+    return linked
+
+
+def pending_urls():
+    """Image URLs used by content rows that have no current variants."""
+    urls = set()
+    for model, url_field, variants_field in image_models():
+        rows = model.objects.exclude(**{f'{url_field}__isnull': True}).exclude(**{url_field: ''})
+        for url, variants in rows.values_list(url_field, variants_field).iterator():
+            if not is_current(variants, url):
+                urls.add(url)
+    return sorted(urls)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from images.linking import link, pending_urls
+from images.pipeline import ImageError, ingest_url
+
+
+class Command(BaseCommand):
+    help = "Fetch and resize every content image that has no variants yet (run after deploys, or from cron)"
+
+    def handle(self, *args, **options):
+        linked = failed = 0
+        for url in pending_urls():
+            try:
+                image = ingest_url(url)
+            except ImageError as exc:
+                failed += 1
+                self.stderr.write(f"{url}: {exc}")
+                continue
+            linked += link(image, url)
+        self.stdout.write(f"Linked variants to {linked} row(s); {failed} image(s) failed")
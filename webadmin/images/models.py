@@ -0,0 +1,20 @@
+from django.db import models
+
+# Create your models here.
+
+class Image(models.Model):
+    """
+    One ingested image and its resized variants. ``variants`` maps each
+    variant name to ``{'width', 'height', 'webp', 'jpeg'}``, the last two
+    being storage names under MEDIA_ROOT (see images/pipeline.py).
+    """
+    # The remote URL it was fetched from; empty for uploads.
+    source_url = models.URLField(max_length=500, unique=True, blank=True, null=True)
+    checksum = models.CharField(max_length=64, db_index=True, help_text="SHA-256 of the original bytes")
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    variants = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.source_url or self.checksum
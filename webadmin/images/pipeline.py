@@ -0,0 +1,221 @@
+"""
+Image ingestion: an uploaded file or a remote URL (the ImgBB links stored on
+articles, team members and the header settings) is decoded once and saved as
+resized, recompressed variants in ``VARIANTS`` sizes, each as WebP and JPEG.
+
+Files go to the default storage (the local MEDIA_ROOT, served by nginx at
+MEDIA_URL) under ``images/<aa>/<sha256>/``. The path is derived from the
+original bytes, so a file never changes once written and can be cached
+forever.
+
+Remote images are read through ``IMAGE_FETCHER``, a dotted path to a
+``fetch(url) -> bytes`` callable; tests point it at a stub. The default one
+only connects to public addresses, redirects included, so a URL cannot make
+the server reach its own network.
+"""
+import hashlib
+import http.client
+import ipaddress
+import logging
+import re
+import socket
+from io import BytesIO
+from urllib.parse import urlparse
+from urllib.request import HTTPHandler, HTTPSHandler, ProxyHandler, Request, build_opener
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils.module_loading import import_string
+from PIL import Image as PILImage, ImageOps, UnidentifiedImageError
+
+from .models import Image
+
+logger = logging.getLogger(__name__)
+
+# Longest side, in pixels, of each variant. Images are never upscaled.
+VARIANTS = {
+    'thumbnail': 320,
+    'card': 800,
+    'full': 1600,
+}
+FORMATS = {
+    'webp': ('WEBP', 'webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+class ImageError(ValueError):
+    pass
+
+
+def _is_public(address):
+    address = ipaddress.ip_address(address.split('%', 1)[0])
+    if getattr(address, 'ipv4_mapped', None):
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+def _public_connection(address, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, source_address=None, *args, **kwargs):
+    """
+    ``socket.create_connection`` that resolves the host once and refuses
+    private, loopback, link-local and reserved addresses. It connects to the
+    address it checked, so the name cannot be re-resolved elsewhere.
+    """
+    host, port = address
+    addresses = [info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)]
+    blocked = [address for address in addresses if not _is_public(address)]
+    if blocked:
+        raise ImageError(f"{host} resolves to a non-public address ({blocked[0]})")
+    return socket.create_connection((addresses[0], port), timeout, source_address)
+
+
+class _PublicHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _public_connection
+
+
+class _PublicHTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._create_connection = _public_connection
+
+
+class _PublicHTTPHandler(HTTPHandler):
+    def http_open(self, request):
+        return self.do_open(_PublicHTTPConnection, request)
+
+
+class _PublicHTTPSHandler(HTTPSHandler):
+    def https_open(self, request):
+        return self.do_open(_PublicHTTPSConnection, request, context=self._context)
+
+
+def fetch_url(url):
+    """
+    Default ``IMAGE_FETCHER``: GET ``url``, refusing non-public addresses and
+    bodies over IMAGE_MAX_BYTES. Failures are logged; the error says no more
+    than that the image could not be fetched.
+    """
+    if urlparse(url).scheme not in ('http', 'https'):
+        raise ImageError("Only http(s) image URLs can be fetched")
+    request = Request(url, headers={'User-Agent': 'webadmin-images'})
+    # No proxies: the address checks must apply to the image host itself.
+    opener = build_opener(ProxyHandler({}), _PublicHTTPHandler, _PublicHTTPSHandler)
+    try:
+        with opener.open(request, timeout=settings.IMAGE_FETCH_TIMEOUT) as response:
+            data = response.read(settings.IMAGE_MAX_BYTES + 1)
+    except (OSError, ValueError, http.client.HTTPException) as exc:
+        logger.warning("Could not fetch image %s: %s", url, exc)
+        raise ImageError("Could not fetch the image")
+    if len(data) > settings.IMAGE_MAX_BYTES:
+        raise ImageError("Image is too large")
+    return data
+
+
+def get_fetcher():
+    return import_string(settings.IMAGE_FETCHER)
+
+
+def _storage_prefix(checksum):
+    return f'images/{checksum[:2]}/{checksum}/'
+
+
+def _local_checksum(url):
+    """The checksum in ``url`` if it points at one of our stored variants."""
+    prefix = re.escape(urlparse(settings.MEDIA_URL).path)
+    match = re.match(prefix + r'images/[0-9a-f]{2}/([0-9a-f]{64})/', urlparse(url).path)
+    return match.group(1) if match else None
+
+
+def _encode(image, format_name):
+    pil_format, _, options = FORMATS[format_name]
+    if pil_format == 'JPEG' and image.mode != 'RGB':
+        # JPEG has no alpha channel: flatten onto white.
+        background = PILImage.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+def render_variants(data):
+    """
+    Decode ``data`` and return ``(width, height, variants)``, ``variants``
+    mapping each name to ``(width, height, {format: bytes})``.
+    """
+    try:
+        original = PILImage.open(BytesIO(data))
+        original.load()
+    except (UnidentifiedImageError, OSError, PILImage.DecompressionBombError):
+        raise ImageError("Not a supported image")
+    # Apply the EXIF orientation, which the encoded variants would lose.
+    original = ImageOps.exif_transpose(original)
+    original = original.convert('RGBA' if 'A' in original.getbands() or 'transparency' in original.info else 'RGB')
+
+    variants = {}
+    for name, size in VARIANTS.items():
+        resized = original.copy()
+        resized.thumbnail((size, size), PILImage.LANCZOS)
+        variants[name] = (resized.width, resized.height, {
+            format_name: _encode(resized, format_name) for format_name in FORMATS
+        })
+    return original.width, original.height, variants
+
+
+def store(data, source_url=None):
+    """Create the ``Image`` for the bytes ``data`` and write its variants."""
+    checksum = hashlib.sha256(data).hexdigest()
+    width, height, rendered = render_variants(data)
+    prefix = _storage_prefix(checksum)
+    variants = {}
+    for name, (variant_width, variant_height, encoded) in rendered.items():
+        variants[name] = {'width': variant_width, 'height': variant_height}
+        for format_name, content in encoded.items():
+            path = f'{prefix}{name}.{FORMATS[format_name][1]}'
+            if not default_storage.exists(path):
+                default_storage.save(path, ContentFile(content))
+            variants[name][format_name] = path
+    return Image.objects.create(  # type: ignore
+        source_url=source_url, checksum=checksum, width=width, height=height, variants=variants,
+    )
+
+
+def find_image(url):
+    """The already ingested ``Image`` for ``url``, or None."""
+    checksum = _local_checksum(url)
+    if checksum:
+        return Image.objects.filter(checksum=checksum).order_by('pk').first()  # type: ignore
+    return Image.objects.filter(source_url=url).first()  # type: ignore
+
+
+def ingest_url(url):
+    """The ``Image`` for ``url``, fetching and processing it on first use."""
+    return find_image(url) or store(get_fetcher()(url), source_url=url)
+
+
+def ingest_upload(upload):
+    """The ``Image`` for an uploaded file; identical uploads share one."""
+    if upload.size > settings.IMAGE_MAX_BYTES:
+        raise ImageError("Image is too large")
+    data = upload.read()
+    existing = Image.objects.filter(checksum=hashlib.sha256(data).hexdigest()).order_by('pk').first()  # type: ignore
+    return existing or store(data)
+
+
+def variant_urls(variants, request=None):
+    """``variants`` (as stored) with storage names turned into URLs."""
+    def url(name):
+        url = default_storage.url(name)
+        return request.build_absolute_uri(url) if request else url
+
+    return {
+        name: {
+            'width': variant['width'],
+            'height': variant['height'],
+            **{format_name: url(variant[format_name]) for format_name in FORMATS},
+        }
+        for name, variant in variants.items()
+    }
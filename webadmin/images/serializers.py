@@ -0,0 +1,50 @@
+from rest_framework import serializers
+
+from .linking import is_current
+from .models import Image
+from .pipeline import variant_urls
+
+
+class ImageSerializer(serializers.ModelSerializer):
+    variants = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Image
+        fields = ['id', 'source_url', 'width', 'height', 'variants', 'created_at']
+        read_only_fields = fields
+
+    def get_variants(self, obj):
+        return variant_urls(obj.variants, self.context.get('request'))
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only ``{name: {'width', 'height', 'webp', 'jpeg'}}`` for the image
+    in ``url_field``, or None until that URL has been ingested.
+    """
+
+    def __init__(self, url_field, variants_field, **kwargs):
+        self.url_field = url_field
+        self.variants_field = variants_field
+        super().__init__(source='*', read_only=True, **kwargs)
+
+    @property
+    def row_columns(self):
+        return (self.url_field, self.variants_field)
+
+    def to_representation(self, instance):
+        return self.represent(
+            getattr(instance, self.url_field), getattr(instance, self.variants_field), self.context.get('request'),
+        )
+
+    def bind_row(self, context):
+        # values() read path, see mysite/rows.py.
+        request = context.get('request')
+        return lambda url, variants: self.represent(url, variants, request)
+
+    @staticmethod
+    def represent(url, variants, request):
+        if not is_current(variants, url):
+            return None
+        variants = {name: variant for name, variant in variants.items() if name != 'source'}
+        return variant_urls(variants, request)
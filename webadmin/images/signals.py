@@ -0,0 +1,13 @@
+from django.db.models.signals import pre_save
+
+from .linking import IMAGE_FIELDS, attach_variants, image_models
+
+
+def attach_image_variants(sender, instance, update_fields=None, **kwargs):
+    url_field, variants_field = IMAGE_FIELDS[sender._meta.label]
+    if update_fields is None or variants_field in update_fields:
+        attach_variants(instance, url_field, variants_field)
+
+
+for model, _, _ in image_models():
+    pre_save.connect(attach_image_variants, sender=model, dispatch_uid=f'images_variants_{model._meta.label}')
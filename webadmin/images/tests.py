@@ -0,0 +1,130 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image as PILImage
+
+from articles.models import Article
+from teams.models import TeamMember
+from .models import Image
+
+FETCHED = []
+
+
+def make_image(size=(2000, 1000), mode='RGB', format='PNG'):
+    buffer = BytesIO()
+    PILImage.new(mode, size, (200, 30, 30, 128) if mode == 'RGBA' else (200, 30, 30)).save(buffer, format)
+    return buffer.getvalue()
+
+
+def fake_fetch(url):
+    FETCHED.append(url)
+    return make_image()
+
+
+@override_settings(IMAGE_FETCHER='images.tests.fake_fetch', API_CACHE_ENABLED=False)
+class ImagePipelineTests(TestCase):
+    url = 'https://i.ibb.co/abc/photo.png'
+
+    def setUp(self):
+        FETCHED.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.media_root = media_root
+
+    def ingest(self):
+        call_command('ingest_images', stdout=StringIO(), stderr=StringIO())
+
+    def test_ingest_links_variants_to_every_row_using_the_url(self):
+        first = Article.objects.create(title='One', content='<p>1</p>', image_url=self.url, published=True)
+        Article.objects.create(title='Two', content='<p>2</p>', image_url=self.url, published=True)
+        self.assertIsNone(self.client.get(f'/api/{first.slug}/').json()['image_variants'])
+
+        self.ingest()
+
+        self.assertEqual(FETCHED, [self.url])
+        variants = self.client.get(f'/api/{first.slug}/').json()['image_variants']
+        self.assertEqual(set(variants), {'thumbnail', 'card', 'full'})
+        self.assertEqual((variants['thumbnail']['width'], variants['thumbnail']['height']), (320, 160))
+        self.assertEqual((variants['full']['width'], variants['full']['height']), (1600, 800))
+        self.assertTrue(variants['card']['webp'].startswith('http://testserver/media/images/'))
+        for name in ('thumbnail', 'card', 'full'):
+            for format_name in ('webp', 'jpeg'):
+                path = variants[name][format_name].split('/media/', 1)[1]
+                self.assertTrue(os.path.exists(os.path.join(self.media_root, path)))
+        cards = self.client.get('/api/public-articles/').json()['results']
+        self.assertTrue(all(card['image_variants'] for card in cards))
+
+        # Nothing left to do on a second run.
+        self.ingest()
+        self.assertEqual(FETCHED, [self.url])
+
+    def test_save_attaches_known_variants_and_drops_stale_ones(self):
+        Article.objects.create(title='Old', content='<p>1</p>', image_url=self.url)
+        self.ingest()
+
+        article = Article.objects.create(title='New', content='<p>2</p>', image_url=self.url)
+        self.assertEqual(article.image_variants['source'], self.url)
+        self.assertEqual(FETCHED, [self.url])
+
+        Article.objects.filter(pk=article.pk).update(image_url='https://i.ibb.co/other.png')
+        response = self.client.get(f'/api/{article.slug}/')
+        self.assertIsNone(response.json()['image_variants'])
+
+    def test_upload_creates_variants_usable_as_content_image(self):
+        upload = SimpleUploadedFile('logo.png', make_image((400, 400), 'RGBA'), content_type='image/png')
+        self.assertEqual(self.client.post('/api/images/', {'file': upload}).status_code, 401)
+
+        self.client.force_login(User.objects.create_user(username='member'))
+        upload.seek(0)
+        self.assertEqual(self.client.post('/api/images/', {'file': upload}).status_code, 403)
+
+        self.client.force_login(User.objects.create_user(username='editor', is_staff=True))
+        upload.seek(0)
+        response = self.client.post('/api/images/', {'file': upload})
+        self.assertEqual(response.status_code, 201, response.content)
+        body = response.json()
+        self.assertIsNone(body['source_url'])
+        # Never upscaled.
+        self.assertEqual(body['variants']['full']['width'], 400)
+
+        member = TeamMember.objects.create(name='A', role='Coach', photo=body['variants']['card']['jpeg'])
+        self.assertEqual(member.photo_variants['card']['width'], 400)
+        self.assertEqual(Image.objects.count(), 1)
+        self.assertEqual(FETCHED, [])
+
+    def test_url_ingest_and_bad_images(self):
+        self.client.force_login(User.objects.create_user(username='editor', is_staff=True))
+        member = TeamMember.objects.create(name='A', role='Coach', photo=self.url)
+
+        response = self.client.post('/api/images/', {'url': self.url}, content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(response.json()['source_url'], self.url)
+        member.refresh_from_db()
+        self.assertEqual(member.photo_variants['source'], self.url)
+
+        bad = SimpleUploadedFile('notes.png', b'not an image', content_type='image/png')
+        response = self.client.post('/api/images/', {'file': bad})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': 'Not a supported image'})
+        self.assertEqual(self.client.post('/api/images/', {}).status_code, 400)
+
+    @override_settings(IMAGE_FETCHER='images.pipeline.fetch_url')
+    def test_url_fetch_refuses_internal_addresses(self):
+        self.client.force_login(User.objects.create_user(username='editor', is_staff=True))
+        for url in ('http://127.0.0.1:8000/api/auth/', 'http://localhost/', 'http://[::ffff:10.0.0.1]/'):
+            with self.assertLogs('images.pipeline', 'WARNING') as logs:
+                response = self.client.post('/api/images/', {'url': url}, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+            # The reason is logged, not returned.
+            self.assertEqual(response.json(), {'error': 'Could not fetch the image'})
+            self.assertIn('non-public address', logs.output[0])
+        self.assertFalse(Image.objects.exists())
@@ -0,0 +1,36 @@
+from rest_framework import status
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from users.permissions import IsActiveStaff
+
+from .linking import link
+from .pipeline import ImageError, ingest_upload, ingest_url
+from .serializers import ImageSerializer
+
+# Create your views here.
+
+class ImageUploadView(APIView):
+    """
+    ``POST /api/images/`` with a ``file`` upload or a ``url`` to fetch:
+    processes the image into its variants and returns them. Content already
+    pointing at ``url`` gets the variants straight away; for an upload, use
+    one of the returned variant URLs as the content's image URL. Staff only:
+    it writes files and makes the server fetch URLs.
+    """
+    permission_classes = [IsActiveStaff]
+    parser_classes = [MultiPartParser, FormParser, JSONParser]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        url = request.data.get('url')
+        if not upload and not url:
+            return Response({'error': 'Provide a file or a url'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            image = ingest_upload(upload) if upload else ingest_url(url)
+        except ImageError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if url and not upload:
+            link(image, url)
+        return Response(ImageSerializer(image, context={'request': request}).data, status=status.HTTP_201_CREATED)
@@ -0,0 +1,118 @@
+"""
+Async versions of the public read endpoints, for the ASGI deployment.
+
+DRF views are synchronous, so under ASGI every request to them is handed to
+a thread. These views query with Django's async ORM (``aget``, ``acount``,
+``async for``) instead and only run the serializers, which do no I/O on the
+prefetched rows, inline. A slow client then costs an idle coroutine rather
+than a worker thread. Responses match the DRF endpoints they mirror.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotAllowed
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from articles.models import Article
+from articles.serializers import ArticleCardSerializer, ArticleSerializer
+from mysite.pagination import MAX_PAGE_SIZE
+from mysite.renderers import FastJSONRenderer
+from programs.models import Programs
+from programs.serializers import OnGoingProgramsSerializer
+from site_settings.models import HeaderSettings
+from site_settings.serializers import HeaderSettingsSerializer
+from teams.models import TeamMember
+from teams.serializers import TeamMemberSerializer
+
+
+def json_response(data, status=200):
+    # Same renderer as the DRF endpoints.
+    return HttpResponse(FastJSONRenderer().render(data), status=status, content_type='application/json')
+
+
+def read_only(view):
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+def _positive_int(value, default, maximum=None):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return default
+    if number < 1:
+        return default
+    return min(number, maximum) if maximum else number
+
+
+def _page_number(value, page_count):
+    """``?page=`` as PageNumberPagination reads it, or None for an invalid page."""
+    if not value:
+        return 1
+    if value == 'last':
+        return page_count
+    try:
+        number = int(value)
+    except ValueError:
+        return None
+    return number if 1 <= number <= page_count else None
+
+
+async def paginate(request, queryset, serializer_class):
+    """``StandardPagination``-shaped page of ``queryset``, fetched asynchronously."""
+    page_size = _positive_int(request.GET.get('page_size'), api_settings.PAGE_SIZE, MAX_PAGE_SIZE)
+    count = await queryset.acount()
+    page_count = max(1, -(-count // page_size))
+    page = _page_number(request.GET.get('page'), page_count)
+    if page is None:
+        return json_response({'detail': 'Invalid page.'}, status=404)
+
+    offset = (page - 1) * page_size
+    rows = [row async for row in queryset[offset:offset + page_size]]
+    url = request.build_absolute_uri()
+    previous_url = None
+    if page > 1:
+        previous_url = remove_query_param(url, 'page') if page == 2 else replace_query_param(url, 'page', page - 1)
+    return json_response({
+        'count': count,
+        'next': replace_query_param(url, 'page', page + 1) if page < page_count else None,
+        'previous': previous_url,
+        'results': serializer_class(rows, many=True, context={'request': request}).data,
+    })
+
+
+@read_only
+async def public_articles(request):
+    queryset = Article.objects.filter(published=True).defer(*Article.LIST_DEFERRED_FIELDS)  # type: ignore
+    return await paginate(request, queryset, ArticleCardSerializer)
+
+
+@read_only
+async def article_detail(request, slug):
+    try:
+        article = await Article.objects.select_related('author').aget(slug=slug, published=True)  # type: ignore
+    except Article.DoesNotExist:  # type: ignore
+        return json_response({'detail': 'No Article matches the given query.'}, status=404)
+    return json_response(ArticleSerializer(article, context={'request': request}).data)
+
+
+@read_only
+async def team_members(request):
+    return await paginate(request, TeamMember.objects.all(), TeamMemberSerializer)
+
+
+@read_only
+async def programs(request):
+    return await paginate(request, Programs.objects.order_by('order'), OnGoingProgramsSerializer)
+
+
+@read_only
+async def header_settings(request):
+    # Memoized after the first call, so this rarely leaves the event loop.
+    settings = await sync_to_async(HeaderSettings.get_active_settings)()
+    return json_response(HeaderSettingsSerializer(settings, context={'request': request}).data)
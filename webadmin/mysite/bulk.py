@@ -0,0 +1,173 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connection, transaction
+from django.db.models.signals import post_save
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+BULK_MAX_ITEMS = 500
+BULK_BATCH_SIZE = 200
+
+
+class BulkUpdateListSerializer(serializers.ListSerializer):
+    """
+    ``many=True`` serializer for partial updates: each item must carry the
+    ``id`` of one of the instances in ``context['bulk_instances']`` and is
+    validated against that instance.
+    """
+
+    def to_internal_value(self, data):
+        self._seen_ids = set()
+        return super().to_internal_value(data)
+
+    def run_child_validation(self, data):
+        instances = self.context['bulk_instances']
+        pk_field = self.child.Meta.model._meta.pk
+        try:
+            pk = pk_field.to_python(data.get('id') if isinstance(data, dict) else None)
+        except DjangoValidationError:
+            pk = None
+        if pk is None:
+            raise serializers.ValidationError({'id': ['This field is required.']})
+        if pk not in instances:
+            raise serializers.ValidationError({'id': [f'No object with id {pk}.']})
+        if pk in self._seen_ids:
+            raise serializers.ValidationError({'id': [f'Duplicate id {pk}.']})
+        self._seen_ids.add(pk)
+
+        self.child.instance = instances[pk]
+        self.child.initial_data = data
+        return {**super().run_child_validation(data), 'id': pk}
+
+
+class BulkModelMixin:
+    """
+    Adds ``/<prefix>/bulk/`` to a ModelViewSet, taking arrays of objects:
+
+    * ``POST``   creates every item,
+    * ``PATCH``  partially updates every item (each one carries its ``id``),
+    * ``DELETE`` deletes ``{"ids": [...]}``.
+
+    Items are validated with a ``many=True`` serializer and written with
+    ``bulk_create``/``bulk_update`` in one transaction. If any item is
+    invalid nothing is written and the response is a list of per-item
+    errors aligned with the request. ``post_save`` is sent for every written
+    row so signal receivers (cache invalidation...) still run.
+
+    Bulk writes require ``bulk_permission_classes`` (an authenticated user)
+    whatever the viewset's own ``permission_classes`` allow.
+    """
+    bulk_max_items = BULK_MAX_ITEMS
+    bulk_batch_size = BULK_BATCH_SIZE
+    bulk_permission_classes = [IsAuthenticated]
+
+    def get_permissions(self):
+        if self.action == 'bulk':
+            return [permission() for permission in self.bulk_permission_classes]
+        return super().get_permissions()
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request, *args, **kwargs):
+        if request.method == 'POST':
+            return self.bulk_create(request)
+        if request.method == 'PATCH':
+            return self.bulk_update(request)
+        return self.bulk_destroy(request)
+
+    def bulk_create(self, request):
+        serializer = self.get_serializer(data=request.data, many=True, max_length=self.bulk_max_items)
+        serializer.is_valid(raise_exception=True)
+        model = self.get_queryset().model
+        instances = [model(**attrs) for attrs in serializer.validated_data]
+        with transaction.atomic():
+            self.perform_bulk_create(instances)
+        return Response(self.get_serializer(instances, many=True).data, status=status.HTTP_201_CREATED)
+
+    def bulk_update(self, request):
+        items = request.data if isinstance(request.data, list) else []
+        ids = [item.get('id') for item in items if isinstance(item, dict)]
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            instances = queryset.in_bulk([pk for pk in ids if pk is not None])
+        except (ValueError, TypeError, DjangoValidationError):
+            instances = {}
+
+        context = {**self.get_serializer_context(), 'bulk_instances': instances}
+        serializer = BulkUpdateListSerializer(
+            list(instances.values()),
+            data=request.data,
+            child=self.get_serializer_class()(partial=True, context=context),
+            partial=True,
+            context=context,
+            max_length=self.bulk_max_items,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        updated, fields = [], set()
+        for attrs in serializer.validated_data:
+            instance = instances[attrs.pop('id')]
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            fields.update(attrs)
+            updated.append(instance)
+        with transaction.atomic():
+            self.perform_bulk_update(updated, fields)
+        return Response(self.get_serializer(updated, many=True).data)
+
+    def bulk_destroy(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or len(ids) > self.bulk_max_items:
+            return Response(
+                {'ids': [f'Expected a list of at most {self.bulk_max_items} ids.']},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            with transaction.atomic():
+                found = set(queryset.filter(pk__in=ids).values_list('pk', flat=True))
+                self.perform_bulk_destroy(queryset.filter(pk__in=found))
+        except (ValueError, TypeError, DjangoValidationError):
+            return Response({'ids': ['Invalid id.']}, status=status.HTTP_400_BAD_REQUEST)
+        pk_field = queryset.model._meta.pk
+        not_found = [pk for pk in ids if pk_field.to_python(pk) not in found]
+        return Response({'deleted': len(found), 'not_found': not_found})
+
+    def perform_bulk_create(self, instances):
+        model = self.get_queryset().model
+        if connection.features.can_return_rows_from_bulk_insert:
+            model.objects.bulk_create(instances, batch_size=self.bulk_batch_size)
+            _send_post_save(model, instances, created=True)
+        else:
+            # Without RETURNING (MySQL) bulk_create cannot report the new
+            # primary keys, so save row by row inside the same transaction.
+            for instance in instances:
+                instance.save()
+
+    def perform_bulk_update(self, instances, fields):
+        if not instances or not fields:
+            return
+        model = self.get_queryset().model
+        fields = set(fields)
+        # bulk_update() skips Field.pre_save(), so bump auto_now columns here.
+        now = timezone.now()
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False):
+                for instance in instances:
+                    setattr(instance, field.attname, now)
+                fields.add(field.name)
+        model.objects.bulk_update(instances, sorted(fields), batch_size=self.bulk_batch_size)
+        _send_post_save(model, instances, created=False, update_fields=frozenset(fields))
+
+    def perform_bulk_destroy(self, queryset):
+        # QuerySet.delete() already sends pre/post_delete for every row.
+        queryset.delete()
+
+
+def _send_post_save(model, instances, created, update_fields=None):
+    for instance in instances:
+        post_save.send(
+            sender=model, instance=instance, created=created,
+            update_fields=update_fields, raw=False, using=instance._state.db,
+        )
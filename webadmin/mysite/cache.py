@@ -0,0 +1,139 @@
+"""
+Versioned read-through cache for the public API.
+
+Each cached response key embeds the current *generation* of every model
+namespace the response depends on (``articles``, ``teams`` ...). Model
+signals bump a namespace's generation after a write commits, which makes
+every key built from the old generation unreachable at once: no TTL
+guessing and no key scanning. Stale entries simply age out of the cache.
+
+The default cache is process-local; with several workers configure a shared
+backend (``REDIS_URL``) so a bump in one worker is seen by all of them.
+"""
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+GENERATION_KEY = 'api:gen:{}'
+
+
+def _initial_generation():
+    # Start from the clock rather than 1 so a generation that was evicted and
+    # recreated never collides with keys written under its previous life.
+    return time.time_ns() // 1000
+
+
+def get_generations(namespaces):
+    keys = {GENERATION_KEY.format(namespace): namespace for namespace in namespaces}
+    found = cache.get_many(keys.keys())
+    generations = {}
+    for key, namespace in keys.items():
+        generation = found.get(key)
+        if generation is None:
+            cache.add(key, _initial_generation(), timeout=None)
+            generation = cache.get(key)
+        generations[namespace] = generation
+    return generations
+
+
+def bump_generation(namespace):
+    """Invalidate every cached response that depends on ``namespace``."""
+    key = GENERATION_KEY.format(namespace)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_generation(), timeout=None)
+
+
+def bump_generation_on_commit(namespace):
+    # Bumping before commit would let a concurrent request cache the old rows
+    # under the new generation.
+    transaction.on_commit(lambda: bump_generation(namespace))
+
+
+def cache_enabled():
+    return getattr(settings, 'API_CACHE_ENABLED', True)
+
+
+def default_timeout():
+    return getattr(settings, 'API_CACHE_TIMEOUT', None)
+
+
+def version_tag(namespaces, generations):
+    return '.'.join(f'{namespace}{generations[namespace]}' for namespace in namespaces)
+
+
+def get_fragments(fragments, key_prefix=''):
+    """
+    Read-through cache for several independently versioned pieces of data.
+
+    ``fragments`` maps a name to ``(namespaces, build)``; each fragment is
+    cached under the generations of its own namespaces, so a write to one
+    model only rebuilds the fragments that depend on it. Generations and
+    cached fragments are each fetched in a single round-trip.
+    """
+    if not cache_enabled():
+        return {name: build() for name, (namespaces, build) in fragments.items()}
+
+    all_namespaces = sorted({ns for namespaces, _ in fragments.values() for ns in namespaces})
+    generations = get_generations(all_namespaces)
+    keys = {
+        name: f'api:frag:{key_prefix}{name}:{version_tag(namespaces, generations)}'
+        for name, (namespaces, _) in fragments.items()
+    }
+    found = cache.get_many(keys.values())
+
+    result, missing = {}, {}
+    for name, (_, build) in fragments.items():
+        key = keys[name]
+        if key in found:
+            result[name] = found[key]
+        else:
+            result[name] = missing[key] = build()
+    if missing:
+        cache.set_many(missing, timeout=default_timeout())
+    return result
+
+
+class CachedReadMixin:
+    """
+    Serve ``list``/``retrieve`` from the cache, keyed on the request URL and
+    the generations of ``cache_namespaces``.
+    """
+    cache_namespaces = ()
+    cache_timeout = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_cache_key(self, request):
+        generations = get_generations(self.cache_namespaces)
+        version = version_tag(self.cache_namespaces, generations)
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        # Responses embed absolute URLs, so the host is part of the key.
+        return f'api:resp:{version}:{request.get_host()}{request.path}?{query}'
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        if not cache_enabled():
+            return handler(request, *args, **kwargs)
+
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout=self.cache_timeout or default_timeout())
+            response['X-Cache'] = 'MISS'
+        return response
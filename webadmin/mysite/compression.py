@@ -0,0 +1,110 @@
+"""
+Response compression negotiated from ``Accept-Encoding``: Brotli when the
+client accepts ``br`` and the brotli package is installed, gzip otherwise.
+
+Only text-like bodies of at least ``COMPRESSION_MIN_BYTES`` are compressed;
+below that the headers and CPU cost outweigh the saving. Streaming
+responses (exports, the event stream) and bodies that are already encoded
+are left alone.
+
+Responses that may carry a secret are never compressed, as a BREACH
+mitigation (a compressed secret's length leaks it when the body also
+reflects attacker-chosen text): requests with credentials (an
+``Authorization`` header or a session cookie) and everything under
+``/api/auth/``, which returns tokens. The public, anonymous reads that make
+up most of the traffic are unaffected.
+"""
+import gzip
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:
+    import brotli
+except ImportError:  # Pinned in requirements.txt (Brotli); gzip only without it.
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('application/json', 'application/javascript', 'application/x-ndjson', 'application/xml', 'text/', 'image/svg+xml')
+GZIP_LEVEL = 6
+# Brotli's default (11) is meant for static assets; 4 beats gzip -6 in both
+# ratio and speed on JSON.
+BROTLI_QUALITY = 4
+UNCOMPRESSED_PATHS = ('/api/auth/',)
+
+
+def compress(encoding, content):
+    if encoding == 'br':
+        return brotli.compress(content, quality=BROTLI_QUALITY)
+    return gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def parse_accept_encoding(header):
+    """
+    ``(accepted, refused)``: the codings in an ``Accept-Encoding`` header
+    with a non-zero q-value, and those explicitly refused with ``q=0``.
+    """
+    accepted, refused = set(), set()
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    refused.add(coding)
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding)
+    return accepted, refused
+
+
+def choose_encoding(header):
+    accepted, refused = parse_accept_encoding(header)
+
+    def acceptable(coding):
+        # '*' covers every coding not listed on its own, refusals included.
+        return coding in accepted or ('*' in accepted and coding not in refused)
+
+    if brotli is not None and acceptable('br'):
+        return 'br'
+    if acceptable('gzip'):
+        return 'gzip'
+    return None
+
+
+def has_credentials(request):
+    return 'HTTP_AUTHORIZATION' in request.META or settings.SESSION_COOKIE_NAME in request.COOKIES
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if has_credentials(request) or request.path.startswith(UNCOMPRESSED_PATHS):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES):
+            return response
+        if len(response.content) < settings.COMPRESSION_MIN_BYTES:
+            return response
+
+        # The body depends on Accept-Encoding from here on, whatever it is.
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+        compressed = compress(encoding, response.content)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The bytes differ from the uncompressed entity: a strong ETag would
+        # claim otherwise (If-None-Match still matches weak ETags).
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
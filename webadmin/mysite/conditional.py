@@ -0,0 +1,82 @@
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for ``list`` and ``retrieve``, driven by the
+    model's ``updated_at`` column.
+
+    The validators are computed with a single cheap query (``Max`` + ``Count``
+    for lists, the row's ``updated_at`` for details) before anything is
+    serialized, and a matching ``If-None-Match``/``If-Modified-Since``
+    short-circuits to ``304 Not Modified``.
+
+    ``Last-Modified`` is only sent when ``updated_at`` alone dates the whole
+    body: not for lists (a deletion changes the list without moving, or even
+    lowers, ``Max(updated_at)``) and not for details that embed related rows
+    (``etag_fields``, the related columns the ETag also covers).
+    """
+    last_modified_field = 'updated_at'
+    etag_fields = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        state = queryset.aggregate(last_modified=Max(self.last_modified_field), count=Count('pk'))
+        # The count catches deletions, which do not move Max(updated_at).
+        return self.conditional_response(
+            super().list, request, (state['last_modified'], state['count']), None, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            state = (
+                queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                .values_list(self.last_modified_field, *self.etag_fields)
+                .first()
+            )
+        except (TypeError, ValueError, ValidationError):
+            # Malformed lookup value (e.g. a non-numeric pk), as DRF's get_object_or_404 catches.
+            state = None
+        if state is None:
+            # Unknown object: let the regular path produce the 404.
+            return super().retrieve(request, *args, **kwargs)
+        last_modified = None if self.etag_fields else state[0]
+        return self.conditional_response(super().retrieve, request, state, last_modified, *args, **kwargs)
+
+    def get_etag(self, request, state):
+        parts = [
+            request.get_host(),
+            request.get_full_path(),
+            getattr(request, 'accepted_media_type', '') or '',
+            *('' if value is None else value.isoformat() if hasattr(value, 'isoformat') else str(value) for value in state),
+        ]
+        return '"%s"' % hashlib.md5('|'.join(parts).encode(), usedforsecurity=False).hexdigest()
+
+    def conditional_response(self, handler, request, state, last_modified, *args, **kwargs):
+        """
+        ``handler(request, *args, **kwargs)`` unless the client's copy is
+        current. The ETag covers ``state``; ``last_modified`` (or None) is
+        sent and honoured as ``Last-Modified``.
+        """
+        etag = self.get_etag(request, state)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            # Let browsers and proxies keep the body but revalidate each time.
+            patch_cache_control(response, no_cache=True)
+        return response
@@ -0,0 +1,80 @@
+"""
+Database settings built from the environment.
+
+``DB_ENGINE`` selects the backend: ``mysql`` (default) or ``sqlite`` for the
+bundled db.sqlite3 / local development.
+
+MySQL transport: with ``MYSQL_UNIX_SOCKET`` set the server is reached
+through that socket, otherwise over TCP at ``MYSQL_HOST``:``MYSQL_PORT``.
+
+Connections are kept open between requests for ``DB_CONN_MAX_AGE`` seconds
+(default 60, ``0`` restores one connection per request) and checked with
+``CONN_HEALTH_CHECKS`` before being reused. Under ``SERVER_MODE=asgi`` the
+default is 0: async views and the sync_to_async thread pool open
+connections outside the request cycle that closes expired ones, so
+persistent connections would pile up. Setting ``DB_POOL_SIZE`` turns
+on a real connection pool through django-db-connection-pool, when that
+package is installed.
+"""
+import importlib.util
+import os
+import warnings
+from pathlib import Path
+
+DEFAULT_CONN_MAX_AGE = 60
+ASGI_CONN_MAX_AGE = 0
+
+
+def _int(environ, name, default):
+    value = environ.get(name)
+    return int(value) if value not in (None, '') else default
+
+
+def database_config(base_dir, environ=os.environ):
+    engine = environ.get('DB_ENGINE', 'mysql').lower()
+    if engine == 'sqlite':
+        return {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': environ.get('SQLITE_PATH') or str(Path(base_dir) / 'db.sqlite3'),
+        }
+    if engine != 'mysql':
+        raise ValueError(f"Unsupported DB_ENGINE '{engine}' (expected mysql or sqlite)")
+
+    asgi = environ.get('SERVER_MODE', 'wsgi').lower() == 'asgi'
+    config = {
+        'ENGINE': 'django.db.backends.mysql',
+        'NAME': environ['MYSQL_DATABASE'],
+        'USER': environ['MYSQL_USER'],
+        'PASSWORD': environ['MYSQL_PASSWORD'],
+        'CONN_MAX_AGE': _int(environ, 'DB_CONN_MAX_AGE', ASGI_CONN_MAX_AGE if asgi else DEFAULT_CONN_MAX_AGE),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'charset': 'utf8mb4',
+            'connect_timeout': _int(environ, 'DB_CONNECT_TIMEOUT', 5),
+        },
+    }
+
+    socket = environ.get('MYSQL_UNIX_SOCKET')
+    if socket:
+        # mysqlclient only uses the socket when the host is localhost.
+        config['HOST'] = 'localhost'
+        config['OPTIONS']['unix_socket'] = socket
+    else:
+        config['HOST'] = environ['MYSQL_HOST']
+        config['PORT'] = environ.get('MYSQL_PORT', '3306')
+
+    pool_size = _int(environ, 'DB_POOL_SIZE', 0)
+    if pool_size and not importlib.util.find_spec('dj_db_conn_pool'):
+        warnings.warn("DB_POOL_SIZE is set but django-db-connection-pool is not installed; using persistent connections")
+    elif pool_size:
+        config['ENGINE'] = 'dj_db_conn_pool.backends.mysql'
+        # Django "closes" the connection after each request, which hands it
+        # back to the pool instead of disconnecting.
+        config['CONN_MAX_AGE'] = 0
+        config['POOL_OPTIONS'] = {
+            'POOL_SIZE': pool_size,
+            'MAX_OVERFLOW': _int(environ, 'DB_POOL_MAX_OVERFLOW', pool_size),
+            'RECYCLE': _int(environ, 'DB_POOL_RECYCLE', 60 * 30),
+            'PRE_PING': True,
+        }
+    return config
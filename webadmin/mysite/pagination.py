@@ -0,0 +1,181 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError as APIValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+MAX_PAGE_SIZE = 100
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Project-wide page number pagination. Clients may ask for a smaller or
+    larger page with ``?page_size=``, bounded by ``MAX_PAGE_SIZE``.
+    """
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+
+
+class KeysetPagination(StandardPagination):
+    """
+    Page number pagination that switches to keyset (cursor) pagination when
+    the request carries a ``cursor`` parameter (empty for the first page).
+
+    In cursor mode pages are fetched with ``WHERE (key) < (last seen key)``
+    instead of OFFSET, so a deep page costs the same as the first one, and no
+    ``COUNT(*)`` is run: the response only has ``next``, ``previous`` and
+    ``results``.
+
+    The key defaults to ``('-created_at', '-id')``; views can override it
+    with a ``cursor_ordering`` attribute. The primary key is always appended
+    as a tie-breaker so the key is unique. Cursor pages always follow that
+    key, so ``?ordering=`` is rejected in cursor mode rather than ignored.
+    """
+    cursor_query_param = 'cursor'
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+    cursor_ordering_message = 'Cannot be combined with cursor pagination.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            self.cursor_mode = False
+            return super().paginate_queryset(queryset, request, view)
+
+        self.cursor_mode = True
+        self.display_page_controls = False
+        ordering_param = self.get_ordering_param(request, view)
+        if ordering_param:
+            raise APIValidationError({ordering_param: [self.cursor_ordering_message]})
+        self.request = request
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.key = self.get_ordering(view, queryset.model)
+
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+        ordering = [_invert(field) for field in self.key] if reverse else list(self.key)
+
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self.build_position_filter(ordering, cursor['position']))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.results = results
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.get_next_cursor_link(),
+            'previous': self.get_previous_cursor_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['required'] = ['results']
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append({
+            'name': self.cursor_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Keyset pagination cursor. Pass an empty value for the first page.',
+            'schema': {'type': 'string'},
+        })
+        return parameters
+
+    def get_ordering(self, view, model):
+        ordering = list(getattr(view, 'cursor_ordering', None) or self.ordering)
+        pk_names = {'pk', model._meta.pk.name}
+        if not any(field.lstrip('-') in pk_names for field in ordering):
+            prefix = '-' if ordering and ordering[0].startswith('-') else ''
+            ordering.append(prefix + model._meta.pk.name)
+        return tuple(ordering)
+
+    def get_ordering_param(self, request, view):
+        """The ``OrderingFilter`` query parameter present on ``request``, if any."""
+        for backend in getattr(view, 'filter_backends', ()):
+            if issubclass(backend, OrderingFilter) and backend.ordering_param in request.query_params:
+                return backend.ordering_param
+        return None
+
+    def build_position_filter(self, ordering, position):
+        # (a, b) > (x, y)  <=>  a > x OR (a = x AND b > y)
+        clauses = []
+        for index, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            equal = {ordering[i].lstrip('-'): position[i] for i in range(index)}
+            clauses.append(Q(**equal) & Q(**{f'{name}__{lookup}': position[index]}))
+        return reduce(or_, clauses)
+
+    def encode_cursor(self, row, reverse):
+        if isinstance(row, dict):
+            # values() rows (mysite/rows.py): the key fields are all we need.
+            row = self.model(**{name: row[self._field(name).attname] for name in self._key_names()})
+        position = [self._field(name).value_to_string(row) for name in self._key_names()]
+        payload = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'))
+        token = base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            raw_position = payload['p']
+            if len(raw_position) != len(self.key):
+                raise ValueError
+            position = [
+                self._field(name).to_python(value)
+                for name, value in zip(self._key_names(), raw_position)
+            ]
+            return {'position': position, 'reverse': bool(payload.get('r'))}
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError, FieldDoesNotExist):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_next_cursor_link(self):
+        if not self.has_next or not self.results:
+            return None
+        return self.encode_cursor(self.results[-1], reverse=False)
+
+    def get_previous_cursor_link(self):
+        if not self.has_previous or not self.results:
+            return None
+        return self.encode_cursor(self.results[0], reverse=True)
+
+    def _key_names(self):
+        return [field.lstrip('-') for field in self.key]
+
+    def _field(self, name):
+        if name == 'pk':
+            return self.model._meta.pk
+        return self.model._meta.get_field(name)
+
+
+def _invert(field):
+    return field[1:] if field.startswith('-') else '-' + field
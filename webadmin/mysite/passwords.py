@@ -0,0 +1,46 @@
+"""
+Password hasher settings built from the environment.
+
+``PASSWORD_HASHER`` picks the algorithm new hashes are made with: ``pbkdf2``
+(default) or ``argon2`` (needs argon2-cffi). The other algorithms stay
+listed, so existing hashes keep verifying and are rewritten with the
+preferred hasher and parameters on the user's next successful login.
+
+Cost parameters: ``PBKDF2_ITERATIONS``, ``ARGON2_TIME_COST``,
+``ARGON2_MEMORY_COST`` (KiB) and ``ARGON2_PARALLELISM``. Unset values keep
+Django's defaults.
+"""
+import importlib.util
+import os
+import warnings
+
+HASHERS = {
+    'pbkdf2': 'users.hashers.TunedPBKDF2PasswordHasher',
+    'argon2': 'users.hashers.TunedArgon2PasswordHasher',
+}
+FALLBACK_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
+def password_hashers(environ=os.environ):
+    preferred = environ.get('PASSWORD_HASHER', 'pbkdf2').lower()
+    if preferred not in HASHERS:
+        raise ValueError(f"Unsupported PASSWORD_HASHER '{preferred}' (expected {' or '.join(HASHERS)})")
+    if preferred == 'argon2' and not importlib.util.find_spec('argon2'):
+        warnings.warn("PASSWORD_HASHER=argon2 but argon2-cffi is not installed; using pbkdf2")
+        preferred = 'pbkdf2'
+    others = [path for name, path in HASHERS.items() if name != preferred]
+    return [HASHERS[preferred], *others, *FALLBACK_HASHERS]
+
+
+def hasher_options(environ=os.environ):
+    names = {
+        'PBKDF2_ITERATIONS': 'iterations',
+        'ARGON2_TIME_COST': 'time_cost',
+        'ARGON2_MEMORY_COST': 'memory_cost',
+        'ARGON2_PARALLELISM': 'parallelism',
+    }
+    return {option: int(environ[name]) for name, option in names.items() if environ.get(name)}
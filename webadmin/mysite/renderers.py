@@ -0,0 +1,56 @@
+"""
+JSON rendering for the API.
+
+``FastJSONRenderer`` encodes with orjson when it is installed, several times
+faster than the stdlib encoder behind DRF's ``JSONRenderer``, and produces
+the same bytes: compact UTF-8 with U+2028/U+2029 escaped, and anything orjson
+does not handle natively (datetimes, decimals, lazy strings) converted by
+DRF's encoder. ``API_JSON_ENCODER=stdlib``, indented output (``Accept:
+application/json; indent=2``) and non-default ``UNICODE_JSON``/
+``COMPACT_JSON`` settings go through ``JSONRenderer`` itself.
+"""
+import warnings
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional, see requirements.txt.
+    orjson = None
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+_warned = False
+
+
+def orjson_enabled():
+    global _warned
+    if getattr(settings, 'API_JSON_ENCODER', 'orjson') != 'orjson':
+        return False
+    if orjson is None:
+        if not _warned:
+            warnings.warn("API_JSON_ENCODER=orjson but orjson is not installed; using the stdlib encoder")
+            _warned = True
+        return False
+    return True
+
+
+class FastJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        fast = (
+            orjson_enabled() and not self.ensure_ascii and self.compact
+            and not self.get_indent(accepted_media_type, renderer_context or {})
+        )
+        if not fast:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data, default=JSONEncoder().default, option=ORJSON_OPTIONS)
+        except TypeError:
+            # Integers beyond 64 bits, keys orjson cannot stringify...
+            return super().render(data, accepted_media_type, renderer_context)
+        # Valid JSON but not valid JavaScript, as JSONRenderer does.
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
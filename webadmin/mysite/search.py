@@ -0,0 +1,112 @@
+"""
+Full-text search over articles and programs.
+
+* MySQL: a ``FULLTEXT`` index queried with ``MATCH ... AGAINST`` in natural
+  language mode; the match score is the rank.
+* SQLite (bundled db.sqlite3, tests): an external-content FTS5 table kept in
+  sync with the source table by triggers, ranked by ``bm25()``.
+* Anything else: unranked ``icontains`` matching, as before.
+
+The indexes are created by migrations with ``create_search_index``. SQLite
+rebuilds a table for some schema changes, which drops its triggers; run
+``manage.py rebuild_search_index`` after such a migration. Queries are
+reduced to plain words, so search input never reaches an FTS parser.
+"""
+import re
+from collections import namedtuple
+
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import BaseFilterBackend
+
+SearchIndex = namedtuple('SearchIndex', 'name model columns')
+
+ARTICLE_INDEX = SearchIndex('article_search', 'articles.Article', ('title', 'search_text'))
+PROGRAM_INDEX = SearchIndex('programs_search', 'programs.Programs', ('title', 'description', 'category'))
+SEARCH_INDEXES = (ARTICLE_INDEX, PROGRAM_INDEX)
+
+MAX_TERMS = 16
+_term_re = re.compile(r'\w+')
+
+
+def search_terms(query):
+    return _term_re.findall(query or '')[:MAX_TERMS]
+
+
+def search(queryset, index, query):
+    """
+    ``queryset`` narrowed to rows matching ``query`` through ``index``,
+    annotated with ``search_rank`` and ordered best match first.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+    model = queryset.model
+    vendor = connections[queryset.db].vendor
+    qn = connections[queryset.db].ops.quote_name
+    table = qn(model._meta.db_table)
+
+    if vendor == 'mysql':
+        columns = ', '.join(f'{table}.{qn(column)}' for column in index.columns)
+        rank = RawSQL(f'MATCH ({columns}) AGAINST (%s IN NATURAL LANGUAGE MODE)', [' '.join(terms)], output_field=FloatField())
+        return queryset.annotate(search_rank=rank).filter(search_rank__gt=0).order_by('-search_rank', 'pk')
+
+    if vendor == 'sqlite':
+        fts, pk = qn(index.name), qn(model._meta.pk.column)
+        match = ' OR '.join(f'"{term}"' for term in terms)
+        # bm25() is lower for better matches.
+        rank = RawSQL(
+            f'SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND rowid = {table}.{pk}',
+            [match], output_field=FloatField(),
+        )
+        matches = RawSQL(f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [match])
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank).order_by('-search_rank', 'pk')
+
+    condition = Q()
+    for term in terms:
+        for column in index.columns:
+            condition |= Q(**{f'{column}__icontains': term})
+    return queryset.filter(condition).annotate(search_rank=RawSQL('0', [], output_field=FloatField())).order_by('pk')
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """``SearchFilter`` replacement: ``?search=`` through the view's ``search_index``."""
+    search_param = 'search'
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+        return search(queryset, view.search_index, query)
+
+
+def create_search_index(schema_editor, name, table, columns):
+    """Migration helper creating the full-text index ``name`` on ``table``."""
+    vendor = schema_editor.connection.vendor
+    qn = schema_editor.quote_name
+    if vendor == 'mysql':
+        schema_editor.execute(f'CREATE FULLTEXT INDEX {qn(name)} ON {qn(table)} ({", ".join(map(qn, columns))})')
+    elif vendor == 'sqlite':
+        fts, source = qn(name), qn(table)
+        cols = ', '.join(map(qn, columns))
+        new_values = ', '.join(f'new.{qn(column)}' for column in columns)
+        old_values = ', '.join(f'old.{qn(column)}' for column in columns)
+        delete_old = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old_values});"
+        insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});"
+        schema_editor.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content={source}, content_rowid='id')")
+        schema_editor.execute(f'CREATE TRIGGER {qn(name + "_ai")} AFTER INSERT ON {source} BEGIN {insert_new} END')
+        schema_editor.execute(f'CREATE TRIGGER {qn(name + "_ad")} AFTER DELETE ON {source} BEGIN {delete_old} END')
+        schema_editor.execute(f'CREATE TRIGGER {qn(name + "_au")} AFTER UPDATE ON {source} BEGIN {delete_old} {insert_new} END')
+        schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def drop_search_index(schema_editor, name, table):
+    vendor = schema_editor.connection.vendor
+    qn = schema_editor.quote_name
+    if vendor == 'mysql':
+        schema_editor.execute(f'DROP INDEX {qn(name)} ON {qn(table)}')
+    elif vendor == 'sqlite':
+        for suffix in ('_ai', '_ad', '_au'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {qn(name + suffix)}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {qn(name)}')
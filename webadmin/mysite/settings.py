@@ -13,6 +13,9 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import os
 
+from .database import database_config
+from .passwords import hasher_options, password_hashers
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -44,11 +47,16 @@ INSTALLED_APPS = [
     'users',
     'site_settings',
     'teams',
-    'programs'
+    'programs',
+    'changes',
+    'images',
+    'staticsite',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # Compresses what every middleware below produced.
+    'mysite.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -81,26 +89,54 @@ WSGI_APPLICATION = 'mysite.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Built from the environment, see mysite/database.py. For a local XAMPP
+# server set MYSQL_UNIX_SOCKET=/Applications/XAMPP/xamppfiles/var/mysql/mysql.sock
+
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.mysql',
-        # 'NAME': 'website_dashboard',
-        # 'USER': 'root',
-        # 'PASSWORD': '',
-        # 'HOST': 'localhost',
-        # 'PORT': '3306',
-        'NAME': os.environ['MYSQL_DATABASE'],
-        'USER': os.environ['MYSQL_USER'],
-        'PASSWORD': os.environ['MYSQL_PASSWORD'],
-        'HOST': os.environ['MYSQL_HOST'],
-        'PORT': os.environ.get('MYSQL_PORT', '3306'),
-        'OPTIONS': {
-            'unix_socket': '/Applications/XAMPP/xamppfiles/var/mysql/mysql.sock',
-        },
-    }
+    'default': database_config(BASE_DIR),
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory by default; set REDIS_URL (redis-py, see requirements.txt) to
+# share the cache, and the API cache generations, between workers.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'webadmin',
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
+# Public API responses are invalidated by model signals (see mysite/cache.py);
+# the timeout only bounds how long unreachable entries linger.
+API_CACHE_ENABLED = os.environ.get('API_CACHE_ENABLED', 'true').lower() == 'true'
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 60 * 60 * 24))
+
+
+# /api/changes/ only returns rows stamped at least this many seconds ago
+# (so slow commits are not skipped) and accepts tokens up to this old.
+CHANGES_SETTLE_SECONDS = int(os.environ.get('CHANGES_SETTLE_SECONDS', 2))
+CHANGES_RETENTION_DAYS = int(os.environ.get('CHANGES_RETENTION_DAYS', 30))
+
+# How /api/events/ notifications reach other workers: 'local' (one process)
+# or 'redis' (pub/sub on REDIS_URL). See changes/events.py.
+EVENTS_BACKEND = {
+    'local': 'changes.events.LocalBackend',
+    'redis': 'changes.events.RedisBackend',
+}[os.environ.get('EVENTS_BACKEND', 'local')]
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -119,6 +155,14 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Hashers and cost parameters come from the environment (see
+# mysite/passwords.py); outdated hashes are upgraded on login.
+PASSWORD_HASHERS = password_hashers()
+PASSWORD_HASHER_OPTIONS = hasher_options()
+
+# Loads the profile and role in the same query as the user at login.
+AUTHENTICATION_BACKENDS = ['users.backends.ProfileModelBackend']
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -138,29 +182,75 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Uploaded and resized images (images app), served by nginx from MEDIA_ROOT.
+# Set MEDIA_URL to nginx's absolute URL (http://host:8080/media/) when the API
+# is reached on another port.
+MEDIA_URL = os.environ.get('MEDIA_URL', '/media/')
+MEDIA_ROOT = os.environ.get('MEDIA_ROOT') or os.path.join(BASE_DIR, 'media')
+
+# Dotted path to the fetch(url) -> bytes callable used for remote images.
+IMAGE_FETCHER = 'images.pipeline.fetch_url'
+IMAGE_FETCH_TIMEOUT = int(os.environ.get('IMAGE_FETCH_TIMEOUT', 10))
+IMAGE_MAX_BYTES = int(os.environ.get('IMAGE_MAX_BYTES', 32 * 1024 * 1024))
+
+# Directory nginx serves the pre-rendered public site from (staticsite app).
+# When set, saving articles, team members or header settings re-renders the
+# affected pages; unset, nothing is pre-rendered.
+STATIC_SITE_ROOT = os.environ.get('STATIC_SITE_ROOT') or None
+# Re-render in a background thread after the transaction commits, rather
+# than inside the request that made the write.
+STATIC_SITE_IN_BACKGROUND = os.environ.get('STATIC_SITE_IN_BACKGROUND', 'true').lower() == 'true'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Responses of at least this many bytes are gzip/brotli compressed when the
+# client accepts it (see mysite/compression.py).
+COMPRESSION_MIN_BYTES = int(os.environ.get('COMPRESSION_MIN_BYTES', 1024))
+
+# 'orjson' (when installed) or 'stdlib', see mysite/renderers.py.
+API_JSON_ENCODER = os.environ.get('API_JSON_ENCODER', 'orjson')
+
 # Django REST Framework settings
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'mysite.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.AllowAny',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.ClaimsJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
         'rest_framework.authentication.BasicAuthentication',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'mysite.pagination.StandardPagination',
     'PAGE_SIZE': 10
 }
 
 # JWT Settings
 from datetime import timedelta
+
+# Trust the staff flag and role signed into tokens instead of loading the
+# user on every request (see users/authentication.py). Tokens without those
+# claims load the user, cached per process for JWT_USER_CACHE_TTL seconds.
+JWT_STATELESS_AUTH = os.environ.get('JWT_STATELESS_AUTH', 'true').lower() == 'true'
+JWT_USER_CACHE_TTL = int(os.environ.get('JWT_USER_CACHE_TTL', 0))
+
+# Revoked refresh tokens live in the cache until they expire; also keep them
+# in the RevokedToken table unless every worker shares a durable cache.
+JWT_REVOCATION_DB = os.environ.get('JWT_REVOCATION_DB', 'true').lower() == 'true'
+
+# Claims in an access token stay trusted for its whole lifetime; staff-only
+# routes re-check the account (users/permissions.py). Lower this once every
+# client refreshes its tokens (refresh tokens rotate).
+JWT_ACCESS_TOKEN_MINUTES = int(os.environ.get('JWT_ACCESS_TOKEN_MINUTES', 60 * 24))
+
 SIMPLE_JWT = {
-    'ACCESS_TOKEN_LIFETIME': timedelta(hours=24),
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=JWT_ACCESS_TOKEN_MINUTES),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
@@ -181,6 +271,7 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
     'TOKEN_USER_CLASS': 'rest_framework_simplejwt.models.TokenUser',
     'JTI_CLAIM': 'jti',
+    'TOKEN_REFRESH_SERIALIZER': 'users.revocation.RevocableTokenRefreshSerializer',
     'SLIDING_TOKEN_REFRESH_EXP_CLAIM': 'refresh_exp',
     'SLIDING_TOKEN_LIFETIME': timedelta(hours=1),
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
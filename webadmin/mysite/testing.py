@@ -0,0 +1,80 @@
+import json
+import re
+
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from rest_framework.mixins import ListModelMixin
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .rows import RowListMixin
+
+_sqlite_full_scan_re = re.compile(r'\bSCAN (?!.*\bUSING\b.*\bINDEX\b)\S+\s*$')
+
+
+def list_queryset(viewset_class, query=None):
+    """
+    The queryset a viewset's ``list`` action would evaluate for ``query``,
+    after its filter backends (search, ordering) are applied.
+    """
+    request = Request(APIRequestFactory().get('/', query or {}))
+    view = viewset_class(action='list', request=request, format_kwarg=None, args=(), kwargs={})
+    return view.filter_queryset(view.get_queryset())
+
+
+class QueryCountAssertionsMixin:
+    """
+    TestCase mixin that guards list endpoints against N+1 queries: the
+    number of queries must not depend on how many rows are on the page.
+    """
+
+    def assertListQueryCount(self, url, expected, page_sizes=(1, 5, 20)):
+        for page_size in page_sizes:
+            with self.subTest(page_size=page_size), self.assertNumQueries(expected):
+                response = self.client.get(url, {'page_size': page_size})
+                self.assertEqual(response.status_code, 200)
+
+
+class QueryPlanAssertionsMixin:
+    """
+    TestCase mixin that inspects the database's query plan (EXPLAIN), so a
+    model or view change that stops a list query from using its index fails
+    the build instead of quietly turning into a full scan and filesort.
+    """
+
+    def assertIndexedPlan(self, queryset):
+        if connection.vendor == 'sqlite':
+            plan = queryset.explain()
+            lines = plan.splitlines()
+            problems = [line for line in lines if 'USE TEMP B-TREE' in line or _sqlite_full_scan_re.search(line)]
+        elif connection.vendor == 'mysql':
+            plan = queryset.explain(format='json')
+            problems = []
+            if '"using_filesort": true' in plan:
+                problems.append('filesort')
+            for table in re.findall(r'"access_type": "(\w+)"', plan):
+                if table == 'ALL':
+                    problems.append('full table scan')
+            plan = json.dumps(json.loads(plan), indent=2)
+        else:
+            self.skipTest(f"No query plan checks for the {connection.vendor} backend")
+        if problems:
+            self.fail(f"Query is not served by an index ({', '.join(problems)}):\n{queryset.query}\n{plan}")
+
+
+class RowParityAssertionsMixin:
+    """
+    TestCase mixin checking that a ``RowListMixin`` list endpoint renders
+    exactly the bytes its serializer would (see mysite/rows.py).
+    """
+
+    def assertRowParity(self, url, query=None):
+        with override_settings(API_CACHE_ENABLED=False):
+            rows = self.client.get(url, query)
+            with mock.patch.object(RowListMixin, 'list', ListModelMixin.list):
+                serialized = self.client.get(url, query)
+        self.assertEqual(rows.status_code, 200)
+        self.assertEqual(rows.content, serialized.content)
+        return rows
@@ -0,0 +1,243 @@
+"""
+NDJSON / CSV export and import of the content models.
+
+Exports walk the table in primary-key order, ``chunk_size`` rows per query,
+and yield one line at a time, so memory stays flat whatever the table size
+(MySQL client cursors buffer a whole result set, which rules out a single
+``iterator()`` query there). Imports upsert in batches, keeping primary keys
+and creation timestamps, and report a checkpoint after every committed batch
+so an interrupted import can resume where it stopped.
+
+Imported rows are stamped with the import time (``auto_now`` fields) and
+``post_save`` is sent for each of them, so /api/changes/, the event stream,
+the pre-rendered site and the API cache all see the import like any other
+write. From a management command that only reaches the running servers
+through a shared cache and event backend (``REDIS_URL``,
+``EVENTS_BACKEND=redis``).
+"""
+import csv
+import json
+from itertools import islice
+
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connections, models, router, transaction
+from django.utils import timezone
+
+from changes.feed import FEED_MODELS
+from changes.models import Tombstone
+from mysite.bulk import _send_post_save
+from mysite.cache import bump_generation
+
+# Export name -> (model label, cache namespace invalidated by an import).
+TRANSFER_MODELS = {
+    'articles': ('articles.Article', 'articles'),
+    'team-members': ('teams.TeamMember', 'teams'),
+    'programs': ('programs.Programs', 'programs'),
+    'header-settings': ('site_settings.HeaderSettings', 'site_settings'),
+    'roles': ('users.Role', 'users'),
+    'profiles': ('users.UserProfile', 'users'),
+}
+FORMATS = ('ndjson', 'csv')
+EXPORT_CHUNK_SIZE = 1000
+IMPORT_BATCH_SIZE = 500
+
+
+class TransferError(ValueError):
+    pass
+
+
+def get_transfer_model(name):
+    try:
+        label, _ = TRANSFER_MODELS[name]
+    except KeyError:
+        raise TransferError(f"Unknown model '{name}'. Choose from: {', '.join(TRANSFER_MODELS)}")
+    return apps.get_model(label)
+
+
+def check_format(fmt):
+    if fmt not in FORMATS:
+        raise TransferError(f"Unknown format '{fmt}'. Choose from: {', '.join(FORMATS)}")
+    return fmt
+
+
+def export_columns(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+class CSVRecord(dict):
+    """A record read from CSV: every value is text, JSON fields' included."""
+
+
+def iter_rows(model, chunk_size=EXPORT_CHUNK_SIZE):
+    """Every row of ``model`` as a tuple of ``export_columns`` values."""
+    columns = export_columns(model)
+    pk_index = columns.index(model._meta.pk.attname)
+    queryset = model._base_manager.order_by('pk').values_list(*columns)
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        rows = list(chunk[:chunk_size])
+        yield from rows
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][pk_index]
+
+
+class _ExportEncoder(DjangoJSONEncoder):
+    def default(self, o):
+        # DjangoJSONEncoder trims datetimes to milliseconds; keep them exact.
+        if hasattr(o, 'isoformat') and not isinstance(o, str):
+            return o.isoformat()
+        return super().default(o)
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def export_lines(name, fmt, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the export of ``name`` as text lines (each ending in a newline)."""
+    model = get_transfer_model(name)
+    check_format(fmt)
+    columns = export_columns(model)
+    if fmt == 'csv':
+        writer = csv.writer(_Echo())
+        encoder = _ExportEncoder(separators=(',', ':'))
+        json_fields = [isinstance(field, models.JSONField) for field in model._meta.concrete_fields]
+        yield writer.writerow(columns)
+        for row in iter_rows(model, chunk_size):
+            yield writer.writerow([
+                '' if value is None else encoder.encode(value) if is_json else _csv_value(value)
+                for value, is_json in zip(row, json_fields)
+            ])
+    else:
+        encoder = _ExportEncoder(separators=(',', ':'))
+        for row in iter_rows(model, chunk_size):
+            yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+
+def _csv_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def parse_lines(fmt, lines):
+    """Records (dicts) from NDJSON or CSV text lines."""
+    check_format(fmt)
+    if fmt == 'csv':
+        yield from map(CSVRecord, csv.DictReader(lines))
+        return
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            raise TransferError(f"Line {number}: invalid JSON ({exc})")
+        if not isinstance(record, dict):
+            raise TransferError(f"Line {number}: expected a JSON object")
+        yield record
+
+
+def build_instance(model, record):
+    values = {}
+    for field in model._meta.concrete_fields:
+        if field.attname not in record:
+            # Missing creation timestamps default to now (auto_now ones
+            # are stamped on insert anyway).
+            if getattr(field, 'auto_now_add', False):
+                values[field.attname] = timezone.now()
+            continue
+        value = record[field.attname]
+        if value == '' and field.null:
+            value = None
+        try:
+            if isinstance(field, models.JSONField) and isinstance(record, CSVRecord) and value is not None:
+                value = json.loads(value)
+            values[field.attname] = None if value is None else field.to_python(value)
+        except Exception as exc:
+            raise TransferError(f"{field.attname}: {exc}")
+    return model(**values)
+
+
+def import_records(name, records, batch_size=IMPORT_BATCH_SIZE, skip=0, on_checkpoint=None):
+    """
+    Upsert ``records`` into the ``name`` model in batches of ``batch_size``,
+    one transaction per batch. The first ``skip`` records are ignored (they
+    were committed by a previous run). ``on_checkpoint`` is called with the
+    number of records committed so far after every batch. Returns that count.
+    """
+    model = get_transfer_model(name)
+    _, namespace = TRANSFER_MODELS[name]
+    records = islice(records, skip, None)
+    done = skip
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        instances = []
+        for offset, record in enumerate(batch, start=done + 1):
+            try:
+                instances.append(build_instance(model, record))
+            except TransferError as exc:
+                raise TransferError(f"Record {offset}: {exc}")
+        try:
+            with transaction.atomic(using=router.db_for_write(model)):
+                _upsert(model, instances)
+        except DatabaseError as exc:
+            raise TransferError(f"Records {done + 1}-{done + len(batch)}: {exc}")
+        bump_generation(namespace)
+        done += len(batch)
+        if on_checkpoint:
+            on_checkpoint(done)
+    return done
+
+
+def _upsert(model, instances):
+    """
+    ``bulk_create`` that updates rows whose primary key already exists, then
+    sends ``post_save`` for every row. ``auto_now_add`` timestamps are kept
+    as exported; ``bulk_create`` stamps them like any insert, so they are
+    written back afterwards.
+    """
+    using = router.db_for_write(model)
+    connection = connections[using]
+    pk = model._meta.pk
+    fields = list(model._meta.concrete_fields)
+    created_stamps = [field for field in fields if getattr(field, 'auto_now_add', False)]
+    exported_stamps = [[getattr(instance, field.attname) for field in created_stamps] for instance in instances]
+    manager = model._base_manager.using(using)
+
+    with_pk = [instance for instance in instances if instance.pk is not None]
+    without_pk = [instance for instance in instances if instance.pk is None]
+    existing = set(manager.filter(pk__in=[instance.pk for instance in with_pk]).values_list('pk', flat=True))
+    if with_pk:
+        manager.bulk_create(
+            with_pk, update_conflicts=True,
+            update_fields=[field.name for field in fields if not field.primary_key],
+            unique_fields=[pk.name] if connection.features.supports_update_conflicts_with_target else None,
+        )
+    if without_pk:
+        if connection.features.can_return_rows_from_bulk_insert:
+            manager.bulk_create(without_pk)
+        else:
+            # Without RETURNING (MySQL) the new primary keys are unknown
+            # after bulk_create, see BulkModelMixin.perform_bulk_create.
+            for instance in without_pk:
+                instance.save(using=using)
+
+    if created_stamps:
+        for instance, stamps in zip(instances, exported_stamps):
+            for field, value in zip(created_stamps, stamps):
+                setattr(instance, field.attname, value)
+        manager.bulk_update(instances, [field.name for field in created_stamps])
+
+    created = [instance for instance in with_pk if instance.pk not in existing]
+    if model in FEED_MODELS and created:
+        # Rows imported back after a deletion are no longer deleted.
+        Tombstone.objects.filter(feed=FEED_MODELS[model], object_id__in=[instance.pk for instance in created]).delete()
+    _send_post_save(model, [instance for instance in with_pk if instance.pk in existing], created=False)
+    if connection.features.can_return_rows_from_bulk_insert:
+        created += without_pk  # save() already sent post_save for the others.
+    _send_post_save(model, created, created=True)
@@ -14,18 +14,39 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenRefreshView
 import os
+from . import async_views, views
+
+# Async (ASGI) mirrors of the public read endpoints, see mysite/async_views.py.
+async_urlpatterns = [
+    path('public-articles/', async_views.public_articles, name='async-public-articles'),
+    path('articles/<slug:slug>/', async_views.article_detail, name='async-article-detail'),
+    path('team-members/', async_views.team_members, name='async-team-members'),
+    path('programs/', async_views.programs, name='async-programs'),
+    path('header-settings/active/', async_views.header_settings, name='async-header-settings'),
+]
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('healthz/db', views.db_health, name='healthz-db'),
+    path('api/search/', views.SearchView.as_view(), name='search'),
+    path('api/async/', include(async_urlpatterns)),
     path('', include('articles.urls')),
     path('api/', include('users.urls')),
     path('api/', include('site_settings.urls')),
     path('api/', include('teams.urls')),
     path('api/', include('programs.urls')),
+    path('api/', include('changes.urls')),
+    path('api/', include('images.urls')),
     path('api/', include('articles.urls')),
     path('api/auth/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
 ]
+
+# nginx serves MEDIA_ROOT in production.
+if settings.DEBUG:
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
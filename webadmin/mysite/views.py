@@ -0,0 +1,70 @@
+import logging
+import time
+
+from django.db import DatabaseError, connection
+from django.http import JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+
+from articles.models import Article
+from articles.serializers import ArticleCardSerializer
+from mysite.cache import CachedReadMixin
+from mysite.search import ARTICLE_INDEX, PROGRAM_INDEX, search
+from programs.models import Programs
+from programs.serializers import OnGoingProgramsSerializer
+
+logger = logging.getLogger(__name__)
+
+
+@never_cache
+@require_GET
+def db_health(request):
+    """
+    Database readiness probe: runs ``SELECT 1`` on the request's (possibly
+    persistent) connection and answers 503 if the database is unreachable.
+    """
+    started = time.perf_counter()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+    except DatabaseError:
+        # The probe is public: the details (host, driver error) go to the log only.
+        logger.exception("Database health check failed")
+        return JsonResponse({'status': 'error'}, status=503)
+    return JsonResponse({
+        'status': 'ok',
+        'vendor': connection.vendor,
+        'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+    })
+
+
+class SearchView(CachedReadMixin, generics.ListAPIView):
+    """
+    ``GET /api/search/?q=<words>&type=articles|programs``: published articles
+    (the default) or active programs matching any of the words, best match
+    first, paginated like the other list endpoints.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    cache_namespaces = ('articles', 'programs')
+    types = ('articles', 'programs')
+
+    def get_type(self):
+        kind = self.request.query_params.get('type', 'articles')
+        if kind not in self.types:
+            raise ValidationError({'type': [f"Choose from: {', '.join(self.types)}"]})
+        return kind
+
+    def get_queryset(self):
+        query = self.request.query_params.get('q', '')
+        if self.get_type() == 'programs':
+            return search(Programs.objects.filter(active=True), PROGRAM_INDEX, query)
+        articles = Article.objects.filter(published=True).defer(*Article.LIST_DEFERRED_FIELDS)  # type: ignore
+        return search(articles, ARTICLE_INDEX, query)
+
+    def get_serializer_class(self):
+        return OnGoingProgramsSerializer if self.get_type() == 'programs' else ArticleCardSerializer
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-18 13:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='programs',
+            index=models.Index(fields=['order', 'id'], name='programs_order_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:10
+
+from django.db import migrations
+
+from mysite.search import create_search_index, drop_search_index
+
+
+def create_index(apps, schema_editor):
+    create_search_index(schema_editor, 'programs_search', 'programs_programs', ['title', 'description', 'category'])
+
+
+def drop_index(apps, schema_editor):
+    drop_search_index(schema_editor, 'programs_search', 'programs_programs')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0002_programs_programs_order_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
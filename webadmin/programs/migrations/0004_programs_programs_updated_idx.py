@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('programs', '0003_programs_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='programs',
+            index=models.Index(fields=['updated_at', 'id'], name='programs_updated_idx'),
+        ),
+    ]
@@ -16,3 +16,9 @@ class Programs(models.Model):
     
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            # OnGoingProgramsViewSet orders by ``order`` (and keyset on id).
+            models.Index(fields=['order', 'id'], name='programs_order_idx'),
+            # /api/changes/ reads rows stamped after a watermark.
+            models.Index(fields=['updated_at', 'id'], name='programs_updated_idx'),
+        ]
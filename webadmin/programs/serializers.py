@@ -1,7 +1,11 @@
 from rest_framework import serializers
+from mysite.rows import RowReader
 from .models import Programs
 
 class OnGoingProgramsSerializer(serializers.ModelSerializer):
     class Meta:
         model = Programs
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+
+
+PROGRAM_ROWS = RowReader(OnGoingProgramsSerializer)
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mysite.cache import bump_generation_on_commit
+from .models import Programs
+
+
+@receiver([post_save, post_delete], sender=Programs)
+def invalidate_programs_cache(sender, **kwargs):
+    bump_generation_on_commit('programs')
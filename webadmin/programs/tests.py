@@ -1,3 +1,105 @@
+import json
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-# Create your tests here.
+from mysite.testing import QueryPlanAssertionsMixin, RowParityAssertionsMixin, list_queryset
+from users.authentication import issue_tokens
+from .models import Programs
+from .views import OnGoingProgramsViewSet
+
+
+class ProgramsQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_program_list_uses_index(self):
+        self.assertIndexedPlan(list_queryset(OnGoingProgramsViewSet)[:10])
+
+
+class ProgramsPaginationTests(TestCase):
+    def test_ordering_is_rejected_in_cursor_mode(self):
+        Programs.objects.create(title='Program', description='About', category='Health')
+        self.assertEqual(self.client.get('/api/programs/', {'ordering': 'title'}).status_code, 200)
+        response = self.client.get('/api/programs/', {'cursor': '', 'ordering': 'title'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ordering', response.json())
+
+
+class AsyncProgramsTests(TestCase):
+    def test_page_handling_matches_drf_endpoint(self):
+        Programs.objects.bulk_create(
+            [Programs(title=f'Program {index}', description='About', category='Health', order=index) for index in range(15)]
+        )
+        for page in ('', '1', '2', 'last', '3', '0', '-1', 'abc', '1.5'):
+            with self.subTest(page=page):
+                drf = self.client.get('/api/programs/', {'page': page})
+                async_view = self.client.get('/api/async/programs/', {'page': page})
+                self.assertEqual(async_view.status_code, drf.status_code)
+                if drf.status_code == 200:
+                    # Same page; the links differ by the /api/async/ prefix.
+                    self.assertEqual(async_view.json()['results'], drf.json()['results'])
+                    self.assertEqual(async_view.json()['count'], drf.json()['count'])
+                else:
+                    self.assertEqual(async_view.json(), drf.json())
+
+
+class ProgramsBulkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.editor = User.objects.create_user(username='editor')
+
+    def bulk(self, method, payload, authenticated=True):
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {issue_tokens(self.editor).access_token}'} if authenticated else {}
+        return getattr(self.client, method)(
+            '/api/programs/bulk/', json.dumps(payload), content_type='application/json', **headers
+        )
+
+    def test_bulk_requires_authentication(self):
+        program = Programs.objects.create(title='Program', description='About', category='Health')
+        self.assertEqual(self.bulk('delete', {'ids': [program.pk]}, authenticated=False).status_code, 401)
+        self.assertTrue(Programs.objects.filter(pk=program.pk).exists())
+
+    def test_bulk_create(self):
+        response = self.bulk('post', [
+            {'title': f'Program {index}', 'description': 'About', 'category': 'Health'} for index in range(5)
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Programs.objects.count(), 5)
+
+    def test_reorder_is_one_request_and_constant_queries(self):
+        Programs.objects.bulk_create(
+            [Programs(title=f'Program {index}', description='About', category='Health') for index in range(200)]
+        )
+        ids = list(Programs.objects.values_list('id', flat=True))
+        # Lookup, transaction savepoint, one UPDATE, release.
+        with self.assertNumQueries(4):
+            response = self.bulk('patch', [{'id': pk, 'order': len(ids) - index} for index, pk in enumerate(ids)])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Programs.objects.order_by('order').first().pk, ids[-1])
+
+    def test_invalid_items_write_nothing_and_report_per_item_errors(self):
+        program = Programs.objects.create(title='Program', description='About', category='Health')
+        response = self.bulk('patch', [{'id': program.pk, 'order': 5}, {'id': 0, 'order': 1}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()[0], {})
+        self.assertIn('id', response.json()[1])
+        program.refresh_from_db()
+        self.assertEqual(program.order, 0)
+
+    def test_bulk_delete(self):
+        program = Programs.objects.create(title='Program', description='About', category='Health')
+        response = self.bulk('delete', {'ids': [program.pk, 0]})
+        self.assertEqual(response.json(), {'deleted': 1, 'not_found': [0]})
+
+
+class ProgramsRowParityTests(RowParityAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Programs.objects.bulk_create([
+            Programs(title=f'Program {index}', description='Après-school\u2029 clubs', category='Health', order=index % 3, active=bool(index % 2))
+            for index in range(6)
+        ])
+
+    def test_list_matches_serializer(self):
+        self.assertRowParity('/api/programs/')
+        self.assertRowParity('/api/programs/', {'ordering': '-title'})
+        self.assertRowParity('/api/programs/', {'search': 'clubs'})
+        self.assertRowParity('/api/programs/', {'cursor': '', 'page_size': 4})
@@ -1,16 +1,30 @@
 from django.shortcuts import render
 from rest_framework import viewsets, filters
 from rest_framework.permissions import AllowAny
-from .serializers import OnGoingProgramsSerializer
+from .serializers import PROGRAM_ROWS, OnGoingProgramsSerializer
 from .models import Programs
+from mysite.bulk import BulkModelMixin
+from mysite.cache import CachedReadMixin
+from mysite.conditional import ConditionalGetMixin
+from mysite.pagination import KeysetPagination
+from mysite.rows import RowListMixin
+from mysite.search import PROGRAM_INDEX, FullTextSearchFilter
 # Create your views here.
 
-class OnGoingProgramsViewSet(viewsets.ModelViewSet):
+class OnGoingProgramsViewSet(BulkModelMixin, ConditionalGetMixin, CachedReadMixin, RowListMixin, viewsets.ModelViewSet):
     queryset = Programs.objects.all()
     serializer_class = OnGoingProgramsSerializer
+    # list() is built from values() rows, see mysite/rows.py.
+    row_reader = PROGRAM_ROWS
     permission_classes = [AllowAny]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['title', 'description', 'category']
+    # ?search= is ranked through the full-text index (see mysite/search.py),
+    # so it comes after OrderingFilter and its order wins.
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
+    search_index = PROGRAM_INDEX
     ordering_fields = ['order', 'created_at', 'title']
     ordering = ['order']
+    pagination_class = KeysetPagination
+    # Cursor pages follow the default list order rather than created_at.
+    cursor_ordering = ('order', 'id')
+    cache_namespaces = ('programs',)
 
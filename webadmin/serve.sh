@@ -0,0 +1,33 @@
+#!/bin/sh
+# Start the backend. SERVER_MODE picks the deployment profile:
+#   wsgi (default)  gunicorn sync workers, mysite.wsgi
+#   asgi            gunicorn with uvicorn workers, mysite.asgi (async views)
+set -e
+
+# The API cache and the event broker are per-process unless REDIS_URL is
+# set: with several workers a save would only invalidate one of them.
+if [ -n "$REDIS_URL" ]; then
+  WORKERS="${WEB_CONCURRENCY:-3}"
+else
+  WORKERS="${WEB_CONCURRENCY:-1}"
+fi
+BIND="${BIND:-0.0.0.0:8000}"
+
+# Pre-render the public site; saves keep it current from then on.
+if [ -n "$STATIC_SITE_ROOT" ]; then
+  python manage.py build_static_site || echo "Pre-rendering failed; nginx falls back to the dynamic pages" >&2
+fi
+
+case "${SERVER_MODE:-wsgi}" in
+  asgi)
+    exec gunicorn mysite.asgi:application --bind "$BIND" --workers "$WORKERS" \
+      --worker-class uvicorn.workers.UvicornWorker
+    ;;
+  wsgi)
+    exec gunicorn mysite.wsgi:application --bind "$BIND" --workers "$WORKERS"
+    ;;
+  *)
+    echo "Unknown SERVER_MODE '$SERVER_MODE' (expected wsgi or asgi)" >&2
+    exit 1
+    ;;
+esac
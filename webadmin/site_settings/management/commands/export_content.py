@@ -0,0 +1,26 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from mysite.transfer import EXPORT_CHUNK_SIZE, FORMATS, TRANSFER_MODELS, TransferError, export_lines
+
+
+class Command(BaseCommand):
+    help = "Stream a content model to NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', choices=list(TRANSFER_MODELS))
+        parser.add_argument('--format', dest='fmt', choices=FORMATS, default='ndjson')
+        parser.add_argument('--output', '-o', help="File to write (default: stdout)")
+        parser.add_argument('--chunk-size', type=int, default=EXPORT_CHUNK_SIZE, help="Rows read per query")
+
+    def handle(self, *args, **options):
+        output = open(options['output'], 'w', newline='', encoding='utf-8') if options['output'] else sys.stdout
+        try:
+            for line in export_lines(options['model'], options['fmt'], options['chunk_size']):
+                output.write(line)
+        except TransferError as exc:
+            raise CommandError(str(exc))
+        finally:
+            if output is not sys.stdout:
+                output.close()
@@ -0,0 +1,57 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from mysite.transfer import FORMATS, IMPORT_BATCH_SIZE, TRANSFER_MODELS, TransferError, import_records, parse_lines
+
+
+class Command(BaseCommand):
+    help = "Import a content model from NDJSON or CSV, upserting by primary key"
+
+    def add_arguments(self, parser):
+        parser.add_argument('model', choices=list(TRANSFER_MODELS))
+        parser.add_argument('input', help="File to read")
+        parser.add_argument('--format', dest='fmt', choices=FORMATS, help="Default: guessed from the file extension")
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help="Records per transaction")
+        parser.add_argument('--checkpoint', help="Checkpoint file (default: <input>.checkpoint)")
+        parser.add_argument('--resume', action='store_true', help="Skip the records committed by a previous run")
+
+    def handle(self, *args, **options):
+        if 'locmem' in settings.CACHES['default']['BACKEND'].lower() or not settings.EVENTS_BACKEND.endswith('RedisBackend'):
+            self.stderr.write(self.style.WARNING(
+                "The cache or event backend is per-process: running servers will not see this import "
+                f"(stale API responses for up to API_CACHE_TIMEOUT={settings.API_CACHE_TIMEOUT}s, no change "
+                "events). Set REDIS_URL and EVENTS_BACKEND=redis for a shared cache, or restart the servers."
+            ))
+        path = options['input']
+        fmt = options['fmt'] or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+        checkpoint_path = options['checkpoint'] or f'{path}.checkpoint'
+
+        skip = 0
+        if options['resume'] and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as checkpoint:
+                state = json.load(checkpoint)
+            if state.get('model') != options['model']:
+                raise CommandError(f"{checkpoint_path} belongs to an import of '{state.get('model')}'")
+            skip = state['records']
+            self.stdout.write(f"Resuming after {skip} records")
+
+        def save_checkpoint(records):
+            with open(checkpoint_path, 'w') as checkpoint:
+                json.dump({'model': options['model'], 'records': records}, checkpoint)
+            self.stdout.write(f"Committed {records} records")
+
+        try:
+            with open(path, newline='', encoding='utf-8') as source:
+                total = import_records(
+                    options['model'], parse_lines(fmt, source),
+                    batch_size=options['batch_size'], skip=skip, on_checkpoint=save_checkpoint,
+                )
+        except TransferError as exc:
+            raise CommandError(f"{exc} (resume with --resume)")
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.stdout.write(self.style.SUCCESS(f"Imported {total - skip} records ({total} in total)"))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site_settings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='headersettings',
+            name='header_logo_variants',
+            field=models.JSONField(blank=True, editable=False, help_text='Resized copies of the logo, see the images app', null=True),
+        ),
+    ]
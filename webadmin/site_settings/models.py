@@ -1,9 +1,16 @@
+from django.core.cache import cache
 from django.db import models
 
+from mysite.cache import get_generations
+
+# Process-local memo of the active settings row: (generation, instance).
+_active_settings = None
+
 class HeaderSettings(models.Model):
     site_title = models.CharField(max_length=200, default="Your Site Title", help_text="Main site title displayed in header")
     site_subtitle = models.CharField(max_length=300, blank=True, null=True, help_text="Subtitle or tagline displayed in header")
     header_logo_url = models.URLField(max_length=500, blank=True, null=True, help_text="URL for header logo image")
+    header_logo_variants = models.JSONField(blank=True, null=True, editable=False, help_text="Resized copies of the logo, see the images app")
     header_background_color = models.CharField(max_length=7, default="#ffffff", help_text="Header background color (hex code)")
     header_text_color = models.CharField(max_length=7, default="#000000", help_text="Header text color (hex code)")
     show_header = models.BooleanField(default=True, help_text="Whether to show the header on the site")
@@ -19,7 +26,30 @@ class HeaderSettings(models.Model):
 
     @classmethod
     def get_active_settings(cls):
-        settings = cls.objects.first()  # type: ignore
-        if not settings:
-            settings = cls.objects.create()  # type: ignore
-        return settings 
\ No newline at end of file
+        """
+        The site-wide settings row, created on first use.
+
+        Memoized per process and backed by the shared cache, both keyed on the
+        ``site_settings`` cache generation that the model's signals bump on
+        save/delete, so a warm worker answers without touching the database.
+        """
+        global _active_settings
+        generation = get_generations(('site_settings',))['site_settings']
+        if _active_settings is not None and _active_settings[0] == generation:
+            return _active_settings[1]
+
+        key = f'site_settings:active:{generation}'
+        settings = cache.get(key)
+        if settings is None:
+            settings = cls.objects.order_by('pk').first()  # type: ignore
+            if not settings:
+                settings = cls.objects.create()  # type: ignore
+            cache.set(key, settings, timeout=None)
+        _active_settings = (generation, settings)
+        return settings
+
+    @classmethod
+    def clear_active_settings(cls):
+        """Drop this process's memoized settings row."""
+        global _active_settings
+        _active_settings = None 
\ No newline at end of file
@@ -1,7 +1,10 @@
 from rest_framework import serializers
+from images.serializers import ImageVariantsField
 from .models import HeaderSettings
 
 class HeaderSettingsSerializer(serializers.ModelSerializer):
+    header_logo_variants = ImageVariantsField('header_logo_url', 'header_logo_variants')
+
     class Meta:
         model = HeaderSettings
-        fields = '__all__' 
\ No newline at end of file
+        fields = '__all__'
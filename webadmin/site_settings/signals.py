@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mysite.cache import bump_generation_on_commit
+from .models import HeaderSettings
+
+
+@receiver([post_save, post_delete], sender=HeaderSettings)
+def invalidate_site_settings_cache(sender, **kwargs):
+    sender.clear_active_settings()
+    bump_generation_on_commit('site_settings')
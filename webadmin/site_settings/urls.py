@@ -1,10 +1,13 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import HeaderSettingsViewSet
+from .views import ContentExportView, ContentImportView, HeaderSettingsViewSet, SiteBootstrapView
 
 router = DefaultRouter()
 router.register(r'header-settings', HeaderSettingsViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('site/bootstrap/', SiteBootstrapView.as_view(), name='site-bootstrap'),
+    path('export/<str:model>/', ContentExportView.as_view(), name='content-export'),
+    path('import/<str:model>/', ContentImportView.as_view(), name='content-import'),
 ] 
\ No newline at end of file
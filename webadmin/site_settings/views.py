@@ -1,7 +1,133 @@
-from rest_framework import viewsets
+import io
+
+from django.http import StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from articles.models import Article
+from articles.serializers import ArticleCardSerializer
+from mysite.cache import CachedReadMixin, get_fragments
+from mysite.conditional import ConditionalGetMixin
+from mysite.transfer import TransferError, check_format, export_lines, get_transfer_model, import_records, parse_lines
+from programs.models import Programs
+from programs.serializers import OnGoingProgramsSerializer
+from teams.models import TeamMember
+from teams.serializers import TeamMemberSerializer
+from users.permissions import IsActiveStaff
 from .models import HeaderSettings
 from .serializers import HeaderSettingsSerializer
 
-class HeaderSettingsViewSet(viewsets.ModelViewSet):
+class HeaderSettingsViewSet(ConditionalGetMixin, CachedReadMixin, viewsets.ModelViewSet):
     queryset = HeaderSettings.objects.all()
     serializer_class = HeaderSettingsSerializer
+    cache_namespaces = ('site_settings',)
+
+    @action(detail=False, methods=['get'], pagination_class=None)
+    def active(self, request):
+        """The single active settings object, without pagination."""
+        settings = HeaderSettings.get_active_settings()
+        return self.conditional_response(self._active_response, request, (settings.updated_at,), settings.updated_at, settings)
+
+    def _active_response(self, request, settings):
+        return Response(self.get_serializer(settings).data)
+
+
+class SiteBootstrapView(APIView):
+    """
+    Everything the public homepage renders on first paint in one response:
+    header settings, the first page of article cards, active team members
+    and active programs. Each section is cached separately and rebuilt only
+    when its own models change.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    article_page_size = 6
+
+    def get(self, request):
+        context = {'request': request}
+
+        def header_settings():
+            return HeaderSettingsSerializer(HeaderSettings.get_active_settings(), context=context).data
+
+        def articles():
+            queryset = Article.objects.filter(published=True).defer(*Article.LIST_DEFERRED_FIELDS)  # type: ignore
+            cards = ArticleCardSerializer(queryset[:self.article_page_size], many=True, context=context).data
+            return {'count': queryset.count(), 'page_size': self.article_page_size, 'results': cards}
+
+        def team_members():
+            queryset = TeamMember.objects.filter(active=True)
+            return TeamMemberSerializer(queryset, many=True, context=context).data
+
+        def programs():
+            queryset = Programs.objects.filter(active=True).order_by('order', 'id')
+            return OnGoingProgramsSerializer(queryset, many=True, context=context).data
+
+        # Article cards embed absolute URLs, so fragments are per host.
+        sections = get_fragments({
+            'header_settings': (('site_settings',), header_settings),
+            'articles': (('articles',), articles),
+            'team_members': (('teams',), team_members),
+            'programs': (('programs',), programs),
+        }, key_prefix=f'bootstrap:{request.get_host()}:')
+        return Response(sections)
+
+
+EXPORT_CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+
+class ContentExportView(APIView):
+    """
+    Staff-only streaming export of a content model:
+    ``GET /api/export/<model>/?type=ndjson|csv``.
+    """
+    permission_classes = [IsActiveStaff]
+
+    def get(self, request, model):
+        fmt = request.query_params.get('type', 'ndjson')
+        try:
+            get_transfer_model(model)
+            check_format(fmt)
+        except TransferError as exc:
+            return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        response = StreamingHttpResponse(export_lines(model, fmt), content_type=EXPORT_CONTENT_TYPES[fmt])
+        response['Content-Disposition'] = f'attachment; filename="{model}.{fmt}"'
+        return response
+
+
+class ContentImportView(APIView):
+    """
+    Staff-only import of an uploaded export (multipart field ``file``):
+    ``POST /api/import/<model>/?type=ndjson|csv&skip=<records>``.
+
+    Records are upserted by primary key in batches. On failure the response
+    carries the ``checkpoint`` to pass back as ``skip`` to resume.
+    """
+    permission_classes = [IsActiveStaff]
+
+    def post(self, request, model):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Please upload a file'}, status=status.HTTP_400_BAD_REQUEST)
+        fmt = request.query_params.get('type') or ('csv' if upload.name.lower().endswith('.csv') else 'ndjson')
+        try:
+            skip = max(0, int(request.query_params.get('skip', 0)))
+        except ValueError:
+            return Response({'error': 'skip must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+
+        committed = skip
+        def checkpoint(records):
+            nonlocal committed
+            committed = records
+
+        try:
+            get_transfer_model(model)
+            lines = io.TextIOWrapper(upload.file, encoding='utf-8', newline='')
+            total = import_records(model, parse_lines(fmt, lines), skip=skip, on_checkpoint=checkpoint)
+        except (TransferError, UnicodeDecodeError) as exc:
+            return Response({'error': str(exc), 'checkpoint': committed}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'imported': total - skip, 'checkpoint': total})
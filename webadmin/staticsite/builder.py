@@ -0,0 +1,229 @@
+"""
+Pre-rendered public site: the homepage, the paginated article listings and
+one page per published article, written as plain HTML under
+``STATIC_SITE_ROOT`` for nginx to serve without reaching Django::
+
+    index.html                    homepage (listing page 1, team carousel)
+    page/<n>/index.html           listing page n >= 2
+    articles/<slug>/index.html    article page
+
+``build_static_site`` writes everything. Afterwards model signals queue what
+a write affects and, once the transaction commits, a background thread
+re-renders only that (see staticsite/signals.py), so the request that made
+the write does not wait for it. Changes queued while the thread is busy are
+rendered together in its next pass:
+
+* an article edit re-renders its page and the listing page it is on; an
+  article entering or leaving the listings (created, deleted, published,
+  unpublished, renamed) re-renders every listing page from its position on,
+  or all of them when the number of pages changes,
+* a team member change re-renders the homepage,
+* a header settings change re-renders everything.
+
+Files are replaced atomically, so nginx never serves a half-written page.
+Writes that send no model signals (``QuerySet.update()``, ``loaddata``
+fixtures, whose raw saves the receivers ignore), and changes still queued
+when a process exits, need a full build.
+"""
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.template.loader import render_to_string
+
+from articles.models import Article
+from site_settings.models import HeaderSettings
+from teams.models import TeamMember
+
+logger = logging.getLogger(__name__)
+
+# Same page size as the homepage's first page in /api/site/bootstrap/.
+PAGE_SIZE = 6
+ORDERING = ('-created_at', '-id')
+
+SITE = 'site'
+HOME = 'home'
+
+_pending = set()
+_pending_lock = threading.Lock()
+_wakeups = queue.Queue()
+_worker = None
+
+
+def listing_url(page):
+    return '/' if page == 1 else f'/page/{page}/'
+
+
+def page_count(article_count):
+    return max(1, -(-article_count // PAGE_SIZE))
+
+
+class SiteBuilder:
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def listing_path(self, page):
+        return self.root / 'index.html' if page == 1 else self.root / 'page' / str(page) / 'index.html'
+
+    def article_path(self, slug):
+        return self.root / 'articles' / slug / 'index.html'
+
+    def write(self, path, html):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(html)
+        # mkstemp creates the file 0600; nginx needs to read it.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+
+    def built_page_count(self):
+        pages = self.root / 'page'
+        return 1 + (sum(1 for entry in pages.iterdir() if entry.name.isdigit()) if pages.is_dir() else 0)
+
+    def published(self):
+        """``(pk, slug, created_at)`` of every listed article, in listing order."""
+        return list(Article.objects.filter(published=True).order_by(*ORDERING).values_list('pk', 'slug', 'created_at'))  # type: ignore
+
+    def render_listing(self, page, total, header_settings):
+        queryset = Article.objects.filter(published=True).order_by(*ORDERING).defer(*Article.LIST_DEFERRED_FIELDS)  # type: ignore
+        start = (page - 1) * PAGE_SIZE
+        context = {
+            'header_settings': header_settings,
+            'articles': queryset[start:start + PAGE_SIZE],
+            'page': page,
+            'pages': [(number, listing_url(number)) for number in range(1, total + 1)],
+            'team_members': TeamMember.objects.filter(active=True) if page == 1 else None,
+        }
+        self.write(self.listing_path(page), render_to_string('staticsite/listing.html', context))
+
+    def render_article(self, article, header_settings):
+        context = {'header_settings': header_settings, 'article': article}
+        self.write(self.article_path(article.slug), render_to_string('staticsite/article.html', context))
+
+    def prune(self, published, total):
+        """Remove pages of articles no longer listed and listing pages past the last."""
+        slugs = {slug for _, slug, _ in published}
+        for directory in (self.root / 'articles', self.root / 'page'):
+            if not directory.is_dir():
+                continue
+            for entry in directory.iterdir():
+                stale = entry.name not in slugs if directory.name == 'articles' else (
+                    not entry.name.isdigit() or not 2 <= int(entry.name) <= total
+                )
+                if entry.is_dir() and stale:
+                    shutil.rmtree(entry)
+
+    def build_all(self):
+        header_settings = HeaderSettings.get_active_settings()
+        published = self.published()
+        total = page_count(len(published))
+        for page in range(1, total + 1):
+            self.render_listing(page, total, header_settings)
+        for article in Article.objects.filter(published=True).iterator():  # type: ignore
+            self.render_article(article, header_settings)
+        self.prune(published, total)
+        return len(published), total
+
+    def build_changes(self, changes):
+        """Re-render what ``changes`` (queued by ``schedule``) affect."""
+        if SITE in changes:
+            self.build_all()
+            return
+        header_settings = HeaderSettings.get_active_settings()
+        published = self.published()
+        total = page_count(len(published))
+        positions = {pk: index for index, (pk, _, _) in enumerate(published)}
+        pages = {1} if HOME in changes else set()
+
+        articles = [change for change in changes if isinstance(change, tuple)]
+        changed = {pk for _, pk, _, _ in articles}
+        for article in Article.objects.filter(pk__in=[pk for pk in changed if pk in positions]):  # type: ignore
+            page = positions[article.pk] // PAGE_SIZE + 1
+            # No page yet means it just entered the listings.
+            entered = not self.article_path(article.slug).exists()
+            self.render_article(article, header_settings)
+            pages.update(range(page, total + 1) if entered else [page])
+        for _, pk, slug, created_at in articles:
+            if pk in positions or not self.article_path(slug).exists():
+                continue
+            # Left the listings: everything after it moves up.
+            before = sum(1 for _, _, listed_at in published if listed_at > created_at)
+            pages.update(range(before // PAGE_SIZE + 1, total + 1))
+
+        if articles and total != self.built_page_count():
+            # Every listing page links to every other one.
+            pages.update(range(1, total + 1))
+        for page in sorted(pages):
+            if page <= total:
+                self.render_listing(page, total, header_settings)
+        if articles:
+            self.prune(published, total)
+
+
+def get_builder():
+    root = getattr(settings, 'STATIC_SITE_ROOT', None)
+    return SiteBuilder(root) if root else None
+
+
+def schedule(change):
+    """
+    Queue ``change`` (``SITE``, ``HOME`` or ``('article', pk, slug,
+    created_at)``) and hand it to the renderer once the current transaction
+    commits. Changes queued by a transaction that rolls back go with the
+    next one.
+    """
+    with _pending_lock:
+        _pending.add(change)
+    transaction.on_commit(wake)
+
+
+def wake():
+    """
+    Render the queued changes in the background thread (started on first
+    use), or right away with ``STATIC_SITE_IN_BACKGROUND`` off.
+    """
+    if not settings.STATIC_SITE_IN_BACKGROUND:
+        flush()
+        return
+    global _worker
+    with _pending_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_work, name='staticsite', daemon=True)
+            _worker.start()
+    _wakeups.put(None)
+
+
+def wait():
+    """Block until the background thread has rendered everything handed to it."""
+    _wakeups.join()
+
+
+def _work():
+    while True:
+        _wakeups.get()
+        try:
+            flush()
+        finally:
+            # This thread's connections, opened by the render.
+            connections.close_all()
+            _wakeups.task_done()
+
+
+def flush():
+    with _pending_lock:
+        changes = set(_pending)
+        _pending.clear()
+    builder = get_builder()
+    if not changes or builder is None:
+        return
+    try:
+        builder.build_changes(changes)
+    except Exception:
+        logger.exception("Could not update the pre-rendered site")
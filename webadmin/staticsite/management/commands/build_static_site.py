@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from staticsite.builder import SiteBuilder, get_builder
+
+
+class Command(BaseCommand):
+    help = "Render the public site (homepage, article listings and article pages) into STATIC_SITE_ROOT"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help="Directory to write to instead of STATIC_SITE_ROOT")
+
+    def handle(self, *args, **options):
+        builder = SiteBuilder(options['output']) if options['output'] else get_builder()
+        if builder is None:
+            raise CommandError("Set STATIC_SITE_ROOT or pass --output")
+        articles, pages = builder.build_all()
+        self.stdout.write(f"Rendered {articles} article page(s) and {pages} listing page(s) into {builder.root}")
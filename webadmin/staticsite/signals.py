@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from articles.models import Article
+from site_settings.models import HeaderSettings
+from teams.models import TeamMember
+from .builder import HOME, SITE, get_builder, schedule
+
+
+@receiver([post_save, post_delete], sender=Article)
+def rebuild_article(sender, instance, raw=False, **kwargs):
+    if get_builder() and not raw:
+        schedule(('article', instance.pk, instance.slug, instance.created_at))
+
+
+@receiver([post_save, post_delete], sender=TeamMember)
+def rebuild_home(sender, raw=False, **kwargs):
+    if get_builder() and not raw:
+        schedule(HOME)
+
+
+@receiver([post_save, post_delete], sender=HeaderSettings)
+def rebuild_site(sender, raw=False, **kwargs):
+    if get_builder() and not raw:
+        schedule(SITE)
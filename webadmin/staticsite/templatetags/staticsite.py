@@ -0,0 +1,15 @@
+from django import template
+
+from images.linking import is_current
+from images.pipeline import variant_urls
+
+register = template.Library()
+
+
+@register.inclusion_tag('staticsite/picture.html')
+def picture(url, variants, size, fallback, alt, css_class='img-fluid'):
+    """The ``size`` variant of the image at ``url`` (WebP with a JPEG fallback), or the original."""
+    variant = None
+    if is_current(variants, url):
+        variant = variant_urls({size: variants[size]})[size]
+    return {'variant': variant, 'src': url or fallback, 'alt': alt, 'css_class': css_class}
@@ -0,0 +1,117 @@
+import shutil
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from articles.models import Article
+from site_settings.models import HeaderSettings
+from teams.models import TeamMember
+from .builder import SiteBuilder, wait
+
+
+class StaticSiteTests(TestCase):
+    def setUp(self):
+        # Newest first: articles[0] is on page 1, articles[7] on page 2.
+        self.articles = [
+            Article.objects.create(title=f'Post {i}', content=f'<p>Body {i}</p>', published=True)
+            for i in range(8)
+        ][::-1]
+        HeaderSettings.get_active_settings()
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        site = override_settings(STATIC_SITE_ROOT=str(self.root), STATIC_SITE_IN_BACKGROUND=False)
+        site.enable()
+        self.addCleanup(site.disable)
+        call_command('build_static_site', stdout=StringIO())
+
+    def read(self, path):
+        return (self.root / path).read_text()
+
+    def rendered_listings(self, write):
+        """Listing pages re-rendered by ``write()``, once its transaction commits."""
+        with mock.patch.object(SiteBuilder, 'render_listing', autospec=True, side_effect=SiteBuilder.render_listing) as render:
+            with self.captureOnCommitCallbacks(execute=True):
+                write()
+        return sorted(call.args[1] for call in render.call_args_list)
+
+    def test_full_build(self):
+        home = self.read('index.html')
+        self.assertIn('Post 7', home)
+        self.assertNotIn('Post 1<', home)
+        self.assertIn('<a href="/page/2/">2</a>', home)
+        self.assertIn('Post 1', self.read('page/2/index.html'))
+        self.assertIn('<p>Body 3</p>', self.read('articles/post-3/index.html'))
+
+    def test_edit_rebuilds_only_its_own_pages(self):
+        article = self.articles[7]
+        article.title = 'Renamed'
+        self.assertEqual(self.rendered_listings(article.save), [2])
+        self.assertIn('Renamed', self.read('page/2/index.html'))
+        self.assertIn('Renamed', self.read(f'articles/{article.slug}/index.html'))
+
+    def test_entering_and_leaving_the_listings(self):
+        def publish_new():
+            Article.objects.create(title='Fresh', content='<p>New</p>', published=True)
+
+        self.assertEqual(self.rendered_listings(publish_new), [1, 2])
+        self.assertIn('Fresh', self.read('index.html'))
+        self.assertTrue((self.root / 'articles/fresh/index.html').exists())
+
+        def unpublish():
+            for article in self.articles[:3]:
+                article.published = False
+                article.save()
+
+        self.assertEqual(self.rendered_listings(unpublish), [1])
+        self.assertFalse((self.root / 'page/2').exists())
+        self.assertFalse((self.root / f'articles/{self.articles[0].slug}').exists())
+        self.assertNotIn('<a href="/page/2/">', self.read('index.html'))
+
+    def test_team_and_header_changes(self):
+        def add_member():
+            TeamMember.objects.create(name='Ann', role='Coach')
+
+        self.assertEqual(self.rendered_listings(add_member), [1])
+        self.assertIn('Ann', self.read('index.html'))
+
+        def rename_site():
+            settings = HeaderSettings.get_active_settings()
+            settings.site_title = 'Off The Bench'
+            settings.save()
+
+        self.assertEqual(self.rendered_listings(rename_site), [1, 2])
+        self.assertIn('Off The Bench', self.read('articles/post-0/index.html'))
+
+    @override_settings(STATIC_SITE_ROOT=None)
+    def test_disabled_without_a_root(self):
+        self.assertEqual(self.rendered_listings(lambda: TeamMember.objects.create(name='Bo', role='Coach')), [])
+
+
+class BackgroundRenderTests(TransactionTestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root)
+        site = override_settings(STATIC_SITE_ROOT=str(self.root), STATIC_SITE_IN_BACKGROUND=True)
+        site.enable()
+        self.addCleanup(site.disable)
+        call_command('build_static_site', stdout=StringIO())
+
+    def test_renders_outside_the_writing_thread(self):
+        threads = []
+        original = SiteBuilder.render_listing
+
+        def render_listing(builder, *args):
+            threads.append(threading.current_thread())
+            return original(builder, *args)
+
+        with mock.patch.object(SiteBuilder, 'render_listing', autospec=True, side_effect=render_listing):
+            Article.objects.create(title='Fresh', content='<p>New</p>', published=True)
+            wait()
+        self.assertTrue(threads)
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertIn('Fresh', (self.root / 'index.html').read_text())
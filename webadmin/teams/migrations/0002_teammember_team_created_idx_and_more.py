@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-10-18 13:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['created_at', 'id'], name='team_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['active', 'created_at', 'id'], name='team_active_created_idx'),
+        ),
+    ]
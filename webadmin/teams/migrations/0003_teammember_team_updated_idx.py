@@ -0,0 +1,17 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0002_teammember_team_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teammember',
+            index=models.Index(fields=['updated_at', 'id'], name='team_updated_idx'),
+        ),
+    ]
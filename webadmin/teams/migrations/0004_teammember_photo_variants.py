@@ -0,0 +1,18 @@
+# Generated by Django 4.2.23 on 2026-10-18 14:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teams', '0003_teammember_team_updated_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='teammember',
+            name='photo_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
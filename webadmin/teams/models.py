@@ -6,6 +6,7 @@ class TeamMember(models.Model):
     name = models.CharField(max_length=100)
     role = models.CharField(max_length=100)
     photo = models.CharField(max_length=500, blank=True, null=True)  # Store URL from ImgBB
+    photo_variants = models.JSONField(blank=True, null=True, editable=False)  # Resized copies, see the images app
     email = models.EmailField(blank=True, null=True)
     phone = models.CharField(max_length=20, blank=True, null=True)
     facebook = models.URLField(blank=True, null=True)
@@ -21,3 +22,8 @@ class TeamMember(models.Model):
     
     class Meta:
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='team_created_idx'),
+            models.Index(fields=['active', 'created_at', 'id'], name='team_active_created_idx'),
+            models.Index(fields=['updated_at', 'id'], name='team_updated_idx'),
+        ]
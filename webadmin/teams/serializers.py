@@ -1,11 +1,15 @@
 from rest_framework import serializers
+from images.serializers import ImageVariantsField
+from mysite.rows import RowReader
 from .models import TeamMember
 
 
 class TeamMemberSerializer(serializers.ModelSerializer):
+    photo_variants = ImageVariantsField('photo', 'photo_variants')
+
     class Meta:
         model = TeamMember
         fields = '__all__'
 
 
-
+TEAM_MEMBER_ROWS = RowReader(TeamMemberSerializer)
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mysite.cache import bump_generation_on_commit
+from .models import TeamMember
+
+
+@receiver([post_save, post_delete], sender=TeamMember)
+def invalidate_teams_cache(sender, **kwargs):
+    bump_generation_on_commit('teams')
@@ -1,3 +1,31 @@
 from django.test import TestCase
 
-# Create your tests here.
+from mysite.testing import QueryPlanAssertionsMixin, RowParityAssertionsMixin, list_queryset
+from .models import TeamMember
+from .views import TeamMemberViewSet
+
+
+class TeamMemberQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+    def test_team_member_list_uses_index(self):
+        self.assertIndexedPlan(list_queryset(TeamMemberViewSet)[:10])
+
+    def test_active_team_member_list_uses_index(self):
+        self.assertIndexedPlan(list_queryset(TeamMemberViewSet).filter(active=True)[:10])
+
+
+class TeamMemberRowParityTests(RowParityAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        variant = {'width': 320, 'height': 320, 'webp': 'images/cd/cde/thumbnail.webp', 'jpeg': 'images/cd/cde/thumbnail.jpg'}
+        for index in range(5):
+            member = TeamMember.objects.create(
+                name=f'Zoë {index}', role='Coach', order=index, active=bool(index % 2),
+                photo=f'https://i.ibb.co/{index}/face.png' if index % 2 else None,
+                email='coach@example.org' if index % 3 else None, linkedin='https://linkedin.com/in/coach',
+            )
+            if member.photo:
+                TeamMember.objects.filter(pk=member.pk).update(photo_variants={'source': member.photo, 'thumbnail': variant})
+
+    def test_list_matches_serializer(self):
+        self.assertRowParity('/api/team-members/')
+        self.assertRowParity('/api/team-members/', {'cursor': '', 'page_size': 2})
@@ -1,11 +1,21 @@
 from .models import TeamMember
 from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
-from .serializers import TeamMemberSerializer
+from .serializers import TEAM_MEMBER_ROWS, TeamMemberSerializer
+from mysite.bulk import BulkModelMixin
+from mysite.cache import CachedReadMixin
+from mysite.conditional import ConditionalGetMixin
+from mysite.pagination import KeysetPagination
+from mysite.rows import RowListMixin
 
 
 # Create your views here.
-class TeamMemberViewSet(viewsets.ModelViewSet):
+class TeamMemberViewSet(BulkModelMixin, ConditionalGetMixin, CachedReadMixin, RowListMixin, viewsets.ModelViewSet):
     queryset = TeamMember.objects.all()
     serializer_class = TeamMemberSerializer
-    permission_classes = [AllowAny]  # Temporarily allow all access for testing
\ No newline at end of file
+    # list() is built from values() rows, see mysite/rows.py.
+    row_reader = TEAM_MEMBER_ROWS
+    permission_classes = [AllowAny]  # Temporarily allow all access for testing
+    pagination_class = KeysetPagination
+    cursor_ordering = ('created_at', 'id')
+    cache_namespaces = ('teams',)
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+JWT authentication that trusts the claims signed into the token.
+
+Tokens issued by ``issue_tokens`` (login and register) carry the user's
+``username``, ``is_staff``, ``is_superuser`` and ``role`` name. With
+``JWT_STATELESS_AUTH`` on, ``ClaimsJWTAuthentication`` turns such a token
+into a ``TokenUser`` without touching the database, so permission checks
+cost no queries. The trade-off: deactivating a user or changing their staff
+flag or role only takes effect once their current access token expires
+(refreshing re-issues the claims from the account, see users/revocation.py),
+except on staff-only routes, which re-check the account (``IsActiveStaff``
+in users/permissions.py).
+
+Tokens without the claims (issued before this, or with the mode off) are
+resolved against the database as usual, optionally through a per-process
+cache that keeps each ``User`` for ``JWT_USER_CACHE_TTL`` seconds.
+"""
+import time
+
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import RevocableRefreshToken
+
+CLAIMS_MARKER = 'is_staff'
+USER_CACHE_MAX_ENTRIES = 1000
+
+_user_cache = {}
+
+
+def issue_tokens(user, profile=None):
+    """Refresh token (and, through it, access token) with the user's claims."""
+    refresh = RevocableRefreshToken.for_user(user)
+    refresh['username'] = user.get_username()
+    refresh['is_staff'] = user.is_staff
+    refresh['is_superuser'] = user.is_superuser
+    refresh['role'] = profile.role.name if profile and profile.role else None
+    return refresh
+
+
+def forget_user(user_id):
+    _user_cache.pop(user_id, None)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if settings.JWT_STATELESS_AUTH and CLAIMS_MARKER in validated_token:
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        ttl = settings.JWT_USER_CACHE_TTL
+        if not ttl:
+            return super().get_user(validated_token)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        now = time.monotonic()
+        cached = _user_cache.get(user_id)
+        if cached and cached[0] > now:
+            return cached[1]
+        user = super().get_user(validated_token)
+        if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+            _user_cache.clear()
+        _user_cache[user_id] = (now + ttl, user)
+        return user
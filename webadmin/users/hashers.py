@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+def _option(name, default):
+    return getattr(settings, 'PASSWORD_HASHER_OPTIONS', {}).get(name, default)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with ``PASSWORD_HASHER_OPTIONS['iterations']``."""
+
+    @property
+    def iterations(self):
+        return _option('iterations', PBKDF2PasswordHasher.iterations)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with the time/memory/parallelism from ``PASSWORD_HASHER_OPTIONS``."""
+
+    @property
+    def time_cost(self):
+        return _option('time_cost', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _option('memory_cost', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _option('parallelism', Argon2PasswordHasher.parallelism)
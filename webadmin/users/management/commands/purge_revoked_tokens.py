@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from users.revocation import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete revoked refresh tokens that have expired (run periodically, e.g. daily from cron)"
+
+    def handle(self, *args, **options):
+        deleted = purge_expired()
+        self.stdout.write(f"Purged {deleted} expired revoked token(s)")
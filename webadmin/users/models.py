@@ -16,3 +16,14 @@ class UserProfile(models.Model):
 
     def __str__(self):
         return f"{self.user.username} ({self.role.name if self.role else 'No Role'})"  # type: ignore
+
+class RevokedToken(models.Model):
+    """
+    Durable copy of the refresh-token revocation set (see users/revocation.py).
+    Rows are only needed until the token would have expired anyway.
+    """
+    jti = models.CharField(max_length=255, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.jti
@@ -0,0 +1,21 @@
+from django.contrib.auth import get_user_model
+from rest_framework.permissions import IsAdminUser
+from rest_framework_simplejwt.models import TokenUser
+
+
+class IsActiveStaff(IsAdminUser):
+    """
+    ``IsAdminUser`` that does not take a stateless token's word for it: for a
+    ``TokenUser`` (see users/authentication.py) the account is checked to
+    still be active and staff, so deactivating or de-staffing a user closes
+    the staff routes at once rather than when their access token expires.
+    Costs one primary-key query, on these routes only.
+    """
+
+    def has_permission(self, request, view):
+        if not super().has_permission(request, view):
+            return False
+        user = request.user
+        if isinstance(user, TokenUser):
+            return get_user_model()._default_manager.filter(pk=user.pk, is_active=True, is_staff=True).exists()
+        return user.is_active
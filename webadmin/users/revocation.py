@@ -0,0 +1,96 @@
+"""
+Refresh-token revocation.
+
+A revoked token's ``jti`` is stored in the cache under its own key, expiring
+when the token itself would, so a check is a single cache lookup. With
+``JWT_REVOCATION_DB`` on, the jti is also written to ``RevokedToken``, which
+survives cache restarts and is shared by workers that do not share a cache
+(LocMemCache); a cache miss then falls back to a primary-key lookup there.
+``purge_revoked_tokens`` deletes rows whose tokens have expired.
+
+Tokens are revoked on logout and, with ``BLACKLIST_AFTER_ROTATION``, when
+they are exchanged at ``/api/auth/refresh/``. The exchange issues the new
+tokens from the account as it is now (``issue_tokens``), not by copying the
+old token's claims, so a changed staff flag, role or username is picked up
+at the next refresh.
+"""
+import math
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from .models import RevokedToken
+
+
+def _key(jti):
+    return f'jwt:revoked:{jti}'
+
+
+def revoke(jti, expires_at):
+    ttl = (expires_at - timezone.now()).total_seconds()
+    if ttl <= 0:
+        return
+    cache.set(_key(jti), True, timeout=math.ceil(ttl))
+    if settings.JWT_REVOCATION_DB:
+        RevokedToken.objects.bulk_create([RevokedToken(jti=jti, expires_at=expires_at)], ignore_conflicts=True)  # type: ignore
+
+
+def is_revoked(jti):
+    if cache.get(_key(jti)):
+        return True
+    if not settings.JWT_REVOCATION_DB:
+        return False
+    expires_at = RevokedToken.objects.filter(jti=jti).values_list('expires_at', flat=True).first()  # type: ignore
+    if expires_at is None or expires_at <= timezone.now():
+        return False
+    cache.set(_key(jti), True, timeout=math.ceil((expires_at - timezone.now()).total_seconds()))
+    return True
+
+
+def purge_expired():
+    """Delete revocation rows whose tokens have expired. Returns the count."""
+    deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()  # type: ignore
+    return deleted
+
+
+class RevocableRefreshToken(RefreshToken):
+    def verify(self, *args, **kwargs):
+        if is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+        super().verify(*args, **kwargs)
+
+    def blacklist(self):
+        revoke(self.payload[api_settings.JTI_CLAIM], datetime_from_epoch(self.payload['exp']))
+
+    def outstand(self):
+        # Issued tokens are not recorded; only revoked ones are.
+        return None
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RevocableRefreshToken
+
+    def validate(self, attrs):
+        from .authentication import issue_tokens  # authentication imports this module
+
+        refresh = self.token_class(attrs['refresh'])
+        user = get_user_model()._default_manager.select_related('profile__role').filter(**{
+            api_settings.USER_ID_FIELD: refresh.payload.get(api_settings.USER_ID_CLAIM),
+        }).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+
+        tokens = issue_tokens(user, getattr(user, 'profile', None))
+        if not api_settings.ROTATE_REFRESH_TOKENS:
+            return {'access': str(tokens.access_token)}
+        if api_settings.BLACKLIST_AFTER_ROTATION:
+            refresh.blacklist()
+        return {'access': str(tokens.access_token), 'refresh': str(tokens)}
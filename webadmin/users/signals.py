@@ -0,0 +1,15 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mysite.cache import bump_generation_on_commit
+from .authentication import forget_user
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_users_cache(sender, instance, update_fields=None, **kwargs):
+    forget_user(instance.pk)
+    # Logins only touch last_login, which no cached response exposes.
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    bump_generation_on_commit('users')
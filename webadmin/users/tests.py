@@ -1,3 +1,162 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from mysite.testing import QueryCountAssertionsMixin
+from .authentication import forget_user, issue_tokens
+from .models import RevokedToken, Role, UserProfile
+
+
+class UserQueryCountTests(QueryCountAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        role = Role.objects.create(name='Editor')
+        for index in range(20):
+            user = User.objects.create(username=f'user{index}')
+            UserProfile.objects.create(user=user, role=role)
+
+    def test_user_list_query_count(self):
+        # Pagination count, page rows joined with profile and role.
+        self.assertListQueryCount('/api/users/', 2)
+
+    def test_profile_list_query_count(self):
+        self.assertListQueryCount('/api/profiles/', 2)
+
+
+@override_settings(PASSWORD_HASHER_OPTIONS={'iterations': 1000})
+class LoginTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.role = Role.objects.create(name='Editor')
+        cls.user = User.objects.create_user(username='editor', password='s3cret-pass')
+        UserProfile.objects.create(user=cls.user, role=cls.role)
+
+    def login(self, password='s3cret-pass'):
+        return self.client.post('/api/auth/login/', {'username': 'editor', 'password': password}, content_type='application/json')
+
+    def test_login_loads_user_profile_and_role_in_one_query(self):
+        # User + profile + role; login writes nothing.
+        with self.assertNumQueries(1):
+            response = self.login()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['user']['profile']['role']['name'], 'Editor')
+
+    def test_wrong_password(self):
+        self.assertEqual(self.login('wrong').status_code, 401)
+
+    def test_login_upgrades_outdated_hash(self):
+        self.user.password = make_password('s3cret-pass', hasher='pbkdf2_sha1')
+        self.user.save(update_fields=['password'])
+
+        self.assertEqual(self.login().status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertEqual(self.login().status_code, 200)
+
+
+@override_settings(JWT_STATELESS_AUTH=True, JWT_USER_CACHE_TTL=0)
+class ClaimsAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        role = Role.objects.create(name='Admin')
+        cls.user = User.objects.create_user(username='admin', is_staff=True)
+        UserProfile.objects.create(user=cls.user, role=role)
+
+    def setUp(self):
+        forget_user(self.user.pk)
+
+    def authorization(self, refresh):
+        return {'HTTP_AUTHORIZATION': f'Bearer {refresh.access_token}'}
+
+    def test_token_carries_claims(self):
+        access = issue_tokens(self.user, self.user.profile).access_token
+        self.assertEqual((access['username'], access['is_staff'], access['role']), ('admin', True, 'Admin'))
+
+    def test_admin_request_needs_one_account_check(self):
+        headers = self.authorization(issue_tokens(self.user, self.user.profile))
+        # The staff route's account check, then the export's own chunk query.
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/export/roles/', **headers)
+            b''.join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+
+    def test_deactivated_staff_lose_staff_routes_before_token_expiry(self):
+        headers = self.authorization(issue_tokens(self.user, self.user.profile))
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get('/api/export/roles/', **headers).status_code, 403)
+
+    def test_tokens_without_claims_load_the_user(self):
+        headers = self.authorization(RefreshToken.for_user(self.user))
+        with self.assertNumQueries(2):
+            self.client.get('/api/auth/user/', **headers)
+
+        with override_settings(JWT_USER_CACHE_TTL=30):
+            with self.assertNumQueries(2):
+                self.client.get('/api/auth/user/', **headers)
+            with self.assertNumQueries(1):
+                response = self.client.get('/api/auth/user/', **headers)
+        self.assertEqual(response.json()['user']['profile']['role']['name'], 'Admin')
+
+    def test_stateless_mode_off(self):
+        headers = self.authorization(issue_tokens(self.user, self.user.profile))
+        with override_settings(JWT_STATELESS_AUTH=False):
+            with self.assertNumQueries(2):
+                self.client.get('/api/auth/user/', **headers)
+
+
+@override_settings(JWT_REVOCATION_DB=True)
+class RevocationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='editor')
+
+    def setUp(self):
+        cache.clear()
+        self.refresh = issue_tokens(self.user)
+
+    def refresh_with(self, token):
+        return self.client.post('/api/auth/refresh/', {'refresh': str(token)}, content_type='application/json')
+
+    def test_rotation_revokes_the_used_token(self):
+        response = self.refresh_with(self.refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('refresh', response.json())
+        self.assertEqual(self.refresh_with(self.refresh).status_code, 401)
+
+    def test_refresh_reissues_claims_from_the_account(self):
+        staff = User.objects.create_user(username='chief', is_staff=True, is_superuser=True)
+        refresh = issue_tokens(staff)
+        User.objects.filter(pk=staff.pk).update(username='former-chief', is_staff=False, is_superuser=False)
+        UserProfile.objects.create(user=staff, role=Role.objects.create(name='Writer'))
+
+        body = self.refresh_with(refresh).json()
+        expected = {'username': 'former-chief', 'is_staff': False, 'is_superuser': False, 'role': 'Writer'}
+        for token in (AccessToken(body['access']), RefreshToken(body['refresh'])):
+            self.assertEqual({claim: token[claim] for claim in expected}, expected)
+
+        User.objects.filter(pk=staff.pk).update(is_active=False)
+        self.assertEqual(self.refresh_with(body['refresh']).status_code, 401)
+
+    def test_logout_revokes_refresh_token(self):
+        response = self.client.post(
+            '/api/auth/logout/', {'refresh': str(self.refresh)}, content_type='application/json',
+            HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}',
+        )
+        self.assertEqual(response.status_code, 200)
+        # Still revoked once the cache is gone, from the table.
+        cache.clear()
+        self.assertEqual(self.refresh_with(self.refresh).status_code, 401)
+
+    def test_purge_removes_expired_rows(self):
+        now = timezone.now()
+        RevokedToken.objects.create(jti='old', expires_at=now - timedelta(minutes=1))
+        RevokedToken.objects.create(jti='live', expires_at=now + timedelta(days=1))
+        call_command('purge_revoked_tokens', stdout=StringIO())
+        self.assertEqual(list(RevokedToken.objects.values_list('jti', flat=True)), ['live'])
@@ -3,26 +3,49 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
+from .authentication import issue_tokens
 from .models import Role, UserProfile
+from .revocation import RevocableRefreshToken
 from .serializers import RoleSerializer, UserProfileSerializer, UserSerializer
 
 # Create your views here.
 
+def user_payload(user, profile):
+    """The ``user`` object returned by the auth endpoints."""
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+        'profile': UserProfileSerializer(profile).data if profile else None
+    }
+
+def cached_profile(user):
+    """``user.profile`` if it was loaded with ``select_related``, else None."""
+    try:
+        return user.profile
+    except UserProfile.DoesNotExist:
+        return None
+
 class RoleViewSet(viewsets.ModelViewSet):
     queryset = Role.objects.all()  # type: ignore
     serializer_class = RoleSerializer
     permission_classes = [AllowAny]  # Temporarily allow all access for testing
 
 class UserProfileViewSet(viewsets.ModelViewSet):
-    queryset = UserProfile.objects.all()  # type: ignore
+    queryset = UserProfile.objects.select_related('role').order_by('id')  # type: ignore
     serializer_class = UserProfileSerializer
     permission_classes = [AllowAny]  # Temporarily allow all access for testing
 
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+    queryset = User.objects.select_related('profile__role').order_by('id')
     serializer_class = UserSerializer
     permission_classes = [AllowAny]  # Temporarily allow all access for testing
 
@@ -83,38 +106,16 @@ def register_view(request):
         )
         
         # Create user profile with role if provided
-        if role_id:
-            try:
-                role = Role.objects.get(id=role_id)
-                UserProfile.objects.create(user=user, role=role)
-            except Role.DoesNotExist:
-                UserProfile.objects.create(user=user)
-        else:
-            UserProfile.objects.create(user=user)
+        role = Role.objects.filter(id=role_id).first() if role_id else None
+        profile = UserProfile.objects.create(user=user, role=role)
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
-        
-        # Get user profile
-        try:
-            profile = UserProfile.objects.get(user=user)
-            profile_data = UserProfileSerializer(profile).data
-        except UserProfile.DoesNotExist:
-            profile_data = None
+        refresh = issue_tokens(user, profile)
         
         return Response({
             'token': str(refresh.access_token),
             'refresh': str(refresh),
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser,
-                'profile': profile_data
-            },
+            'user': user_payload(user, profile),
             'message': 'User registered successfully'
         }, status=status.HTTP_201_CREATED)
         
@@ -140,28 +141,14 @@ def login_view(request):
     user = authenticate(username=username, password=password)
     
     if user is not None:
-        refresh = RefreshToken.for_user(user)
-        
-        # Get user profile if exists
-        try:
-            profile = UserProfile.objects.get(user=user)
-            profile_data = UserProfileSerializer(profile).data
-        except UserProfile.DoesNotExist:
-            profile_data = None
+        # The auth backend loaded the profile and role with the user
+        profile = cached_profile(user)
+        refresh = issue_tokens(user, profile)
         
         return Response({
             'token': str(refresh.access_token),
             'refresh': str(refresh),
-            'user': {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'first_name': user.first_name,
-                'last_name': user.last_name,
-                'is_staff': user.is_staff,
-                'is_superuser': user.is_superuser,
-                'profile': profile_data
-            }
+            'user': user_payload(user, profile)
         })
     else:
         return Response({
@@ -172,8 +159,22 @@ def login_view(request):
 @permission_classes([IsAuthenticated])
 def logout_view(request):
     """
-    Logout endpoint (optional - JWT tokens are stateless)
+    Logout endpoint that revokes the given refresh token
     """
+    raw_refresh = request.data.get('refresh')
+    if raw_refresh:
+        try:
+            refresh = RevocableRefreshToken(raw_refresh)
+        except TokenError:
+            return Response({
+                'error': 'Invalid refresh token'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if str(refresh.get(jwt_settings.USER_ID_CLAIM)) != str(request.user.id):
+            return Response({
+                'error': 'Refresh token belongs to another user'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        refresh.blacklist()
+    
     return Response({
         'message': 'Successfully logged out'
     })
@@ -184,23 +185,15 @@ def user_info_view(request):
     """
     Get current user information
     """
-    user = request.user
-    
-    try:
-        profile = UserProfile.objects.get(user=user)
-        profile_data = UserProfileSerializer(profile).data
-    except UserProfile.DoesNotExist:
-        profile_data = None
+    # request.user may be a TokenUser built from the token's claims, so load
+    # the full record (with profile and role) here.
+    user = User.objects.select_related('profile__role').filter(pk=request.user.id).first()
+    if user is None:
+        return Response({
+            'error': 'User not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    profile = cached_profile(user)
     
     return Response({
-        'user': {
-            'id': user.id,
-            'username': user.username,
-            'email': user.email,
-            'first_name': user.first_name,
-            'last_name': user.last_name,
-            'is_staff': user.is_staff,
-            'is_superuser': user.is_superuser,
-            'profile': profile_data
-        }
+        'user': user_payload(user, profile)
     })